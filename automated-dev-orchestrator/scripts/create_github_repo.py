@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 """
 Create GitHub repository using GitHub API
-This script creates a repository in the specified organization.
+This script creates a repository in the specified organization, or reuses
+it if a repository of that name already exists (see github_client.py).
+With --upload it also makes the initial commit through the Git Data API,
+with no local clone or `git push`.
 """
 
 import os
 import sys
 import json
-import requests
-from typing import Optional, Dict, Any
+import argparse
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from github_client import get_client
 
 def create_repository(
     repo_name: str,
@@ -28,7 +34,7 @@ def create_repository(
         token: GitHub Personal Access Token (uses GH_PAT env var if not provided)
     
     Returns:
-        Dict containing the API response or error information
+        Dict containing the repository ("created" is False if it already existed) or error information
     """
     
     # Get token from environment if not provided
@@ -41,79 +47,84 @@ def create_repository(
             "message": "Please set GH_PAT or GH_TOKEN environment variable"
         }
     
-    # GitHub API endpoint for creating org repos
-    url = f"https://api.github.com/orgs/{org_name}/repos"
+    # Pooled client: retries, rate-limit waits, and an existing repo counts as success
+    return get_client(token).create_repository(repo_name, org_name, description, private)
+
+def collect_files(paths: List[str]) -> Dict[str, bytes]:
+    """
+    Read files to commit, keyed by repository path.
     
-    # Request headers
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
-        "Content-Type": "application/json"
-    }
+    A directory contributes its files relative to itself (like `cp -r dir/*`),
+    a file is placed at the repository root. Later paths win on collisions.
+    """
+    files = {}
+    for path in map(Path, paths):
+        if path.is_dir():
+            for item in sorted(path.rglob("*")):
+                if item.is_file() and ".git" not in item.relative_to(path).parts:
+                    files[item.relative_to(path).as_posix()] = item.read_bytes()
+        elif path.is_file():
+            files[path.name] = path.read_bytes()
+    return files
+
+def push_initial_content(
+    repo_name: str,
+    files: Dict[str, bytes],
+    org_name: str = "Human-Frontier-Labs-Inc",
+    message: str = "Initial commit with progress tracker",
+    branch: str = "main",
+    author: Optional[Dict[str, str]] = None,
+    token: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Commit files to a repository through the Git Data API.
     
-    # Request payload
-    data = {
-        "name": repo_name,
-        "description": description,
-        "private": private,
-        "auto_init": False,  # Don't initialize with README
-        "has_issues": True,
-        "has_projects": True,
-        "has_wiki": False
-    }
+    Args:
+        repo_name: Name of the repository (may be empty, as created above)
+        files: Repository path -> file content
+        org_name: GitHub organization name
+        message: Commit message
+        branch: Branch to commit to
+        author: Optional {"name": ..., "email": ...} for the commit
+        token: GitHub Personal Access Token (uses GH_PAT env var if not provided)
     
-    try:
-        # Make the API request
-        response = requests.post(url, headers=headers, json=data)
-        
-        # Check if successful
-        if response.status_code == 201:
-            repo_data = response.json()
-            return {
-                "success": True,
-                "repo_name": repo_data["name"],
-                "full_name": repo_data["full_name"],
-                "html_url": repo_data["html_url"],
-                "ssh_url": repo_data["ssh_url"],
-                "clone_url": repo_data["clone_url"],
-                "created_at": repo_data["created_at"]
-            }
-        else:
-            # Handle errors
-            error_data = response.json() if response.text else {}
-            return {
-                "error": f"API request failed with status {response.status_code}",
-                "message": error_data.get("message", "Unknown error"),
-                "status_code": response.status_code,
-                "response": error_data
-            }
-            
-    except requests.exceptions.RequestException as e:
-        return {
-            "error": "Request failed",
-            "message": str(e)
-        }
-    except Exception as e:
+    Returns:
+        Dict with commit_sha and upload counts, or error information
+    """
+    
+    if not token:
+        token = os.environ.get('GH_PAT') or os.environ.get('GH_TOKEN')
+    
+    if not token:
         return {
-            "error": "Unexpected error",
-            "message": str(e)
+            "error": "No GitHub token found",
+            "message": "Please set GH_PAT or GH_TOKEN environment variable"
         }
+    
+    return get_client(token).create_initial_commit(org_name, repo_name, files, message, branch, author)
 
 def main():
     """Command-line interface for creating GitHub repos."""
     
     # Check command line arguments
     if len(sys.argv) < 2:
-        print("Usage: python3 create_github_repo.py <repo-name> [org-name] [description]")
+        print("Usage: python3 create_github_repo.py <repo-name> [org-name] [description] [--upload PATH ...]")
         print("\nExample:")
         print("  python3 create_github_repo.py my-project-2024")
         print("  python3 create_github_repo.py my-project Human-Frontier-Labs-Inc 'My awesome project'")
+        print("  python3 create_github_repo.py my-project --upload docs PROGRESS_TRACKER.md")
         sys.exit(1)
     
     # Parse arguments
-    repo_name = sys.argv[1]
-    org_name = sys.argv[2] if len(sys.argv) > 2 else "Human-Frontier-Labs-Inc"
-    description = sys.argv[3] if len(sys.argv) > 3 else "Auto-generated from ideabrow-automation"
+    parser = argparse.ArgumentParser(description='Create a GitHub repository')
+    parser.add_argument('repo_name')
+    parser.add_argument('org_name', nargs='?', default="Human-Frontier-Labs-Inc")
+    parser.add_argument('description', nargs='?', default="Auto-generated from ideabrow-automation")
+    parser.add_argument('--upload', nargs='+', metavar='PATH',
+                        help='Files or directories to commit to main through the Git Data API')
+    parser.add_argument('--message', default="Initial commit with progress tracker", help='Commit message')
+    args = parser.parse_args()
+    repo_name, org_name, description = args.repo_name, args.org_name, args.description
     
     # Create the repository
     print(f"Creating repository: {org_name}/{repo_name}")
@@ -121,10 +132,26 @@ def main():
     
     # Handle result
     if result.get("success"):
-        print(f"✅ Repository created successfully!")
+        if result.get("created"):
+            print(f"✅ Repository created successfully!")
+        else:
+            print(f"✅ Repository already exists, reusing it")
         print(f"   URL: {result['html_url']}")
         print(f"   SSH: {result['ssh_url']}")
         print(f"   Clone: {result['clone_url']}")
+        
+        if args.upload:
+            files = collect_files(args.upload)
+            print(f"Committing {len(files)} file(s) to {org_name}/{repo_name}...")
+            commit = push_initial_content(repo_name, files, org_name, args.message)
+            if not commit.get("success"):
+                print(f"❌ Initial commit failed: {commit.get('message', 'Unknown error')}")
+                print(f"JSON_ERROR:{json.dumps(commit)}")
+                sys.exit(1)
+            print(f"✅ {'Committed' if commit['created'] else 'Already up to date'}: {commit['commit_sha'][:12]} "
+                  f"({commit['inline_files']} inline, {commit['blobs_uploaded']} blob(s))")
+            result["initial_commit"] = commit
+        
         # Output JSON for workflow to parse
         print(f"JSON_OUTPUT:{json.dumps(result)}")
         sys.exit(0)
@@ -136,7 +163,7 @@ def main():
         elif result.get('status_code') == 403:
             print("   Note: Permission denied. Ensure your token has 'repo' and 'write:org' scopes.")
         elif result.get('status_code') == 422:
-            print("   Note: Repository may already exist or name is invalid.")
+            print("   Note: Repository name is invalid.")
         # Output error JSON
         print(f"JSON_ERROR:{json.dumps(result)}")
         sys.exit(1)
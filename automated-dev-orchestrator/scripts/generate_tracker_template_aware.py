@@ -5,34 +5,302 @@ This version emphasizes analyzing and extending templates rather than building f
 """
 
 import os
+import re
 import sys
+import time
+import random
+import asyncio
+import json
 import argparse
+import email.utils
 from pathlib import Path
-from openai import OpenAI
-from typing import List
+import openai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from llm_cache import LLMCache, cache_key, create_llm_cache
+
+# Recent openai releases are built on the httpx2 fork; older ones on httpx
+try:
+    import httpx2 as httpx
+except ImportError:
+    import httpx
 
 # Model configuration
 MODEL = "openai/gpt-4.1"
 
-def get_client():
-    """Initialize OpenRouter client"""
-    api_key = os.getenv('OPENROUTER_API_KEY') or os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError("OPENROUTER_API_KEY or OPENAI_API_KEY environment variable not set")
+# OpenAI-compatible endpoint; point at test/openai_stub_server.py for offline runs
+BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+
+# Chunked analysis defaults (--chunked)
+CHUNK_TOKENS = 6000
+
+# Connection pool / request settings
+MAX_CONCURRENCY = 4
+REQUEST_TIMEOUT = 300
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 60.0
+
+# Tokens-per-minute budget shared by all requests (0 = unlimited)
+TOKENS_PER_MINUTE = int(os.getenv('TRACKER_TOKENS_PER_MINUTE', '0'))
+
+# Errors worth another attempt: 429s, 5xx responses, timeouts and dropped connections
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)
+
+EXTRA_HEADERS = {
+    "HTTP-Referer": "https://github.com/Human-Frontier-Labs-Inc/ideabrow-automation",
+    "X-Title": "Ideabrow Automation",
+}
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the server's requested wait (retry-after-ms or Retry-After) from an API error"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    
+    headers = response.headers
+    try:
+        if headers.get('retry-after-ms'):
+            return max(0.0, float(headers['retry-after-ms']) / 1000)
+    except ValueError:
+        pass
     
-    return OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-    )
+    value = headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    # Retry-After may also be an HTTP date
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
-def analyze_requirements(client: OpenAI, requirements: str) -> str:
-    """Analyze requirements and extract key information"""
-    response = client.chat.completions.create(
-        model=MODEL,
-        messages=[
-            {
-                "role": "system",
-                "content": """You are a requirements analyst. Analyze the provided project documentation and extract:
+class TokenBudget:
+    """
+    Tokens-per-minute bucket shared by every request (a rate of 0 disables it)
+    
+    acquire() takes the prompt's estimated tokens before a request is sent,
+    waiting in FIFO order for the bucket to refill; charge() debits the
+    completion afterwards, which may leave the bucket in debt.
+    """
+    
+    def __init__(self, tokens_per_minute: int = TOKENS_PER_MINUTE):
+        self.capacity = float(max(0, tokens_per_minute))
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+        self.waited = 0.0
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self, tokens: int) -> None:
+        if not self.rate:
+            return
+        tokens = min(tokens, self.capacity)
+        async with self.lock:
+            self._refill()
+            while self.level < tokens:
+                wait = (tokens - self.level) / self.rate
+                self.waited += wait
+                await asyncio.sleep(wait)
+                self._refill()
+            self.level -= tokens
+    
+    def charge(self, tokens: int) -> None:
+        if not self.rate:
+            return
+        self._refill()
+        self.level -= tokens
+
+class TrackerClient:
+    """
+    Async OpenRouter client shared by every stage (and every project in --batch)
+    
+    Requests go over one pooled HTTP connection set, at most `concurrency`
+    at a time and within the token budget. Rate limits, server errors and connection failures are
+    retried with full-jitter exponential backoff; when the server sends
+    Retry-After, that wait is used instead (plus jitter, so concurrent
+    retries do not fire together).
+    """
+    
+    def __init__(self, concurrency: int = MAX_CONCURRENCY, max_retries: int = MAX_RETRIES,
+                 tokens_per_minute: int = TOKENS_PER_MINUTE, base_url: Optional[str] = None):
+        api_key = os.getenv('OPENROUTER_API_KEY') or os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OPENROUTER_API_KEY or OPENAI_API_KEY environment variable not set")
+        
+        concurrency = max(1, concurrency)
+        self.http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=10.0)
+        )
+        # Retries are handled in request() so they can share the concurrency limit
+        self.client = AsyncOpenAI(
+            base_url=base_url or BASE_URL,
+            api_key=api_key,
+            http_client=self.http_client,
+            max_retries=0,
+        )
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.budget = TokenBudget(tokens_per_minute)
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retries = 0
+    
+    async def request(self, attempt: Callable[[], Awaitable[str]], label: str = "request",
+                      tokens: int = 0) -> str:
+        """Run attempt() within the token budget and concurrency limit, retrying transient failures"""
+        for tries in range(self.max_retries + 1):
+            await self.budget.acquire(tokens)
+            try:
+                async with self.semaphore:
+                    return await attempt()
+            except RETRYABLE_ERRORS as e:
+                if tries == self.max_retries:
+                    raise
+                wait = retry_after_seconds(e)
+                if wait is not None:
+                    delay = wait + random.uniform(0, RETRY_BASE_DELAY)
+                else:
+                    delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** tries))
+                self.retries += 1
+                print(f"  {label}: {type(e).__name__}, retrying in {delay:.1f}s "
+                      f"({tries + 1}/{self.max_retries})", flush=True)
+                await asyncio.sleep(delay)
+    
+    async def close(self) -> None:
+        await self.client.close()
+        await self.http_client.aclose()
+
+def get_client(concurrency: int = MAX_CONCURRENCY, tokens_per_minute: int = TOKENS_PER_MINUTE,
+               base_url: Optional[str] = None) -> TrackerClient:
+    """Initialize OpenRouter client (base_url overrides $OPENROUTER_BASE_URL)"""
+    return TrackerClient(concurrency, tokens_per_minute=tokens_per_minute, base_url=base_url)
+
+class StreamOutput:
+    """
+    Destination for one streamed stage (--stream)
+    
+    Text is appended to `path` (if given) as it arrives, and each completed
+    line goes to `on_line` until the callback returns True. finish() prints
+    the stage's time-to-first-token and generation rate.
+    """
+    
+    def __init__(self, label: str, path: Optional[Path] = None,
+                 on_line: Optional[Callable[[str], bool]] = None):
+        self.label = label
+        self.path = path
+        self.on_line = on_line
+        self._file = None
+        self._pending = ""
+    
+    def write(self, text: str) -> None:
+        if self.path is not None:
+            if self._file is None:
+                self._file = open(self.path, 'w')
+            self._file.write(text)
+            self._file.flush()
+        if self.on_line:
+            self._pending += text
+            while self.on_line and "\n" in self._pending:
+                line, self._pending = self._pending.split("\n", 1)
+                if self.on_line(line):
+                    self.on_line = None
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.on_line and self._pending:
+            self.on_line(self._pending)
+        self.on_line = None
+    
+    def finish(self, started: float, first_token_at: Optional[float], tokens: int) -> None:
+        self.close()
+        if first_token_at is None:
+            print(f"  {self.label}: no tokens streamed", flush=True)
+            return
+        generating = time.time() - first_token_at
+        rate = tokens / generating if generating > 0 else 0.0
+        print(f"  {self.label}: first token {first_token_at - started:.2f}s, "
+              f"{tokens} tokens at {rate:.1f} tok/s", flush=True)
+
+async def stream_completion(client: TrackerClient, messages: List[Dict[str, str]], stream: StreamOutput) -> str:
+    """Run one streamed chat completion, passing each delta to the stream as it arrives"""
+    started = time.time()
+    first_token_at = None
+    pieces = []
+    usage = None
+    try:
+        response = await client.client.chat.completions.create(
+            model=MODEL,
+            messages=messages,
+            extra_headers=EXTRA_HEADERS,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        async for chunk in response:
+            if getattr(chunk, 'usage', None):
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                if first_token_at is None:
+                    first_token_at = time.time()
+                pieces.append(delta)
+                stream.write(delta)
+    finally:
+        stream.close()
+    
+    # Without usage data, each content delta is counted as one token
+    tokens = usage.completion_tokens if usage else len(pieces)
+    stream.finish(started, first_token_at, tokens)
+    return "".join(pieces)
+
+async def complete(client: TrackerClient, messages: List[Dict[str, str]], cache: Optional[LLMCache] = None,
+                   stream: Optional[StreamOutput] = None) -> str:
+    """Run one chat completion, answering from the cache when the same request was seen before
+    
+    A retried stream starts over, rewriting its output file from the beginning.
+    """
+    key = cache_key(MODEL, messages)
+    if cache:
+        cached = cache.get(key)
+        if cached is not None:
+            print("  (cached response)")
+            if stream:
+                stream.write(cached)
+                stream.close()
+            return cached
+    
+    async def attempt() -> str:
+        if stream:
+            return await stream_completion(client, messages, stream)
+        response = await client.client.chat.completions.create(
+            model=MODEL,
+            messages=messages,
+            extra_headers=EXTRA_HEADERS
+        )
+        return response.choices[0].message.content
+    
+    prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+    content = await client.request(attempt, stream.label if stream else "request", prompt_tokens)
+    client.budget.charge(estimate_tokens(content or ""))
+    if cache and content:
+        cache.put(key, content, MODEL)
+    return content
+
+ANALYSIS_PROMPT = """You are a requirements analyst. Analyze the provided project documentation and extract:
                 1. Core functionality requirements
                 2. User stories and primary workflows  
                 3. Technical constraints and dependencies
@@ -44,27 +312,119 @@ def analyze_requirements(client: OpenAI, requirements: str) -> str:
                 
                 IMPORTANT: A pre-built template will be used that already includes Next.js 14+, authentication, 
                 database setup, and UI components. Focus on the UNIQUE features this project needs."""
-            },
-            {
-                "role": "user",
-                "content": requirements
-            }
-        ],
-        extra_headers={
-            "HTTP-Referer": "https://github.com/Human-Frontier-Labs-Inc/ideabrow-automation",
-            "X-Title": "Ideabrow Automation",
+
+async def analyze_requirements(client: TrackerClient, requirements: str, cache: Optional[LLMCache] = None,
+                               stream: Optional[StreamOutput] = None) -> str:
+    """Analyze requirements and extract key information"""
+    return await complete(client, [
+        {
+            "role": "system",
+            "content": ANALYSIS_PROMPT
+        },
+        {
+            "role": "user",
+            "content": requirements
+        }
+    ], cache, stream)
+
+CHUNK_ANALYSIS_PROMPT = """You are a requirements analyst. You are given ONE PART of a larger set of project documentation.
+                Extract only what this part states about:
+                1. Core functionality requirements
+                2. User stories and primary workflows
+                3. Technical constraints and dependencies
+                4. Success criteria and key metrics
+                5. Hints about the application category
+                
+                Use those five headings, and write "None in this part" under any heading with nothing to report.
+                Do not guess about the parts you cannot see. Keep names, numbers and constraints exact,
+                since these notes will be merged with notes from the other parts."""
+
+MERGE_PROMPT = """You are a requirements analyst. Merge the partial analyses below, each written from one part of
+                the same project's documentation, into a single analysis with these sections:
+                1. Core functionality requirements
+                2. User stories and primary workflows
+                3. Technical constraints and dependencies
+                4. Success criteria and key metrics
+                5. Primary application category (e.g., e-commerce, blog, social media, real-time chat, SaaS dashboard, marketplace, etc.)
+                
+                Remove duplicates, reconcile overlapping statements and keep every distinct requirement.
+                Output a structured summary focusing on WHAT needs to be built, not HOW.
+                Be concise but comprehensive. Identify the MVP scope clearly.
+                
+                IMPORTANT: A pre-built template will be used that already includes Next.js 14+, authentication,
+                database setup, and UI components. Focus on the UNIQUE features this project needs."""
+
+async def analyze_chunk(client: TrackerClient, chunk: str, cache: Optional[LLMCache] = None) -> str:
+    """Map step: analyze one chunk on its own
+    
+    The prompt holds only the chunk text (no position or chunk count), so the
+    cache key depends on the chunk's content alone and survives edits elsewhere.
+    """
+    return await complete(client, [
+        {"role": "system", "content": CHUNK_ANALYSIS_PROMPT},
+        {"role": "user", "content": chunk}
+    ], cache)
+
+async def merge_analyses(client: TrackerClient, partials: List[str], cache: Optional[LLMCache] = None) -> str:
+    """Reduce step: combine partial analyses into one"""
+    combined = "\n\n---\n\n".join(f"## Partial analysis {i}\n\n{p}" for i, p in enumerate(partials, 1))
+    return await complete(client, [
+        {"role": "system", "content": MERGE_PROMPT},
+        {"role": "user", "content": combined}
+    ], cache)
+
+async def analyze_requirements_chunked(client: TrackerClient, chunks: List[Tuple[str, str]],
+                                       chunk_tokens: int = CHUNK_TOKENS,
+                                       cache: Optional[LLMCache] = None) -> str:
+    """Analyze (label, text) chunks concurrently, then merge the partial analyses
+    
+    Merging is done in rounds: partials are grouped to fit chunk_tokens and each
+    group is merged concurrently, until one analysis is left. A single chunk
+    skips map-reduce and gets the regular analysis prompt.
+    """
+    if len(chunks) == 1:
+        return await analyze_requirements(client, chunks[0][1], cache)
+    
+    print(f"  Map: {len(chunks)} chunks, up to {client.concurrency} at a time")
+    partials = await asyncio.gather(*(analyze_chunk(client, text, cache) for _, text in chunks))
+    
+    while len(partials) > 1:
+        groups = [[]]
+        for partial in partials:
+            group = groups[-1]
+            if len(group) >= 2 and estimate_tokens("".join(group) + partial) > chunk_tokens:
+                groups.append([partial])
+            else:
+                group.append(partial)
+        print(f"  Reduce: {len(partials)} partial analyses -> {len(groups)}")
+        partials = await asyncio.gather(*(
+            merge_analyses(client, group, cache) if len(group) > 1 else asyncio.sleep(0, group[0])
+            for group in groups
+        ))
+    return partials[0]
+
+async def suggest_project_name(client: TrackerClient, analysis: str, cache: Optional[LLMCache] = None) -> str:
+    """Name the project from the analysis (runs alongside plan generation)"""
+    name = await complete(client, [
+        {
+            "role": "system",
+            "content": """Suggest a short, meaningful product name (2-4 words) for the project described in this
+                requirements analysis. Reply with the name only, no quotes or punctuation."""
+        },
+        {
+            "role": "user",
+            "content": analysis
         }
-    )
-    return response.choices[0].message.content
+    ], cache)
+    return name.strip().strip('"\'').splitlines()[0] if name and name.strip() else ""
 
-def create_phased_plan(client: OpenAI, analysis: str) -> str:
+async def create_phased_plan(client: TrackerClient, analysis: str, cache: Optional[LLMCache] = None,
+                             stream: Optional[StreamOutput] = None) -> str:
     """Create a phased development plan"""
-    response = client.chat.completions.create(
-        model=MODEL,
-        messages=[
-            {
-                "role": "system", 
-                "content": """Create a phased development plan with exactly 5 phases.
+    return await complete(client, [
+        {
+            "role": "system", 
+            "content": """Create a phased development plan with exactly 5 phases.
                 
                 CRITICAL: The project will use a PRE-BUILT TEMPLATE that already includes:
                 - Next.js 14+ setup with TypeScript
@@ -93,18 +453,12 @@ def create_phased_plan(client: OpenAI, analysis: str) -> str:
                 
                 NO CODE IMPLEMENTATION DETAILS. Focus on functional descriptions.
                 Each phase should be independently testable and deployable."""
-            },
-            {
-                "role": "user",
-                "content": f"Based on this analysis, create a phased development plan:\n\n{analysis}"
-            }
-        ],
-        extra_headers={
-            "HTTP-Referer": "https://github.com/Human-Frontier-Labs-Inc/ideabrow-automation",
-            "X-Title": "Ideabrow Automation",
+        },
+        {
+            "role": "user",
+            "content": f"Based on this analysis, create a phased development plan:\n\n{analysis}"
         }
-    )
-    return response.choices[0].message.content
+    ], cache, stream)
 
 def extract_project_name(tracker_content: str) -> str:
     """Extract project name from the generated tracker"""
@@ -143,15 +497,14 @@ def extract_project_name(tracker_content: str) -> str:
     
     return "unnamed-project"
 
-def format_progress_tracker(client: OpenAI, project_name: str, plan: str, analysis: str) -> str:
+async def format_progress_tracker(client: TrackerClient, project_name: str, plan: str, analysis: str,
+                                  cache: Optional[LLMCache] = None, stream: Optional[StreamOutput] = None) -> str:
     """Format the final progress tracker document"""
-    response = client.chat.completions.create(
-        model=MODEL,
-        messages=[
-            {
-                "role": "system",
-                "content": """You are creating a PROGRESS_TRACKER.md for an AI developer who will implement this project by EXTENDING A PRE-BUILT TEMPLATE.
-
+    return await complete(client, [
+        {
+            "role": "system",
+            "content": """You are creating a PROGRESS_TRACKER.md for an AI developer who will implement this project by EXTENDING A PRE-BUILT TEMPLATE.
+            
                 <critical_context>
                 THE PROJECT USES A PRE-BUILT TEMPLATE THAT ALREADY INCLUDES:
                 - Next.js 14+ with App Router fully configured
@@ -165,7 +518,7 @@ def format_progress_tracker(client: OpenAI, project_name: str, plan: str, analys
                 
                 THE AI DEVELOPER SHOULD NOT REBUILD THESE FROM SCRATCH!
                 </critical_context>
-
+                
                 <critical_format_requirement>
                 The FIRST LINE of your response MUST be EXACTLY in this format:
                 # Project: [Replace this with a 2-4 word project name]
@@ -174,7 +527,7 @@ def format_progress_tracker(client: OpenAI, project_name: str, plan: str, analys
                 Examples of GOOD names: "Task Tracker", "E-Commerce Platform", "Chat Application", "Blog Engine"
                 Examples of BAD names: "Project", "Application", "System", "Software"
                 </critical_format_requirement>
-
+                
                 <tech_stack_note>
                 The template will determine the exact tech stack. Common patterns:
                 - If template uses Clerk → use Clerk's built-in components
@@ -308,7 +661,7 @@ def format_progress_tracker(client: OpenAI, project_name: str, plan: str, analys
                 - If template uses Clerk, use Clerk's components (not custom auth pages)
                 - If template uses Prisma, use Prisma (not raw SQL or different ORM)
                 </instructions_for_ai_developer>
-
+                
                 <critical_guardrails>
                 You MUST fill in all placeholders with SPECIFIC content from the requirements.
                 But remember: Phase 1 should ALWAYS be about analyzing the template first,
@@ -316,25 +669,17 @@ def format_progress_tracker(client: OpenAI, project_name: str, plan: str, analys
                 </critical_guardrails>
                 
                 Start your response with "# Project: " followed by a meaningful project name extracted from the actual requirements."""
-            },
-            {
-                "role": "user",
-                "content": f"Project: {project_name}\n\nPlan:\n{plan}\n\nAnalysis:\n{analysis}"
-            }
-        ],
-        extra_headers={
-            "HTTP-Referer": "https://github.com/Human-Frontier-Labs-Inc/ideabrow-automation",
-            "X-Title": "Ideabrow Automation",
+        },
+        {
+            "role": "user",
+            "content": f"Project: {project_name}\n\nPlan:\n{plan}\n\nAnalysis:\n{analysis}"
         }
-    )
-    return response.choices[0].message.content
+    ], cache, stream)
 
-async def read_requirements(project_path: Path) -> str:
-    """Read all markdown files from the requirements directory"""
-    requirements = []
-    
-    # Find all .md files in the project path
-    md_files = list(project_path.glob("**/*.md"))
+def find_requirement_files(project_path: Path) -> List[Path]:
+    """List the markdown files under the requirements directory"""
+    # Sorted so the combined text (and its cache key) does not depend on directory order
+    md_files = sorted(project_path.glob("**/*.md"))
     
     if not md_files:
         raise ValueError(f"No markdown files found in {project_path}")
@@ -342,35 +687,246 @@ async def read_requirements(project_path: Path) -> str:
     print(f"Found {len(md_files)} requirement files:")
     for md_file in md_files:
         print(f"  - {md_file.name}")
-        with open(md_file, 'r') as f:
-            content = f.read()
-            requirements.append(f"## File: {md_file.name}\n\n{content}")
+    return md_files
+
+async def read_files(paths: List[Path]) -> List[str]:
+    """Read files concurrently on the default thread pool"""
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(None, path.read_text) for path in paths))
+
+async def read_requirements(project_path: Path) -> str:
+    """Read all markdown files from the requirements directory"""
+    md_files = find_requirement_files(project_path)
+    contents = await read_files(md_files)
     
+    requirements = [f"## File: {md_file.name}\n\n{content}" for md_file, content in zip(md_files, contents)]
     return "\n\n---\n\n".join(requirements)
 
-async def generate_progress_tracker(requirements: str, project_name: str) -> str:
-    """Generate progress tracker using sequential API calls"""
-    print("\nStarting TEMPLATE-AWARE generation pipeline...")
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token), close enough for budgeting"""
+    return len(text) // 4 + 1
+
+def split_oversized(text: str, max_tokens: int) -> List[str]:
+    """Split text on blank lines, hard-cutting any paragraph that is still too long"""
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+    
+    max_chars = max_tokens * 4
+    pieces = []
+    for paragraph in re.split(r'(?<=\n\n)', text):
+        while len(paragraph) > max_chars:
+            pieces.append(paragraph[:max_chars])
+            paragraph = paragraph[max_chars:]
+        if paragraph:
+            pieces.append(paragraph)
+    return pieces
+
+def chunk_document(name: str, content: str, max_tokens: int = CHUNK_TOKENS) -> List[Tuple[str, str]]:
+    """Split one document into (label, text) chunks of at most max_tokens
     
-    client = get_client()
+    Chunks never span files, so editing one document changes only its own
+    chunks. Large files are split before markdown headings where possible.
+    """
+    header = f"## File: {name}"
+    if estimate_tokens(content) <= max_tokens:
+        return [(name, f"{header}\n\n{content}")]
     
-    # Step 1: Analyze requirements
-    print("Step 1: Analyzing requirements (with template context)...")
-    analysis = analyze_requirements(client, requirements)
+    pieces = []
+    current = ""
+    for section in re.split(r'(?m)^(?=#{1,3} )', content):
+        for block in split_oversized(section, max_tokens):
+            if current and estimate_tokens(current + block) > max_tokens:
+                pieces.append(current)
+                current = ""
+            current += block
+    if current:
+        pieces.append(current)
     
-    # Step 2: Create phased plan
-    print("Step 2: Creating phased development plan (template-first approach)...")
-    plan = create_phased_plan(client, analysis)
+    total = len(pieces)
+    return [(f"{name} [{i}/{total}]", f"{header} (part {i} of {total})\n\n{piece.strip()}")
+            for i, piece in enumerate(pieces, 1)]
+
+async def read_requirement_chunks(project_path: Path, max_tokens: int = CHUNK_TOKENS) -> List[Tuple[str, str]]:
+    """Read the requirements directory as token-budgeted chunks"""
+    md_files = find_requirement_files(project_path)
+    contents = await read_files(md_files)
+    
+    chunks = []
+    for md_file, content in zip(md_files, contents):
+        chunks.extend(chunk_document(md_file.name, content, max_tokens))
+    print(f"Split into {len(chunks)} chunk(s) of up to ~{max_tokens} tokens")
+    return chunks
+
+async def generate_progress_tracker(requirements: str, project_name: str,
+                                    cache: Optional[LLMCache] = None,
+                                    analysis: Optional[str] = None,
+                                    tracker_stream: Optional[StreamOutput] = None,
+                                    client: Optional[TrackerClient] = None,
+                                    name_from_analysis: bool = False) -> str:
+    """Generate progress tracker, running independent API calls concurrently
     
-    # Step 3: Format tracker
-    print("Step 3: Formatting progress tracker (emphasizing template extension)...")
-    tracker = format_progress_tracker(client, project_name, plan, analysis)
+    A precomputed analysis (from --chunked) replaces step 1. With a
+    tracker_stream, every stage streams and the tracker goes to its file.
+    With name_from_analysis, a project name is suggested from the analysis
+    while the plan is generated, and replaces project_name in step 3.
+    """
+    print("\nStarting TEMPLATE-AWARE generation pipeline...")
+    
+    own_client = client is None
+    if own_client:
+        client = get_client()
+    streaming = tracker_stream is not None
+    
+    try:
+        # Step 1: Analyze requirements
+        if analysis is None:
+            print("Step 1: Analyzing requirements (with template context)...", flush=True)
+            analysis = await analyze_requirements(client, requirements, cache,
+                                                  StreamOutput("analysis") if streaming else None)
+        
+        # Step 2: Create phased plan (and name the project) - both depend only on the analysis
+        print("Step 2: Creating phased development plan (template-first approach)...", flush=True)
+        plan_task = create_phased_plan(client, analysis, cache, StreamOutput("plan") if streaming else None)
+        if name_from_analysis:
+            plan, suggested_name = await asyncio.gather(plan_task, suggest_project_name(client, analysis, cache))
+            if suggested_name:
+                print(f"  Suggested project name: {suggested_name}")
+                project_name = suggested_name
+        else:
+            plan = await plan_task
+        
+        # Step 3: Format tracker
+        print("Step 3: Formatting progress tracker (emphasizing template extension)...", flush=True)
+        tracker = await format_progress_tracker(client, project_name, plan, analysis, cache, tracker_stream)
+    finally:
+        if own_client:
+            await client.close()
     
+    if cache:
+        print(f"LLM cache: {cache.stats()}")
+    if client.retries:
+        print(f"API retries: {client.retries}")
     return tracker
 
+async def generate_for_project(client: TrackerClient, project_path: Path, project_name: str,
+                               cache: Optional[LLMCache] = None, chunked: bool = False,
+                               chunk_tokens: int = CHUNK_TOKENS,
+                               tracker_stream: Optional[StreamOutput] = None,
+                               name_from_analysis: bool = False) -> str:
+    """Read one requirements directory and generate its tracker"""
+    if chunked:
+        # Map-reduce: analyze chunks concurrently, then generate from the merged analysis
+        chunks = await read_requirement_chunks(project_path, chunk_tokens)
+        print("\nStep 1: Analyzing requirements in chunks (with template context)...")
+        analysis = await analyze_requirements_chunked(client, chunks, chunk_tokens, cache)
+        return await generate_progress_tracker(None, project_name, cache, analysis=analysis,
+                                               tracker_stream=tracker_stream, client=client,
+                                               name_from_analysis=name_from_analysis)
+    
+    requirements = await read_requirements(project_path)
+    return await generate_progress_tracker(requirements, project_name, cache,
+                                           tracker_stream=tracker_stream, client=client,
+                                           name_from_analysis=name_from_analysis)
+
+def read_manifest(manifest_path: Path) -> List[Dict[str, str]]:
+    """Parse a batch manifest
+    
+    Each non-blank, non-# line is either a project directory or a JSON object
+    with "path" and optional "name" and "output". Relative paths are taken
+    from the manifest's directory.
+    """
+    entries = []
+    for line in manifest_path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        entry = json.loads(line) if line.startswith('{') else {"path": line}
+        if not entry.get("path"):
+            raise ValueError(f"Manifest entry without a path: {line}")
+        entry["path"] = str(manifest_path.parent / entry["path"])
+        if entry.get("output"):
+            entry["output"] = str(manifest_path.parent / entry["output"])
+        entries.append(entry)
+    return entries
+
+async def run_batch(entries: List[Dict[str, str]], client: TrackerClient, cache: Optional[LLMCache],
+                    output_dir: Path, summary_path: Path, chunked: bool = False,
+                    chunk_tokens: int = CHUNK_TOKENS, stream: bool = False) -> int:
+    """Generate trackers for many projects over one client; returns the number of failures
+    
+    Up to client.concurrency projects run at once, and all of them share the
+    client's request limit and token budget. Each finished project appends
+    one line to the JSON Lines summary, so an interrupted batch keeps its
+    record so far.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text("")
+    
+    # Labels come from directory names; a name shared by several entries
+    # (e.g. every project keeps its docs in "docs") is prefixed with its parent
+    basenames = [Path(entry["path"]).name for entry in entries]
+    used = set()
+    for entry, basename in zip(entries, basenames):
+        if not entry.get("label"):
+            base = entry.get("name") or basename
+            if not entry.get("name") and basenames.count(basename) > 1:
+                base = f"{Path(entry['path']).parent.name}-{basename}"
+            label, n = base, 2
+            while label in used:
+                label, n = f"{base}-{n}", n + 1
+            entry["label"] = label
+        used.add(entry["label"])
+        if not entry.get("output"):
+            entry["output"] = str(output_dir / (re.sub(r'[^\w.-]+', '-', entry["label"]) + ".md"))
+    
+    slots = asyncio.Semaphore(client.concurrency)
+    batch_started = time.time()
+    
+    async def process(entry: Dict[str, str]) -> bool:
+        project_path = Path(entry["path"])
+        output_path = Path(entry["output"])
+        project_name = entry.get("name") or project_path.name
+        queued_at = time.time()
+        record = {"project": entry["label"], "path": str(project_path), "output": str(output_path)}
+        async with slots:
+            started = time.time()
+            try:
+                if not project_path.is_dir():
+                    raise ValueError(f"Project path {project_path} does not exist")
+                tracker_stream = StreamOutput(entry["label"], output_path) if stream else None
+                tracker = await generate_for_project(client, project_path, project_name, cache, chunked,
+                                                     chunk_tokens, tracker_stream,
+                                                     name_from_analysis=not entry.get("name"))
+                if not stream:
+                    await asyncio.get_running_loop().run_in_executor(None, output_path.write_text, tracker)
+                record.update(success=True, project_name=extract_project_name(tracker), size=len(tracker))
+            except Exception as e:
+                record.update(success=False, error=str(e))
+        record.update(
+            queued_seconds=round(started - queued_at, 3),
+            seconds=round(time.time() - started, 3),
+            finished_at=round(time.time() - batch_started, 3)
+        )
+        with open(summary_path, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"{'✓' if record['success'] else '✗'} {entry['label']}: {record['seconds']:.1f}s"
+              f"{'' if record['success'] else ' - ' + record['error']}", flush=True)
+        return record["success"]
+    
+    results = await asyncio.gather(*(process(entry) for entry in entries))
+    failures = results.count(False)
+    
+    print(f"\nBatch: {len(results) - failures}/{len(results)} succeeded in {time.time() - batch_started:.1f}s")
+    if client.budget.rate:
+        print(f"  Token budget waits: {client.budget.waited:.1f}s")
+    print(f"  Trackers: {output_dir}")
+    print(f"  Summary: {summary_path}")
+    return failures
+
 async def main():
     parser = argparse.ArgumentParser(description='Generate TEMPLATE-AWARE progress tracker from requirements')
-    parser.add_argument('--project-path', type=str, required=True,
+    parser.add_argument('--project-path', type=str,
                        help='Path to project requirements directory')
     parser.add_argument('--output', type=str, default='PROGRESS_TRACKER.md',
                        help='Output file name (default: PROGRESS_TRACKER.md)')
@@ -378,9 +934,56 @@ async def main():
                        help='Project name (extracted from path if not provided)')
     parser.add_argument('--extract-project-name', action='store_true',
                        help='Extract and output project name from generated tracker')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always call the API instead of reusing cached responses')
+    parser.add_argument('--cache-dir', type=str,
+                       help='Response cache directory (default: $TRACKER_CACHE_DIR or ~/.cache/ideabrow/llm)')
+    parser.add_argument('--chunked', action='store_true',
+                       help='Analyze the docs in token-budgeted chunks concurrently, then merge (for large doc sets)')
+    parser.add_argument('--chunk-tokens', type=int, default=CHUNK_TOKENS,
+                       help=f'Approximate token budget per chunk (default: {CHUNK_TOKENS})')
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENCY,
+                       help=f'Maximum concurrent API requests and pooled connections (default: {MAX_CONCURRENCY})')
+    parser.add_argument('--stream', action='store_true',
+                       help='Stream completions, writing the tracker to --output as it is generated')
+    parser.add_argument('--batch', type=str, nargs='+', metavar='PROJECT_PATH',
+                       help='Generate trackers for several requirements directories in one run')
+    parser.add_argument('--manifest', type=str,
+                       help='Batch manifest: one directory per line, or JSON lines with path/name/output')
+    parser.add_argument('--output-dir', type=str, default='trackers',
+                       help='Batch mode: directory for <project>.md trackers (default: trackers)')
+    parser.add_argument('--summary', type=str,
+                       help='Batch mode: JSON Lines summary file (default: <output-dir>/batch_summary.jsonl)')
+    parser.add_argument('--tokens-per-minute', type=int, default=TOKENS_PER_MINUTE,
+                       help='Token budget per minute across all requests, 0 for none '
+                            '(default: $TRACKER_TOKENS_PER_MINUTE or 0)')
+    parser.add_argument('--base-url', type=str,
+                       help='OpenAI-compatible API base URL (default: $OPENROUTER_BASE_URL or OpenRouter)')
     
     args = parser.parse_args()
     
+    if args.batch or args.manifest:
+        if args.project_path:
+            parser.error("--project-path cannot be combined with --batch/--manifest")
+        entries = [{"path": path} for path in args.batch or []]
+        if args.manifest:
+            entries.extend(read_manifest(Path(args.manifest)))
+        output_dir = Path(args.output_dir)
+        summary_path = Path(args.summary) if args.summary else output_dir / "batch_summary.jsonl"
+        print(f"Batch: {len(entries)} project(s), {args.concurrency} concurrent request(s)")
+        
+        client = get_client(args.concurrency, args.tokens_per_minute, args.base_url)
+        try:
+            cache = create_llm_cache(enabled=not args.no_cache, cache_dir=args.cache_dir)
+            failures = await run_batch(entries, client, cache, output_dir, summary_path,
+                                       args.chunked, args.chunk_tokens, args.stream)
+        finally:
+            await client.close()
+        sys.exit(1 if failures else 0)
+    
+    if not args.project_path:
+        parser.error("one of --project-path, --batch or --manifest is required")
+    
     # Validate project path
     project_path = Path(args.project_path)
     if not project_path.exists():
@@ -392,20 +995,39 @@ async def main():
     print(f"Processing project: {project_name}")
     print("NOTE: This is the TEMPLATE-AWARE version that emphasizes extending templates, not building from scratch!")
     
+    client = None
     try:
-        # Read requirements
-        requirements = await read_requirements(project_path)
+        cache = create_llm_cache(enabled=not args.no_cache, cache_dir=args.cache_dir)
+        client = get_client(args.concurrency, args.tokens_per_minute, args.base_url)
+        output_path = Path(args.output)
         
-        # Generate tracker
-        tracker_content = await generate_progress_tracker(requirements, project_name)
+        # When streaming, report the project name as soon as its heading line arrives
+        streamed_name = []
+        def announce_project_name(line: str) -> bool:
+            if not re.match(r'^(#{1,2}\s+)?Project:\s+\S', line.strip(), re.IGNORECASE):
+                return False
+            name = extract_project_name(line.strip())
+            if name == "unnamed-project":
+                return False
+            streamed_name.append(name)
+            print(f"PROJECT_NAME:{name}", flush=True)
+            return True
         
-        # Save to file
-        output_path = Path(args.output)
-        with open(output_path, 'w') as f:
-            f.write(tracker_content)
+        tracker_stream = None
+        if args.stream:
+            tracker_stream = StreamOutput("tracker", output_path,
+                                          announce_project_name if args.extract_project_name else None)
+        
+        tracker_content = await generate_for_project(client, project_path, project_name, cache,
+                                                     args.chunked, args.chunk_tokens, tracker_stream,
+                                                     name_from_analysis=not args.project_name)
+        
+        # Save to file (already written incrementally when streaming)
+        if not args.stream:
+            await asyncio.get_running_loop().run_in_executor(None, output_path.write_text, tracker_content)
         
         # Extract project name if requested
-        if args.extract_project_name:
+        if args.extract_project_name and not streamed_name:
             extracted_name = extract_project_name(tracker_content)
             print(f"PROJECT_NAME:{extracted_name}")
         
@@ -417,10 +1039,11 @@ async def main():
     except Exception as e:
         print(f"Error generating tracker: {e}")
         sys.exit(1)
+    finally:
+        if client:
+            await client.close()
 
 if __name__ == "__main__":
-    import asyncio
-    
     # Ensure API key is set
     if not os.getenv('OPENROUTER_API_KEY') and not os.getenv('OPENAI_API_KEY'):
         print("Error: OPENROUTER_API_KEY or OPENAI_API_KEY environment variable not set")
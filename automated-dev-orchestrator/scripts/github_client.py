@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+GitHub REST Client - pooled, rate-limit-aware access to the GitHub API
+Usage:
+    python3 github_client.py create my-project-2024 [another-project ...] [--org Human-Frontier-Labs-Inc]
+    python3 github_client.py get my-project-2024
+    python3 github_client.py rate-limit
+
+One requests.Session per token keeps connections alive across calls. GETs
+are cached by ETag, so re-checking an unchanged resource gets a 304, which
+does not count against the rate limit. X-RateLimit-* headers are tracked:
+when the primary limit is used up, requests wait for the reset. Secondary
+limits (403/429 with Retry-After or a "secondary rate limit" message) pause
+every thread using the client. Repository creation is create-or-get, so a
+retried run picks up the repo an earlier attempt created.
+
+create_initial_commit() pushes files through the Git Data API (blobs, tree,
+commit, ref) instead of a clone and `git push`.
+
+GITHUB_API_URL (set by GitHub Actions) selects the API host, e.g. the local
+mock in test/mock_github_api.py.
+"""
+
+import os
+import sys
+import json
+import base64
+import time
+import random
+import argparse
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+DEFAULT_ORG = "Human-Frontier-Labs-Inc"
+DEFAULT_DESCRIPTION = "Auto-generated from ideabrow-automation"
+
+POOL_SIZE = 10
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUSES = {500, 502, 503, 504}
+# GitHub asks clients to wait at least a minute when a secondary limit has no Retry-After
+SECONDARY_RETRY_DELAY = 60.0
+# Longest wait for a primary limit reset before giving the 403 back to the caller
+MAX_RATE_LIMIT_WAIT = 900.0
+# GitHub recommends about a second between content-creating requests; the client
+# keeps to that once it has hit a secondary limit, and writes freely until then
+MUTATION_INTERVAL = 1.0
+ETAG_CACHE_SIZE = 512
+MUTATING_METHODS = {"POST", "PATCH", "PUT", "DELETE"}
+# Text files up to this size are sent inline in the tree request instead of as separate blobs
+INLINE_BLOB_LIMIT = 64 * 1024
+BLOB_WORKERS = 4
+
+class GitHubAPIError(Exception):
+    """A GitHub API response that is neither success nor an expected miss"""
+
+    def __init__(self, status_code: int, message: str, response: Optional[Dict[str, Any]] = None):
+        super().__init__(f"GitHub API returned {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+        self.response = response or {}
+
+class GitHubClient:
+    """
+    A pooled GitHub REST client, safe to share between threads
+    
+    request() retries 5xx responses and connection errors with jittered
+    backoff, and waits out rate limits using the X-RateLimit-* and
+    Retry-After headers.
+    """
+
+    def __init__(self, token: Optional[str] = None, api_url: str = GITHUB_API_URL,
+                 pool_size: int = POOL_SIZE, max_retries: int = MAX_RETRIES,
+                 timeout: float = REQUEST_TIMEOUT, mutation_interval: float = 0.0,
+                 secondary_retry_delay: float = SECONDARY_RETRY_DELAY,
+                 max_rate_limit_wait: float = MAX_RATE_LIMIT_WAIT):
+        self.api_url = api_url.rstrip("/")
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.mutation_interval = mutation_interval
+        self.secondary_retry_delay = secondary_retry_delay
+        self.max_rate_limit_wait = max_rate_limit_wait
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "ideabrow-automation"
+        })
+        if token:
+            self.session.headers["Authorization"] = f"token {token}"
+        
+        self._lock = threading.Lock()
+        self._etags: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._pause_until = 0.0
+        self._next_mutation = 0.0
+        self._secondary_limited = False
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.stats = {"requests": 0, "not_modified": 0, "retries": 0, "rate_limited": 0, "waited_seconds": 0.0}
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def _sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._count("waited_seconds", seconds)
+            time.sleep(seconds)
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+
+    def _wait_for_rate_limit(self, method: str) -> None:
+        """Wait for a secondary-limit pause, a used-up primary limit, or mutation spacing"""
+        with self._lock:
+            now = time.time()
+            wait = self._pause_until - now
+            if self.remaining == 0 and self.reset_at > now:
+                wait = max(wait, min(self.reset_at - now + 1, self.max_rate_limit_wait))
+            interval = max(self.mutation_interval, MUTATION_INTERVAL if self._secondary_limited else 0)
+            if method in MUTATING_METHODS and interval > 0:
+                # Reserve a slot so concurrent writers queue one interval apart
+                wait = max(wait, self._next_mutation - now)
+                self._next_mutation = now + max(wait, 0) + interval
+        self._sleep(wait)
+
+    def _update_rate_limit(self, response: requests.Response) -> None:
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        with self._lock:
+            try:
+                self.limit = int(headers.get("X-RateLimit-Limit", self.limit or 0))
+                self.remaining = int(headers["X-RateLimit-Remaining"])
+                self.reset_at = float(headers.get("X-RateLimit-Reset", self.reset_at))
+            except ValueError:
+                pass
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying this response, or None to return it"""
+        status = response.status_code
+        if status in (403, 429):
+            retry_after = response.headers.get("Retry-After")
+            message = response.text[:500].lower()
+            if retry_after or "secondary rate limit" in message:
+                # Secondary limit: pause every caller, not only this thread
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = self.secondary_retry_delay * (2 ** attempt)
+                with self._lock:
+                    self._pause_until = max(self._pause_until, time.time() + delay)
+                    self._secondary_limited = True
+                self._count("rate_limited")
+                return delay
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                delay = float(response.headers.get("X-RateLimit-Reset", 0)) - time.time() + 1
+                if delay > self.max_rate_limit_wait:
+                    return None
+                self._count("rate_limited")
+                return max(delay, 0)
+            return None
+        if status in RETRY_STATUSES:
+            return self._backoff(attempt)
+        return None
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request, retrying server errors and waiting out rate limits"""
+        url = path if path.startswith("http") else f"{self.api_url}{path}"
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit(method)
+            self._count("requests")
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                print(f"GitHub {method} {path}: {type(e).__name__}, retrying in {delay:.1f}s")
+                self._count("retries")
+                self._sleep(delay)
+                continue
+            
+            self._update_rate_limit(response)
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.max_retries:
+                return response
+            print(f"GitHub {method} {path}: HTTP {response.status_code}, retrying in {delay:.1f}s")
+            self._count("retries")
+            self._sleep(delay)
+        return response
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        """GET with ETag revalidation; a 304 is served from the cache as a 200"""
+        key = path + ("?" + json.dumps(params, sort_keys=True) if params else "")
+        with self._lock:
+            cached = self._etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self.request("GET", path, params=params, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            self._count("not_modified")
+            return 200, cached[1]
+        try:
+            data = response.json() if response.content else None
+        except ValueError:
+            data = {"message": response.text[:500]}
+        
+        etag = response.headers.get("ETag")
+        with self._lock:
+            if response.status_code == 200 and etag:
+                self._etags[key] = (etag, data)
+                self._etags.move_to_end(key)
+                while len(self._etags) > ETAG_CACHE_SIZE:
+                    self._etags.popitem(last=False)
+            elif response.status_code == 404:
+                self._etags.pop(key, None)
+        return response.status_code, data
+
+    def rate_limit(self) -> Dict[str, Any]:
+        """Current core rate limit (GET /rate_limit does not count against it)"""
+        status, data = self.get_json("/rate_limit")
+        if status != 200:
+            raise GitHubAPIError(status, (data or {}).get("message", "Unknown error"), data)
+        return data.get("resources", {}).get("core", data.get("rate", {}))
+
+    def get_repository(self, org_name: str, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Repository data, or None if it does not exist"""
+        status, data = self.get_json(f"/repos/{org_name}/{repo_name}")
+        if status == 200:
+            return data
+        if status == 404:
+            return None
+        raise GitHubAPIError(status, (data or {}).get("message", "Unknown error"), data)
+
+    def create_repository(self, repo_name: str, org_name: str = DEFAULT_ORG,
+                          description: str = DEFAULT_DESCRIPTION, private: bool = True) -> Dict[str, Any]:
+        """
+        Create a repository, or return the existing one of that name
+        
+        Returns the same dict as create_github_repo.create_repository, with
+        "created" telling a new repository from an existing one.
+        """
+        data = {
+            "name": repo_name,
+            "description": description,
+            "private": private,
+            "auto_init": False,  # Don't initialize with README
+            "has_issues": True,
+            "has_projects": True,
+            "has_wiki": False
+        }
+        try:
+            existing = self.get_repository(org_name, repo_name)
+            if existing:
+                return repo_result(existing, created=False)
+            
+            response = self.request("POST", f"/orgs/{org_name}/repos", json=data)
+            if response.status_code == 201:
+                return repo_result(response.json(), created=True)
+            
+            try:
+                error_data = response.json() if response.text else {}
+            except ValueError:
+                error_data = {"message": response.text[:500]}
+            if response.status_code == 422 and "already exists" in json.dumps(error_data):
+                # Lost a race with another creator (or an earlier attempt that timed out)
+                existing = self.get_repository(org_name, repo_name)
+                if existing:
+                    return repo_result(existing, created=False)
+            return {
+                "error": f"API request failed with status {response.status_code}",
+                "message": error_data.get("message", "Unknown error"),
+                "status_code": response.status_code,
+                "response": error_data
+            }
+        except GitHubAPIError as e:
+            return {
+                "error": f"API request failed with status {e.status_code}",
+                "message": e.message,
+                "status_code": e.status_code,
+                "response": e.response
+            }
+        except requests.exceptions.RequestException as e:
+            return {
+                "error": "Request failed",
+                "message": str(e)
+            }
+
+    def create_repositories(self, repo_names: List[str], org_name: str = DEFAULT_ORG,
+                            description: str = DEFAULT_DESCRIPTION, private: bool = True,
+                            max_workers: int = 4) -> List[Dict[str, Any]]:
+        """Create-or-get many repositories; results are in the order of repo_names"""
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            return list(pool.map(lambda name: self.create_repository(name, org_name, description, private),
+                                 repo_names))
+
+    def _send_json(self, method: str, path: str, payload: Optional[Dict[str, Any]],
+                   expected: Tuple[int, ...] = (200, 201)) -> Dict[str, Any]:
+        response = self.request(method, path, json=payload) if payload is not None else self.request(method, path)
+        try:
+            data = response.json() if response.content else {}
+        except ValueError:
+            data = {"message": response.text[:500]}
+        if response.status_code not in expected:
+            raise GitHubAPIError(response.status_code, data.get("message", "Unknown error"), data)
+        return data
+
+    def _bootstrap_empty_repository(self, base: str, branch: str, path: str, content: bytes) -> str:
+        """Give an empty repository its first commit through the Contents API (Git Data calls 409 until then)"""
+        data = self._send_json("PUT", f"{base}/contents/{quote(path)}", {
+            "message": "Bootstrap empty repository",
+            "content": base64.b64encode(content).decode(),
+            "branch": branch
+        })
+        return data["commit"]["sha"]
+
+    def create_initial_commit(self, org_name: str, repo_name: str, files: Dict[str, bytes],
+                              message: str = "Initial commit", branch: str = "main",
+                              author: Optional[Dict[str, str]] = None,
+                              max_workers: int = BLOB_WORKERS) -> Dict[str, Any]:
+        """
+        Commit files to a branch through the Git Data API, without a git checkout
+        
+        Small text files go inline in the tree request; larger or binary
+        files are uploaded as blobs concurrently. An empty repository is
+        bootstrapped and the bootstrap commit replaced, so the result is a
+        single root commit. On a branch that already has commits, the files
+        are laid over the branch's tree (files not given are kept, never
+        deleted) and committed on top, or nothing is committed if that
+        leaves the tree unchanged.
+        """
+        base = f"/repos/{org_name}/{repo_name}"
+        if not files:
+            return {"error": "Nothing to commit", "message": "No files given"}
+        
+        inline = {}
+        uploads = {}
+        for path, content in files.items():
+            try:
+                text = content.decode("utf-8")
+            except UnicodeDecodeError:
+                text = None
+            if text is not None and len(content) <= INLINE_BLOB_LIMIT:
+                inline[path] = text
+            else:
+                uploads[path] = content
+        
+        try:
+            response = self.request("GET", f"{base}/git/ref/heads/{branch}")
+            bootstrapped = False
+            if response.status_code == 200:
+                parent = response.json()["object"]["sha"]
+            elif response.status_code == 409:
+                # "Git Repository is empty."
+                path = next(iter(sorted(inline))) if inline else next(iter(sorted(uploads)))
+                parent = self._bootstrap_empty_repository(base, branch, path, files[path])
+                bootstrapped = True
+            elif response.status_code == 404:
+                parent = None
+            else:
+                raise GitHubAPIError(response.status_code, response.text[:200])
+
+            def upload(item: Tuple[str, bytes]) -> Tuple[str, str]:
+                path, content = item
+                data = self._send_json("POST", f"{base}/git/blobs", {
+                    "content": base64.b64encode(content).decode(),
+                    "encoding": "base64"
+                })
+                return path, data["sha"]
+            
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                blob_shas = dict(pool.map(upload, uploads.items()))
+            
+            tree = [{"path": path, "mode": "100644", "type": "blob", "content": text}
+                    for path, text in sorted(inline.items())]
+            tree += [{"path": path, "mode": "100644", "type": "blob", "sha": sha}
+                     for path, sha in sorted(blob_shas.items())]
+            head = None
+            if parent and not bootstrapped:
+                head = self._send_json("GET", f"{base}/git/commits/{parent}", None, expected=(200,))
+            request = {"tree": tree}
+            if head:
+                # Build on the existing history instead of replacing it
+                request["base_tree"] = head["tree"]["sha"]
+            tree_sha = self._send_json("POST", f"{base}/git/trees", request)["sha"]
+            
+            if head and head["tree"]["sha"] == tree_sha:
+                # Idempotent on retry: the branch already holds these files
+                return commit_result(parent, tree_sha, inline, blob_shas, bootstrapped, created=False)
+            
+            commit = {"message": message, "tree": tree_sha,
+                      "parents": [parent] if parent and not bootstrapped else []}
+            if author:
+                commit["author"] = author
+            commit_sha = self._send_json("POST", f"{base}/git/commits", commit)["sha"]
+            
+            if parent:
+                # Replacing the bootstrap commit needs a forced (non fast-forward) update
+                self._send_json("PATCH", f"{base}/git/refs/heads/{branch}",
+                                {"sha": commit_sha, "force": bootstrapped})
+            else:
+                self._send_json("POST", f"{base}/git/refs", {"ref": f"refs/heads/{branch}", "sha": commit_sha})
+            return commit_result(commit_sha, tree_sha, inline, blob_shas, bootstrapped, created=True)
+        except GitHubAPIError as e:
+            return {
+                "error": f"API request failed with status {e.status_code}",
+                "message": e.message,
+                "status_code": e.status_code,
+                "response": e.response
+            }
+        except requests.exceptions.RequestException as e:
+            return {
+                "error": "Request failed",
+                "message": str(e)
+            }
+
+def commit_result(commit_sha: str, tree_sha: str, inline: Dict[str, str], blob_shas: Dict[str, str],
+                  bootstrapped: bool, created: bool) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "created": created,
+        "commit_sha": commit_sha,
+        "tree_sha": tree_sha,
+        "files": len(inline) + len(blob_shas),
+        "inline_files": len(inline),
+        "blobs_uploaded": len(blob_shas),
+        "bootstrapped": bootstrapped
+    }
+
+def repo_result(repo_data: Dict[str, Any], created: bool) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "created": created,
+        "repo_name": repo_data["name"],
+        "full_name": repo_data["full_name"],
+        "html_url": repo_data["html_url"],
+        "ssh_url": repo_data["ssh_url"],
+        "clone_url": repo_data["clone_url"],
+        "created_at": repo_data["created_at"]
+    }
+
+_clients: Dict[Tuple[Optional[str], str], GitHubClient] = {}
+_clients_lock = threading.Lock()
+
+def get_client(token: Optional[str] = None, api_url: Optional[str] = None) -> GitHubClient:
+    """Shared client per token and API URL (uses GH_PAT or GH_TOKEN if no token is given)"""
+    token = token or os.environ.get('GH_PAT') or os.environ.get('GH_TOKEN')
+    api_url = api_url or os.getenv('GITHUB_API_URL', GITHUB_API_URL)
+    with _clients_lock:
+        if (token, api_url) not in _clients:
+            _clients[(token, api_url)] = GitHubClient(token, api_url)
+        return _clients[(token, api_url)]
+
+def main():
+    parser = argparse.ArgumentParser(description='Pooled, rate-limit-aware GitHub API client')
+    parser.add_argument('--api-url', type=str, help=f'API base URL (default: $GITHUB_API_URL or {GITHUB_API_URL})')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    create_parser = subparsers.add_parser('create', help='Create-or-get one or more repositories')
+    create_parser.add_argument('names', nargs='+', help='Repository names')
+    create_parser.add_argument('--org', default=DEFAULT_ORG, help=f'Organization (default: {DEFAULT_ORG})')
+    create_parser.add_argument('--description', default=DEFAULT_DESCRIPTION, help='Repository description')
+    create_parser.add_argument('--public', action='store_true', help='Create public repositories')
+    create_parser.add_argument('--workers', type=int, default=4, help='Concurrent requests (default: 4)')
+    
+    get_parser = subparsers.add_parser('get', help='Show a repository')
+    get_parser.add_argument('name', help='Repository name')
+    get_parser.add_argument('--org', default=DEFAULT_ORG, help=f'Organization (default: {DEFAULT_ORG})')
+    
+    subparsers.add_parser('rate-limit', help='Show the core rate limit')
+    
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return 1
+    
+    client = get_client(api_url=args.api_url)
+    try:
+        if args.command == 'create':
+            results = client.create_repositories(args.names, args.org, args.description,
+                                                 not args.public, args.workers)
+            for name, result in zip(args.names, results):
+                if result.get("success"):
+                    print(f"{'✅ Created' if result['created'] else '✅ Exists '} {result['full_name']}")
+                else:
+                    print(f"❌ {name}: {result.get('message', 'Unknown error')}")
+            print(json.dumps(client.stats))
+            return 0 if all(r.get("success") for r in results) else 1
+        if args.command == 'get':
+            repo = client.get_repository(args.org, args.name)
+            print(json.dumps(repo, indent=2) if repo else f"❌ {args.org}/{args.name} not found")
+            return 0 if repo else 1
+        print(json.dumps(client.rate_limit(), indent=2))
+        return 0
+    except (GitHubAPIError, requests.exceptions.RequestException) as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        client.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
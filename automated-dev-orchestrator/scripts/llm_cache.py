@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for LLM responses
+Responses are stored on disk under a hash of the model, messages and request
+options, so unchanged docs regenerate without any API calls
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "ideabrow" / "llm"
+DEFAULT_MAX_MB = 50
+
+def cache_key(model: str, messages: List[Dict[str, str]], **options: Any) -> str:
+    """SHA-256 over the canonical JSON of everything that determines the response"""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "options": options},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class LLMCache:
+    """
+    On-disk response store with size-bounded LRU eviction
+
+    Each entry is {key[:2]}/{key}.json. A hit touches the file's mtime,
+    so eviction removes the least recently used entries first once the
+    directory grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_mb: float = DEFAULT_MAX_MB):
+        self.cache_dir = Path(cache_dir or os.getenv('TRACKER_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.get("response")
+
+    def put(self, key: str, response: str, model: str = "") -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({"model": model, "created": time.time(), "response": response}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Warning: could not write LLM cache entry: {e}", file=sys.stderr)
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def stats(self) -> str:
+        return f"{self.hits} hit(s), {self.misses} miss(es)"
+
+def create_llm_cache(enabled: bool = True, cache_dir: Optional[str] = None) -> Optional[LLMCache]:
+    """Factory function - TRACKER_CACHE_DIR and TRACKER_CACHE_MAX_MB set the defaults"""
+    if not enabled:
+        return None
+    return LLMCache(cache_dir, max_mb=float(os.getenv('TRACKER_CACHE_MAX_MB', DEFAULT_MAX_MB)))
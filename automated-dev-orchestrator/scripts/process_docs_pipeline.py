@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Docs-to-Project Pipeline - the process-docs workflow as composable Python stages
+Runs one or many doc drops concurrently, locally or from GitHub Actions.
+
+Usage:
+    python3 process_docs_pipeline.py run docs [more-docs ...] [--concurrency 4] [--clear-docs]
+    python3 process_docs_pipeline.py run drops/* --skip repo,push,webhook   # local dry run
+    python3 process_docs_pipeline.py stages
+
+Each drop goes through these stages, each starting as soon as the stages it needs are done:
+
+    tracker -> repo -> push -> webhook -> summary
+           \\-> archive ----------------/
+
+Configuration comes from the same environment as the workflow:
+OPENROUTER_API_KEY, GH_PAT (or GH_TOKEN), DEV_SERVER_WEBHOOK_URL.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import sqlite3
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import requests
+
+from create_github_repo import collect_files, create_repository, push_initial_content
+from processed_index import ProcessedIndex
+
+DEFAULT_ORG = "Human-Frontier-Labs-Inc"
+REPO_DESCRIPTION = "Auto-generated from ideabrow-automation"
+TEMPLATE_HINT = "modern-saas/nextjs-clerk"
+INITIAL_COMMIT_MESSAGE = "Initial commit with progress tracker"
+COMMIT_AUTHOR = {"name": "GitHub Actions", "email": "actions@github.com"}
+WEBHOOK_TIMEOUT = 30
+
+FALLBACK_TRACKER = """# Project Progress Tracker
+
+## Phase 1: Setup
+## Phase 2: Core Features
+## Phase 3: Enhancements
+## Phase 4: Testing
+## Phase 5: Deploy
+"""
+
+class DocDrop:
+    """One docs directory moving through the pipeline; stages fill in its fields"""
+
+    def __init__(self, docs_dir: Path):
+        self.docs_dir = Path(docs_dir)
+        self.project_name: Optional[str] = None
+        self.unique_name: Optional[str] = None
+        self.tracker: str = ""
+        self.tracker_generated = False
+        self.repo_created = False
+        self.pushed = False
+        self.webhook_sent = False
+        self.archive_dir: Optional[Path] = None
+        self.timings: Dict[str, float] = {}
+        self.status: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+
+    def repo_url(self, org: str) -> str:
+        """Token-free HTTPS URL - the only form that is logged or archived"""
+        return f"https://github.com/{org}/{self.unique_name}.git"
+
+    def ssh_url(self, org: str) -> str:
+        return f"git@github.com:{org}/{self.unique_name}.git"
+
+    def markdown_files(self) -> List[Path]:
+        return sorted(self.docs_dir.glob("*.md"))
+
+    def record(self, org: str) -> Dict[str, Any]:
+        return {
+            "docs_dir": str(self.docs_dir),
+            "project_name": self.project_name,
+            "unique_name": self.unique_name,
+            "repository": self.repo_url(org) if self.unique_name else None,
+            "tracker_generated": self.tracker_generated,
+            "repo_created": self.repo_created,
+            "pushed": self.pushed,
+            "webhook_sent": self.webhook_sent,
+            "archive_dir": str(self.archive_dir) if self.archive_dir else None,
+            "status": self.status,
+            "errors": self.errors,
+            "timings": {stage: round(seconds, 3) for stage, seconds in self.timings.items()},
+            "total_seconds": round(sum(self.timings.values()), 3)
+        }
+
+class Stage:
+    """
+    A named pipeline step and the stages whose results it needs
+    on_skip, if given, still runs when the stage is skipped, to fill in what
+    later stages depend on.
+    """
+
+    def __init__(self, name: str, requires: List[str], run: Callable[[DocDrop], Awaitable[str]],
+                 on_skip: Optional[Callable[[DocDrop], None]] = None):
+        self.name = name
+        self.requires = requires
+        self.run = run
+        self.on_skip = on_skip
+
+class DocsPipeline:
+    """
+    The process-docs workflow as stages that run concurrently across drops
+    
+    A stage returns a short status ("ok", "fallback", "skipped: ...") or
+    raises; a failed stage is recorded on the drop and later stages still
+    run with what they have, as the workflow's `|| echo ...` steps did.
+    All drops share one tracker-generation client, so the API request
+    limit applies to the whole run.
+    """
+
+    def __init__(self, org: str = DEFAULT_ORG, processed_dir: Path = Path("processed"),
+                 concurrency: int = 4, clear_docs: bool = False, skip: Optional[List[str]] = None,
+                 chunked: bool = False, use_cache: bool = True,
+                 gh_token: Optional[str] = None, webhook_url: Optional[str] = None,
+                 api_key: Optional[str] = None):
+        self.org = org
+        self.processed_dir = Path(processed_dir)
+        self.concurrency = max(1, concurrency)
+        self.clear_docs = clear_docs
+        self.skip = set(skip or [])
+        self.chunked = chunked
+        self.use_cache = use_cache
+        self.gh_token = gh_token if gh_token is not None else (os.getenv('GH_PAT') or os.getenv('GH_TOKEN'))
+        self.webhook_url = webhook_url if webhook_url is not None else os.getenv('DEV_SERVER_WEBHOOK_URL')
+        self.api_key = api_key if api_key is not None else (os.getenv('OPENROUTER_API_KEY')
+                                                             or os.getenv('OPENAI_API_KEY'))
+        self.tracker_client = None
+        self.tracker_cache = None
+        self._names_in_use = set()
+        self._index: Optional[ProcessedIndex] = None
+        
+        self.stages = [
+            Stage("tracker", [], self.generate_tracker, on_skip=self.assign_fallbacks),
+            Stage("repo", ["tracker"], self.create_repo),
+            Stage("archive", ["tracker"], self.archive_docs),
+            Stage("push", ["repo"], self.push_initial_content),
+            # The dev server clones the repo on receipt, so the push goes first
+            Stage("webhook", ["push"], self.send_webhook),
+            Stage("summary", ["archive", "webhook"], self.write_summary),
+        ]
+        unknown = self.skip - {stage.name for stage in self.stages}
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(sorted(unknown))}")
+    
+    # ---- stages -------------------------------------------------------
+
+    async def generate_tracker(self, drop: DocDrop) -> str:
+        """Generate PROGRESS_TRACKER.md and the project name (fallbacks as in the workflow)"""
+        status = "fallback"
+        if self.tracker_client is None:
+            status = "fallback: no API key" if not self.api_key else "fallback: generator unavailable"
+        else:
+            import generate_tracker_template_aware as tracker_gen
+            try:
+                drop.tracker = await tracker_gen.generate_for_project(
+                    self.tracker_client, drop.docs_dir, drop.docs_dir.name, self.tracker_cache,
+                    chunked=self.chunked, name_from_analysis=True
+                )
+                drop.tracker_generated = bool(drop.tracker)
+                name = tracker_gen.extract_project_name(drop.tracker)
+                drop.project_name = None if name == "unnamed-project" else name
+                status = "ok" if drop.project_name else "ok, fallback name"
+            except Exception as e:
+                drop.errors["tracker"] = str(e)
+                status = "fallback: generation failed"
+        
+        self.assign_fallbacks(drop)
+        return status
+
+    def assign_fallbacks(self, drop: DocDrop) -> None:
+        """Fallback tracker and project name where generation gave none, then the unique name"""
+        if not drop.tracker:
+            drop.tracker = FALLBACK_TRACKER
+        if not drop.project_name:
+            drop.project_name = f"auto-project-{int(time.time())}"
+        drop.unique_name = self._unique_name(drop.project_name)
+
+    async def create_repo(self, drop: DocDrop) -> str:
+        if not self.gh_token:
+            return "skipped: no GH_PAT"
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: create_repository(drop.unique_name, self.org, REPO_DESCRIPTION, token=self.gh_token)
+        )
+        if not result.get("success"):
+            raise RuntimeError(f"{result.get('error')}: {result.get('message')}")
+        drop.repo_created = True
+        return "ok" if result.get("created", True) else "ok (already existed)"
+
+    async def archive_docs(self, drop: DocDrop) -> str:
+        """Copy the docs and tracker to processed/<unique-name>/"""
+        def copy() -> None:
+            target = self.processed_dir / drop.unique_name
+            target.mkdir(parents=True, exist_ok=True)
+            for item in drop.docs_dir.iterdir():
+                if item.is_dir():
+                    shutil.copytree(item, target / item.name, dirs_exist_ok=True)
+                else:
+                    shutil.copy2(item, target / item.name)
+            (target / "PROGRESS_TRACKER.md").write_text(drop.tracker)
+            drop.archive_dir = target
+        
+        await asyncio.get_running_loop().run_in_executor(None, copy)
+        return "ok"
+
+    async def push_initial_content(self, drop: DocDrop) -> str:
+        """Commit docs, tracker and a README to main through the Git Data API (no clone or git push)"""
+        if not drop.repo_created:
+            return "skipped: no repository"
+        
+        files = collect_files([str(drop.docs_dir)])
+        files["PROGRESS_TRACKER.md"] = drop.tracker.encode()
+        if "README.md" not in files:
+            files["README.md"] = (
+                f"# {drop.project_name}\n\nAuto-generated project from ideabrow-automation\n\n"
+                f"Created: {datetime.now().strftime('%a %b %d %H:%M:%S %Y')}\n"
+            ).encode()
+        
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: push_initial_content(drop.unique_name, files, self.org, INITIAL_COMMIT_MESSAGE,
+                                               author=COMMIT_AUTHOR, token=self.gh_token)
+        )
+        if not result.get("success"):
+            raise RuntimeError(f"{result.get('error')}: {result.get('message')}")
+        drop.pushed = True
+        return f"ok ({result['files']} files, {result['blobs_uploaded']} blobs)"
+
+    async def send_webhook(self, drop: DocDrop) -> str:
+        if not self.webhook_url:
+            return "skipped: no DEV_SERVER_WEBHOOK_URL"
+        
+        payload = {
+            "project_name": drop.unique_name,
+            "github_repo": drop.ssh_url(self.org),
+            "requirements_summary": self._requirements_summary(drop),
+            "progress_tracker_content": drop.tracker,
+            "starter_prompt": f"Let's build {drop.project_name}. Start by analyzing the template and requirements.",
+            "template_hint": TEMPLATE_HINT
+        }
+        response = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: requests.post(self.webhook_url, json=payload, timeout=WEBHOOK_TIMEOUT)
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(f"Webhook returned HTTP {response.status_code}: {response.text[:200]}")
+        drop.webhook_sent = True
+        return f"ok ({response.status_code})"
+
+    async def write_summary(self, drop: DocDrop) -> str:
+        """Write PROCESSING_SUMMARY.md (token-free repo URL), index the project and clear the drop if asked"""
+        if drop.archive_dir is None:
+            return "skipped: not archived"
+        
+        lines = [
+            "# Processing Summary",
+            "",
+            f"- **Project Name**: {drop.unique_name}",
+            f"- **Repository**: {drop.repo_url(self.org)}",
+            f"- **Processed At**: {datetime.now().strftime('%a %b %d %H:%M:%S %Y')}",
+            f"- **Webhook Sent**: {'Yes' if drop.webhook_sent else 'No'}",
+            f"- **Template**: {TEMPLATE_HINT}",
+            "",
+            "## Stage Timings",
+            ""
+        ]
+        for stage in self.stages:
+            if stage.name in drop.timings:
+                lines.append(f"- {stage.name}: {drop.timings[stage.name]:.2f}s ({drop.status.get(stage.name, '')})")
+        (drop.archive_dir / "PROCESSING_SUMMARY.md").write_text("\n".join(lines) + "\n")
+        
+        status = "ok"
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.index.add, drop.archive_dir)
+        except (sqlite3.Error, OSError) as e:
+            drop.errors["index"] = str(e)
+            status = "ok, not indexed"
+        
+        if self.clear_docs:
+            for item in drop.docs_dir.iterdir():
+                if item.is_dir():
+                    shutil.rmtree(item)
+                else:
+                    item.unlink()
+        return status
+    
+    # ---- helpers ------------------------------------------------------
+    
+    @property
+    def index(self) -> ProcessedIndex:
+        """SQLite catalog of the processed directory, opened on first use"""
+        if self._index is None:
+            self._index = ProcessedIndex(self.processed_dir)
+        return self._index
+
+    def _unique_name(self, project_name: str) -> str:
+        """<project>-<timestamp>, suffixed if another drop in this run got the same name"""
+        base = f"{project_name}-{datetime.now().strftime('%Y-%m-%d-%H%M%S')}"
+        name, n = base, 2
+        while name in self._names_in_use:
+            name, n = f"{base}-{n}", n + 1
+        self._names_in_use.add(name)
+        return name
+
+    def _requirements_summary(self, drop: DocDrop) -> str:
+        """First 500 characters of the first 100 lines of the first doc"""
+        files = drop.markdown_files()
+        if not files:
+            return ""
+        with open(files[0], errors='replace') as f:
+            head = "".join(line for _, line in zip(range(100), f))
+        return head[:500]
+    
+    # ---- scheduling ---------------------------------------------------
+
+    async def run_drop(self, drop: DocDrop) -> DocDrop:
+        """Run every stage for one drop, each as soon as its requirements are done"""
+        done: Dict[str, asyncio.Event] = {stage.name: asyncio.Event() for stage in self.stages}
+
+        async def run_stage(stage: Stage) -> None:
+            for name in stage.requires:
+                await done[name].wait()
+            if stage.name in self.skip:
+                drop.status[stage.name] = "skipped"
+                if stage.on_skip:
+                    stage.on_skip(drop)
+            else:
+                started = time.time()
+                try:
+                    drop.status[stage.name] = await stage.run(drop)
+                except Exception as e:
+                    drop.status[stage.name] = "failed"
+                    drop.errors[stage.name] = str(e)
+                drop.timings[stage.name] = time.time() - started
+            done[stage.name].set()
+        
+        await asyncio.gather(*(run_stage(stage) for stage in self.stages))
+        return drop
+
+    async def run(self, docs_dirs: List[Path]) -> List[DocDrop]:
+        """Process drops concurrently, at most `concurrency` at a time"""
+        if self.api_key and "tracker" not in self.skip:
+            try:
+                import generate_tracker_template_aware as tracker_gen
+                from llm_cache import create_llm_cache
+                self.tracker_client = tracker_gen.get_client(self.concurrency)
+                self.tracker_cache = create_llm_cache(enabled=self.use_cache)
+            except ImportError as e:
+                print(f"Warning: tracker generator unavailable ({e}), using fallback trackers")
+        
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def process(docs_dir: Path) -> DocDrop:
+            async with slots:
+                drop = await self.run_drop(DocDrop(docs_dir))
+            print(format_drop(drop, self.org), flush=True)
+            return drop
+        
+        try:
+            return await asyncio.gather(*(process(Path(d)) for d in docs_dirs))
+        finally:
+            if self.tracker_client:
+                await self.tracker_client.close()
+
+def format_drop(drop: DocDrop, org: str) -> str:
+    failed = [name for name, status in drop.status.items() if status == "failed"]
+    icon = "❌" if "tracker" in failed or "archive" in failed else ("⚠️ " if failed else "✅")
+    lines = [f"{icon} {drop.docs_dir} -> {drop.unique_name}  ({sum(drop.timings.values()):.1f}s)",
+             f"   Repository: {drop.repo_url(org) if drop.unique_name else '-'}"]
+    for name, status in drop.status.items():
+        error = f" - {drop.errors[name]}" if name in drop.errors else ""
+        lines.append(f"   {name:<8} {drop.timings.get(name, 0):6.2f}s  {status}{error}")
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description='Process doc drops into projects (tracker, repo, webhook, archive)')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    run_parser = subparsers.add_parser('run', help='Process one or more docs directories')
+    run_parser.add_argument('docs_dirs', nargs='+', help='Docs directories (each is one project)')
+    run_parser.add_argument('--org', default=DEFAULT_ORG, help=f'GitHub organization (default: {DEFAULT_ORG})')
+    run_parser.add_argument('--processed-dir', default='processed',
+                            help='Archive directory for processed docs (default: processed)')
+    run_parser.add_argument('--concurrency', type=int, default=4,
+                            help='Drops processed at once, and the API request limit (default: 4)')
+    run_parser.add_argument('--skip', type=str, default='',
+                            help='Comma-separated stages to skip, e.g. repo,push,webhook for a local dry run')
+    run_parser.add_argument('--clear-docs', action='store_true',
+                            help='Empty each docs directory after it is archived (as the workflow does)')
+    run_parser.add_argument('--chunked', action='store_true', help='Use chunked requirement analysis')
+    run_parser.add_argument('--no-cache', action='store_true', help='Do not reuse cached LLM responses')
+    run_parser.add_argument('--report', type=str, help='Append one JSON line per drop to this file')
+    run_parser.add_argument('--strict', action='store_true', help='Exit 1 if any stage failed')
+    
+    subparsers.add_parser('stages', help='List the stages and their dependencies')
+    
+    args = parser.parse_args()
+    
+    if args.command == 'stages':
+        for stage in DocsPipeline().stages:
+            print(f"{stage.name:<8} after: {', '.join(stage.requires) or '-'}")
+        return 0
+    if args.command != 'run':
+        parser.print_help()
+        return 1
+    
+    missing = [d for d in args.docs_dirs if not list(Path(d).glob("*.md"))]
+    for d in missing:
+        print(f"Skipping {d}: no markdown files")
+    docs_dirs = [Path(d) for d in args.docs_dirs if d not in missing]
+    if not docs_dirs:
+        return 0
+    
+    try:
+        pipeline = DocsPipeline(org=args.org, processed_dir=Path(args.processed_dir),
+                                concurrency=args.concurrency, clear_docs=args.clear_docs,
+                                skip=[s.strip() for s in args.skip.split(",") if s.strip()],
+                                chunked=args.chunked, use_cache=not args.no_cache)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    
+    print(f"Processing {len(docs_dirs)} drop(s), {pipeline.concurrency} at a time")
+    started = time.time()
+    drops = asyncio.run(pipeline.run(docs_dirs))
+    print(f"\nDone: {len(drops)} drop(s) in {time.time() - started:.1f}s")
+    
+    if args.report:
+        with open(args.report, 'a') as f:
+            for drop in drops:
+                f.write(json.dumps(drop.record(args.org)) + "\n")
+    
+    # Let the workflow name its commit after what was processed
+    github_output = os.getenv('GITHUB_OUTPUT')
+    if github_output:
+        with open(github_output, 'a') as f:
+            f.write(f"projects={' '.join(d.unique_name for d in drops if d.unique_name)}\n")
+    
+    if args.strict and any(drop.errors for drop in drops):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
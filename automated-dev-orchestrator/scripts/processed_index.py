@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Processed Projects Index - SQLite catalog of the processed/ archive
+Usage:
+    python3 processed_index.py recent [-n 10]
+    python3 processed_index.py search "dating app"
+    python3 processed_index.py duplicates
+    python3 processed_index.py find docs/*.md          # were these docs processed before?
+    python3 processed_index.py rebuild [--processed-dir processed]
+
+One row per processed/<project>/ directory (name, timestamps, repository,
+template, document count and size) plus one row per document with its
+SHA-256, so recent projects, keyword search and duplicate docs are single
+queries instead of a walk over the archive. process_docs_pipeline.py
+indexes each project as it archives it; `sync` picks up directories that
+arrived some other way (e.g. a git pull of processed/).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+INDEX_FILENAME = ".index.sqlite3"
+# Written by the pipeline alongside the documents; not documents themselves
+METADATA_FILES = {"PROCESSING_SUMMARY.md", "PROCESSING_INFO.md", "PROGRESS_TRACKER.md"}
+MAX_SEARCH_CHARS = 200_000
+NAME_TIMESTAMP = re.compile(r'^(?P<project>.+)-(?P<ts>\d{4}-\d{2}-\d{2}-\d{6})(?:-\d+)?$')
+SUMMARY_FIELD = re.compile(r'^-\s*\*\*(?P<key>[^*]+)\*\*:\s*(?P<value>.*)$', re.MULTILINE)
+DATE_FORMATS = ["%a %b %d %H:%M:%S %Z %Y", "%a %b %d %H:%M:%S %Y", "%Y-%m-%d-%H%M%S", "%Y-%m-%dT%H:%M:%S"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    project_name TEXT,
+    processed_at TEXT,
+    indexed_at REAL,
+    repository TEXT,
+    template TEXT,
+    webhook_sent INTEGER,
+    title TEXT,
+    doc_count INTEGER,
+    total_bytes INTEGER,
+    docs_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS projects_processed_at ON projects(processed_at);
+CREATE INDEX IF NOT EXISTS projects_docs_hash ON projects(docs_hash);
+CREATE TABLE IF NOT EXISTS documents (
+    project TEXT NOT NULL REFERENCES projects(name) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (project, path)
+);
+CREATE INDEX IF NOT EXISTS documents_sha256 ON documents(sha256);
+"""
+
+def strip_credentials(url: Optional[str]) -> Optional[str]:
+    """https://TOKEN@github.com/... -> https://github.com/... (older summaries recorded the push URL)"""
+    return re.sub(r'//[^/@\s]+@', '//', url) if url else url
+
+def parse_date(value: Optional[str]) -> Optional[str]:
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime((value or "").strip(), fmt).strftime("%Y-%m-%dT%H:%M:%S")
+        except ValueError:
+            continue
+    return None
+
+def read_fields(path: Path) -> Dict[str, str]:
+    """The `- **Key**: value` lines of PROCESSING_SUMMARY.md / PROCESSING_INFO.md"""
+    try:
+        text = path.read_text(errors='replace')
+    except OSError:
+        return {}
+    return {m.group("key").strip().lower(): m.group("value").strip() for m in SUMMARY_FIELD.finditer(text)}
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def scan_project(project_dir: Path) -> Dict[str, Any]:
+    """Everything the index stores about one processed/<project>/ directory"""
+    name = project_dir.name
+    summary = read_fields(project_dir / "PROCESSING_SUMMARY.md")
+    info = read_fields(project_dir / "PROCESSING_INFO.md")
+    match = NAME_TIMESTAMP.match(name)
+    
+    processed_at = (parse_date(match.group("ts")) if match else None) \
+        or parse_date(summary.get("processed at")) or parse_date(info.get("processed at")) \
+        or datetime.fromtimestamp(project_dir.stat().st_mtime).strftime("%Y-%m-%dT%H:%M:%S")
+    webhook = summary.get("webhook sent")
+    
+    documents = []
+    texts = [name]
+    for path in sorted(p for p in project_dir.rglob("*") if p.is_file()):
+        relative = path.relative_to(project_dir).as_posix()
+        if relative in METADATA_FILES:
+            if relative == "PROGRESS_TRACKER.md":
+                texts.append(path.read_text(errors='replace'))
+            continue
+        documents.append({"path": relative, "sha256": file_sha256(path), "size": path.stat().st_size})
+        if path.suffix in (".md", ".txt", ".bak"):
+            texts.append(path.read_text(errors='replace'))
+    
+    title = None
+    for text in texts[1:]:
+        heading = re.search(r'^#\s+(?:Project:\s*)?(.+)$', text, re.MULTILINE)
+        if heading:
+            # Older trackers were archived with literal "\n" escapes
+            title = heading.group(1).split("\\n")[0].strip()
+            break
+    
+    return {
+        "name": name,
+        "project_name": match.group("project") if match else (info.get("project name") or name),
+        "processed_at": processed_at,
+        "indexed_at": time.time(),
+        "repository": strip_credentials(summary.get("repository") or info.get("repository created")),
+        "template": summary.get("template"),
+        "webhook_sent": None if webhook is None else int(webhook.lower().startswith("y")),
+        "title": title,
+        "doc_count": len(documents),
+        "total_bytes": sum(d["size"] for d in documents),
+        # Same set of documents -> same hash, whatever the project was called
+        "docs_hash": hashlib.sha256("\n".join(sorted(d["sha256"] for d in documents)).encode()).hexdigest(),
+        "documents": documents,
+        "text": "\n".join(texts)[:MAX_SEARCH_CHARS]
+    }
+
+class ProcessedIndex:
+    """
+    SQLite index over a processed/ directory
+    
+    Connections are opened per operation (WAL mode, busy timeout), so
+    pipeline threads and separate CLI processes can share one index file.
+    Keyword search uses FTS5 when this SQLite has it, LIKE otherwise.
+    """
+
+    def __init__(self, processed_dir: Path, db_path: Optional[Path] = None):
+        self.processed_dir = Path(processed_dir)
+        self.db_path = Path(db_path or os.getenv('PROCESSED_INDEX_DB') or self.processed_dir / INDEX_FILENAME)
+        self.fts = False
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _init_schema(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(SCHEMA)
+            try:
+                conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS project_text USING fts5(name UNINDEXED, body)")
+            except sqlite3.OperationalError:
+                conn.execute("CREATE TABLE IF NOT EXISTS project_text (name TEXT PRIMARY KEY, body TEXT)")
+            # The file may have been created by a SQLite with (or without) FTS5
+            sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'project_text'").fetchone()[0]
+            self.fts = "fts5" in sql.lower()
+        conn.close()
+
+    def _write(self, conn: sqlite3.Connection, record: Dict[str, Any]) -> None:
+        self._delete(conn, record["name"])
+        columns = [k for k in record if k not in ("documents", "text")]
+        conn.execute(f"INSERT INTO projects ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                     [record[k] for k in columns])
+        conn.executemany("INSERT INTO documents (project, path, sha256, size) VALUES (?, ?, ?, ?)",
+                         [(record["name"], d["path"], d["sha256"], d["size"]) for d in record["documents"]])
+        conn.execute("INSERT INTO project_text (name, body) VALUES (?, ?)", (record["name"], record["text"]))
+
+    def _delete(self, conn: sqlite3.Connection, name: str) -> None:
+        conn.execute("DELETE FROM project_text WHERE name = ?", (name,))
+        conn.execute("DELETE FROM projects WHERE name = ?", (name,))
+
+    def add(self, project_dir: Path) -> Dict[str, Any]:
+        """Index (or re-index) one project directory"""
+        record = scan_project(Path(project_dir))
+        conn = self._connect()
+        with conn:
+            self._write(conn, record)
+        conn.close()
+        return record
+
+    def sync(self) -> Dict[str, int]:
+        """Index directories missing from the index and drop entries whose directory is gone"""
+        on_disk = {p.name: p for p in self.processed_dir.iterdir() if p.is_dir()} \
+            if self.processed_dir.exists() else {}
+        conn = self._connect()
+        indexed = {row["name"] for row in conn.execute("SELECT name FROM projects")}
+        added = [scan_project(on_disk[name]) for name in sorted(set(on_disk) - indexed)]
+        removed = indexed - set(on_disk)
+        with conn:
+            for record in added:
+                self._write(conn, record)
+            for name in removed:
+                self._delete(conn, name)
+        conn.close()
+        return {"added": len(added), "removed": len(removed), "total": len(on_disk)}
+
+    def rebuild(self) -> int:
+        """Re-scan every project directory from scratch"""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM project_text")
+            conn.execute("DELETE FROM projects")
+        conn.close()
+        return self.sync()["added"]
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        conn = self._connect()
+        rows = [dict(row) for row in conn.execute(sql, params)]
+        conn.close()
+        return rows
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        return self._query("SELECT * FROM projects ORDER BY processed_at DESC LIMIT ?", (limit,))
+
+    def search(self, keywords: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Projects whose name, tracker or documents contain every keyword (prefix match with FTS5)"""
+        terms = keywords.split()
+        if not terms:
+            return []
+        if self.fts:
+            query = " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+            return self._query("SELECT p.* FROM project_text t JOIN projects p ON p.name = t.name "
+                               "WHERE project_text MATCH ? ORDER BY t.rank LIMIT ?", (query, limit))
+        where = " AND ".join("t.body LIKE ?" for _ in terms)
+        return self._query(f"SELECT p.* FROM project_text t JOIN projects p ON p.name = t.name WHERE {where} "
+                           "ORDER BY p.processed_at DESC LIMIT ?", tuple(f"%{t}%" for t in terms) + (limit,))
+
+    def duplicates(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Identical documents filed under more than one project, and projects with the same set of docs"""
+        documents = self._query(
+            "SELECT sha256, MIN(size) AS size, COUNT(DISTINCT project) AS projects, "
+            "GROUP_CONCAT(project || ':' || path, '\n') AS locations "
+            "FROM documents GROUP BY sha256 HAVING COUNT(DISTINCT project) > 1 ORDER BY projects DESC, size DESC"
+        )
+        for row in documents:
+            row["locations"] = sorted(row["locations"].split("\n"))
+        projects = self._query(
+            "SELECT docs_hash, COUNT(*) AS copies, GROUP_CONCAT(name, '\n') AS names FROM projects "
+            "WHERE doc_count > 0 GROUP BY docs_hash HAVING COUNT(*) > 1 ORDER BY copies DESC"
+        )
+        for row in projects:
+            row["names"] = sorted(row["names"].split("\n"))
+        return {"documents": documents, "projects": projects}
+
+    def find_document(self, sha256: str) -> List[Dict[str, Any]]:
+        """Projects that contain a document with this hash"""
+        return self._query("SELECT p.name, p.processed_at, d.path FROM documents d "
+                           "JOIN projects p ON p.name = d.project WHERE d.sha256 = ? "
+                           "ORDER BY p.processed_at DESC", (sha256,))
+
+def format_project(row: Dict[str, Any]) -> str:
+    size = f"{row['total_bytes'] / 1024:.1f} KB"
+    repo = row.get("repository") or "-"
+    return f"📦 {row['processed_at'][:16].replace('T', ' ')}  {row['name']}  ({row['doc_count']} docs, {size})  {repo}"
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite index of processed projects')
+    parser.add_argument('--processed-dir', default='processed', help='Processed archive (default: processed)')
+    parser.add_argument('--db', type=str, help=f'Index file (default: <processed-dir>/{INDEX_FILENAME})')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--no-sync', action='store_true', help='Query without indexing new directories first')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    recent_parser = subparsers.add_parser('recent', help='Most recently processed projects')
+    recent_parser.add_argument('-n', type=int, default=10, help='How many (default: 10)')
+    search_parser = subparsers.add_parser('search', help='Projects matching all keywords')
+    search_parser.add_argument('keywords', nargs='+')
+    search_parser.add_argument('-n', type=int, default=20, help='Maximum results (default: 20)')
+    subparsers.add_parser('duplicates', help='Documents and document sets processed more than once')
+    find_parser = subparsers.add_parser('find', help='Projects that already contain these files')
+    find_parser.add_argument('files', nargs='+')
+    add_parser = subparsers.add_parser('add', help='Index (or re-index) project directories')
+    add_parser.add_argument('dirs', nargs='+')
+    subparsers.add_parser('sync', help='Index new directories, drop deleted ones')
+    subparsers.add_parser('rebuild', help='Rebuild the whole index')
+    
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return 1
+    
+    index = ProcessedIndex(Path(args.processed_dir), Path(args.db) if args.db else None)
+    if args.command == 'rebuild':
+        started = time.time()
+        count = index.rebuild()
+        print(f"✅ Indexed {count} project(s) in {time.time() - started:.2f}s -> {index.db_path}")
+        return 0
+    if args.command == 'sync':
+        print(f"✅ {json.dumps(index.sync())}")
+        return 0
+    if args.command == 'add':
+        for d in args.dirs:
+            record = index.add(Path(d))
+            print(f"✅ {record['name']} ({record['doc_count']} docs)")
+        return 0
+    
+    if not args.no_sync:
+        index.sync()
+    
+    if args.command == 'duplicates':
+        result = index.duplicates()
+        if args.json:
+            print(json.dumps(result, indent=2))
+            return 0
+        print(f"Identical document sets: {len(result['projects'])}")
+        for row in result["projects"]:
+            print(f"  🔁 {', '.join(row['names'])}")
+        print(f"\nDocuments in more than one project: {len(result['documents'])}")
+        for row in result["documents"]:
+            print(f"  {row['sha256'][:12]}  {row['size']} bytes  x{row['projects']}")
+            for location in row["locations"]:
+                print(f"      {location}")
+        return 0
+    
+    if args.command == 'find':
+        found_any = False
+        for f in args.files:
+            matches = index.find_document(file_sha256(Path(f)))
+            found_any = found_any or bool(matches)
+            print(f"{'🔁' if matches else '🆕'} {f}")
+            for row in matches:
+                print(f"      {row['processed_at'][:16].replace('T', ' ')}  {row['name']}:{row['path']}")
+        return 0 if found_any else 1
+    
+    rows = index.recent(args.n) if args.command == 'recent' else index.search(" ".join(args.keywords), args.n)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    elif not rows:
+        print("No matching projects")
+    else:
+        for row in rows:
+            print(format_project(row))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -97,7 +97,7 @@ execute_cmd() {
 echo -e "${BOLD}1. Checking for duplicate scheduled phases...${NC}"
 
 # Find all scheduled phase processes
-PHASE_PROCS=$(ps aux | grep -E "sleep.*PHASE" | grep -v grep)
+PHASE_PROCS=$(ps aux | grep -E "sleep.*(PHASE|--source phase-)" | grep -v grep)
 
 if [ ! -z "$PHASE_PROCS" ]; then
     # Build associative array of project-phase combinations
@@ -107,9 +107,9 @@ if [ ! -z "$PHASE_PROCS" ]; then
         PID=$(echo "$line" | awk '{print $2}')
         
         # Extract project and phase
-        if [[ "$line" =~ ([^[:space:]]+):0.*PHASE[[:space:]]+([0-9]+) ]]; then
+        if [[ "$line" =~ ([^[:space:]]+):0.*(PHASE[[:space:]]+|phase-)([0-9]+) ]]; then
             PROJECT="${BASH_REMATCH[1]}"
-            PHASE="${BASH_REMATCH[2]}"
+            PHASE="${BASH_REMATCH[3]}"
             KEY="${PROJECT}-phase-${PHASE}"
             
             if [ ! -z "${phase_pids[$KEY]}" ]; then
@@ -285,7 +285,7 @@ echo ""
 # Show current status
 echo -e "${BOLD}Current System Status:${NC}"
 ACTIVE_SESSIONS=$(tmux list-sessions 2>/dev/null | wc -l)
-SCHEDULED_PHASES=$(ps aux | grep -E "sleep.*PHASE" | grep -v grep | wc -l)
+SCHEDULED_PHASES=$(ps aux | grep -E "sleep.*(PHASE|--source phase-)" | grep -v grep | wc -l)
 STATE_FILES=$(ls -1 "$STATE_DIR"/*.json 2>/dev/null | wc -l)
 
 echo -e "  • Active tmux sessions: $ACTIVE_SESSIONS"
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+IdeaBrow Pipeline - Filesystem Change Watching
+inotify-based change notification (with a stat-polling fallback) and
+parse caches keyed by file mtime and size
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+# inotify constants (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+def stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+class ParseCache:
+    """
+    Cache of parsed files keyed by (mtime, size)
+
+    get() only re-reads a file when its stat key changed since the last
+    read. Parse errors are cached too and re-raised until the file changes.
+    Safe to share between threads.
+    """
+
+    def __init__(self, loader: Callable = json.load, mode: str = 'r'):
+        self.loader = loader
+        self.mode = mode
+        self.entries: Dict[Path, tuple] = {}
+        self.generation = 0
+        self._lock = threading.RLock()
+
+    def get(self, path: Path):
+        """Return the parsed contents of path, re-parsing only if it changed"""
+        with self._lock:
+            self.refresh(path)
+            entry = self.entries.get(Path(path))
+        if entry is None:
+            raise FileNotFoundError(path)
+        _, value, error = entry
+        if error:
+            raise error
+        return value
+
+    def refresh(self, path: Path) -> bool:
+        """Re-read path if its stat key changed; return True if the parsed data changed"""
+        with self._lock:
+            return self._refresh(Path(path))
+
+    def _refresh(self, path: Path) -> bool:
+        key = stat_key(path)
+        entry = self.entries.get(path)
+
+        if key is None:
+            if entry is None:
+                return False
+            del self.entries[path]
+            self.generation += 1
+            return True
+
+        if entry is not None and entry[0] == key:
+            return False
+
+        value, error = None, None
+        try:
+            with open(path, self.mode) as f:
+                value = self.loader(f)
+        except (OSError, ValueError) as e:
+            error = e
+
+        changed = entry is None or entry[1] != value or type(entry[2]) != type(error)
+        self.entries[path] = (key, value, error)
+        if changed:
+            self.generation += 1
+        return changed
+
+class FileWatcher:
+    """
+    Waits for changes to a set of directories and files
+
+    Uses inotify on Linux; individual files are watched through their parent
+    directory so log rotation and atomic replace-by-rename are seen. Falls
+    back to polling stat() of the watched paths when inotify is unavailable.
+    """
+
+    def __init__(self, paths: Iterable[Path], poll_interval: float = 1.0):
+        self.dirs: Dict[Path, Optional[Set[str]]] = {}
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                self.dirs[path] = None  # every entry in the directory
+            else:
+                names = self.dirs.setdefault(path.parent, set())
+                if names is not None:
+                    names.add(path.name)
+
+        self.poll_interval = poll_interval
+        self.fd = None
+        self.wds: Dict[int, Path] = {}
+        self._snapshot: Dict[Path, Optional[Tuple[int, int]]] = {}
+
+        self._init_inotify()
+        if self.fd is None:
+            self._snapshot = self._scan()
+
+    @property
+    def using_inotify(self) -> bool:
+        return self.fd is not None
+
+    def _init_inotify(self):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            return
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+
+        for directory in self.dirs:
+            if not directory.is_dir():
+                continue
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self.wds[wd] = directory
+
+        if not self.wds:
+            os.close(fd)
+            return
+        self.fd = fd
+
+    def _wanted(self, directory: Path, name: str) -> bool:
+        names = self.dirs.get(directory)
+        return names is None or name in names
+
+    def _scan(self) -> Dict[Path, Optional[Tuple[int, int]]]:
+        snapshot = {}
+        for directory, names in self.dirs.items():
+            if names is None:
+                try:
+                    entries = [Path(e.path) for e in os.scandir(directory)]
+                except OSError:
+                    entries = []
+            else:
+                entries = [directory / name for name in names]
+            for path in entries:
+                snapshot[path] = stat_key(path)
+        return snapshot
+
+    def _read_events(self) -> Set[Path]:
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+                offset += length
+                directory = self.wds.get(wd)
+                if directory is not None and name and self._wanted(directory, name):
+                    changed.add(directory / name)
+        return changed
+
+    def wait(self, timeout: float) -> Set[Path]:
+        """Block up to timeout seconds; return the paths that changed (empty on timeout)"""
+        if self.fd is not None:
+            readable, _, _ = select.select([self.fd], [], [], max(0, timeout))
+            return self._read_events() if readable else set()
+
+        deadline = time.monotonic() + max(0, timeout)
+        while True:
+            snapshot = self._scan()
+            changed = {p for p in set(snapshot) | set(self._snapshot)
+                       if snapshot.get(p) != self._snapshot.get(p)}
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.poll_interval, remaining))
+
+    def gather(self, duration: float) -> Set[Path]:
+        """Collect every change seen over the next duration seconds"""
+        changed = set()
+        deadline = time.monotonic() + duration
+        remaining = duration
+        while remaining > 0:
+            changed |= self.wait(remaining)
+            remaining = deadline - time.monotonic()
+        return changed
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
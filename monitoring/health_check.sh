@@ -142,7 +142,7 @@ echo ""
 echo -e "${BOLD}5. Process Cleanup Check...${NC}"
 
 # Check for duplicate scheduled phases
-DUPLICATE_COUNT=$(ps aux | grep -E "sleep.*(send-claude-message|PHASE)" | grep -v grep | awk '{print $NF}' | sort | uniq -c | awk '$1 > 1' | wc -l)
+DUPLICATE_COUNT=$(ps aux | grep -E "sleep.*(send-claude-message|message_dispatcher|PHASE)" | grep -v grep | awk '{print $NF}' | sort | uniq -c | awk '$1 > 1' | wc -l)
 if [ "$DUPLICATE_COUNT" -eq "0" ]; then
     echo -e "   ${GREEN}✅ No duplicate scheduled processes${NC}"
 else
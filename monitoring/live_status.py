@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+IdeaBrow Pipeline - Live Status Client
+Renders the webhook server's /events stream; any number of viewers share the server's single collector
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from term_render import FrameRenderer, strip_ansi
+
+DEFAULT_URL = f"http://localhost:{os.environ.get('WEBHOOK_PORT', 8090)}/events"
+
+# ANSI color codes
+class Colors:
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+    DIM = '\033[2m'
+
+def read_events(response) -> Iterator[Tuple[str, str]]:
+    """Parse a text/event-stream response into (event, data) pairs"""
+    kind, data = 'message', []
+    for raw in response:
+        line = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+        if not line:
+            if data:
+                yield kind, '\n'.join(data)
+            kind, data = 'message', []
+        elif line.startswith(':'):
+            continue  # keepalive comment
+        else:
+            field, _, value = line.partition(':')
+            value = value[1:] if value.startswith(' ') else value
+            if field == 'event':
+                kind = value
+            elif field == 'data':
+                data.append(value)
+
+class LiveStatus:
+    """Client-side copy of the server state, kept current by applying deltas"""
+
+    def __init__(self, url: str = DEFAULT_URL, low_bandwidth: bool = False):
+        self.url = url
+        self.low_bandwidth = low_bandwidth
+        self.state: Dict[str, Dict] = {'sessions': {}, 'phases': {}, 'queue': {}}
+        self.errors = deque(maxlen=20)
+        self.transitions = deque(maxlen=5)
+        self.connected = False
+        self.events_received = 0
+        self.last_event: Optional[datetime] = None
+        self.renderer: Optional[FrameRenderer] = None
+
+    def apply(self, kind: str, data: Dict):
+        """Update local state from one event"""
+        self.events_received += 1
+        self.last_event = datetime.now()
+        if kind == 'snapshot':
+            for section in self.state:
+                self.state[section] = data.get(section, {})
+            self.errors.clear()
+            self.errors.extend(data.get('errors', []))
+        elif kind in self.state:
+            section = self.state[kind]
+            section.update(data.get('added', {}))
+            section.update(data.get('changed', {}))
+            for key in data.get('removed', []):
+                section.pop(key, None)
+            self.transitions.extend(data.get('transitions', []))
+        elif kind == 'error':
+            self.errors.append(data)
+
+    def build_frame(self) -> List[str]:
+        out = []
+        status = f"{Colors.GREEN}● connected{Colors.ENDC}" if self.connected else f"{Colors.RED}○ reconnecting{Colors.ENDC}"
+        out.append(f"{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
+        out.append(f"{Colors.BOLD}{Colors.CYAN}          IDEABROW PIPELINE - LIVE STATUS{Colors.ENDC}  {status}")
+        out.append(f"{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
+        out.append(f"{Colors.DIM}{self.url} | {self.events_received} events | Press Ctrl+C to exit{Colors.ENDC}")
+        out.append("")
+
+        sessions = self.state['sessions']
+        phases = self.state['phases']
+        out.append(f"{Colors.BOLD}{Colors.GREEN}📂 SESSIONS ({len(sessions)}){Colors.ENDC}")
+        now = time.time()
+        for name in sorted(sessions):
+            info = sessions[name]
+            idle = ""
+            if info.get('last_activity'):
+                idle = f"idle {int(max(0, now - info['last_activity']) // 60)}m"
+            phase = phases.get(name)
+            phase_text = f"Phase {phase['phase']} - {phase.get('name', '')}" if phase else ""
+            if phase and phase.get('status') == 'completed':
+                phase_text = f"{Colors.GREEN}✅ all phases done{Colors.ENDC}"
+            out.append(f"  • {name[:40]:<40} {phase_text[:34]:<34} {Colors.DIM}{idle}{Colors.ENDC}")
+        if not sessions:
+            out.append(f"  {Colors.DIM}No active sessions{Colors.ENDC}")
+
+        scheduled = sorted(self.state['queue'].values(), key=lambda x: x.get('fires_at', ''))
+        out.append("")
+        out.append(f"{Colors.BOLD}{Colors.YELLOW}⏰ SCHEDULED PHASES ({len(scheduled)}){Colors.ENDC}")
+        for item in scheduled[:5]:
+            out.append(f"  • {item.get('project')} Phase {item.get('phase') or '?'} at {item.get('fires_at', '?')[11:16]}")
+        if not scheduled:
+            out.append(f"  {Colors.DIM}No phases scheduled{Colors.ENDC}")
+
+        if self.transitions:
+            out.append("")
+            out.append(f"{Colors.BOLD}{Colors.CYAN}📢 PHASE CHANGES{Colors.ENDC}")
+            for t in self.transitions:
+                out.append(f"  🚀 {t['project']}: Phase {t['from']} → {t['to']} {t.get('name') or ''}")
+
+        if self.errors:
+            out.append("")
+            out.append(f"{Colors.BOLD}{Colors.RED}⚠️  RECENT ERRORS{Colors.ENDC}")
+            for error in list(self.errors)[-5:]:
+                out.append(f"  {Colors.RED}{error.get('time', '')[11:]} {error.get('message', '')[:90]}{Colors.ENDC}")
+
+        return out
+
+    def draw(self):
+        lines = self.build_frame()
+        if self.renderer:
+            self.renderer.render(lines)
+        else:
+            output = "\n".join(lines)
+            print(strip_ansi(output) if self.low_bandwidth else output)
+
+    def run(self, raw: bool = False, once: bool = False, max_backoff: float = 30.0):
+        """Follow the stream, reconnecting with backoff; raw prints events as JSON lines"""
+        if not raw and not once:
+            self.renderer = FrameRenderer(low_bandwidth=self.low_bandwidth)
+        backoff = 1.0
+        try:
+            while True:
+                try:
+                    request = urllib.request.Request(self.url, headers={'Accept': 'text/event-stream'})
+                    with urllib.request.urlopen(request, timeout=60) as response:
+                        self.connected = True
+                        backoff = 1.0
+                        for kind, data in read_events(response):
+                            payload = json.loads(data)
+                            if raw:
+                                print(json.dumps({'event': kind, 'data': payload}), flush=True)
+                                continue
+                            self.apply(kind, payload)
+                            self.draw()
+                            if once:
+                                return 0
+                except (urllib.error.URLError, OSError, ValueError) as e:
+                    if once:
+                        print(f"Cannot read {self.url}: {e}", file=sys.stderr)
+                        return 1
+                self.connected = False
+                if self.renderer:
+                    self.draw()
+                time.sleep(backoff)
+                backoff = min(max_backoff, backoff * 2)
+        except KeyboardInterrupt:
+            return 0
+        finally:
+            if self.renderer:
+                self.renderer.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Live pipeline status from the webhook server event stream')
+    parser.add_argument('--url', default=DEFAULT_URL,
+                       help=f'Event stream URL (default: {DEFAULT_URL})')
+    parser.add_argument('--raw', action='store_true',
+                       help='Print events as JSON lines instead of drawing a dashboard')
+    parser.add_argument('--once', action='store_true',
+                       help='Print the current snapshot and exit')
+    parser.add_argument('--low-bandwidth', action='store_true',
+                       help='No colors - for watching over slow SSH links')
+    args = parser.parse_args()
+
+    return LiveStatus(args.url, args.low_bandwidth).run(raw=args.raw, once=args.once)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+IdeaBrow Pipeline - Metrics Recorder
+The single writer of the metric history in state/metrics - the dashboards only read it
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+from pipeline_monitor import PipelineMonitor
+from system_probes import disk_usage_percent, memory_usage_percent
+
+class MetricsRecorder:
+    """
+    Samples sessions, queued phases, webhook traffic, dispatch delay, memory
+    and disk at a fixed interval, whether or not anyone is watching
+
+    Only the process holding the store's writer lock records, so starting a
+    second recorder is harmless and counters are never double counted.
+    """
+
+    def __init__(self, monitor: Optional[PipelineMonitor] = None):
+        self.monitor = monitor or PipelineMonitor(low_bandwidth=True)
+        self.metrics = self.monitor.metrics
+        self.state_dir = self.monitor.state_dir
+        self._log_counts: Optional[Dict[str, int]] = None
+        self._dispatch_offset: Optional[int] = None
+
+    def sample(self) -> Dict[str, Optional[float]]:
+        """One reading of every metric; None where nothing is known yet"""
+        monitor = self.monitor
+
+        # Webhooks and errors are counts of new log entries; the first sample
+        # only sets the baseline so the initial tail is not a spike
+        try:
+            monitor.webhook_log.refresh()
+        except Exception:
+            pass
+        counts = dict(monitor.webhook_log.counts)
+        if self._log_counts is None:
+            new_webhooks = new_errors = None
+        else:
+            new_webhooks = counts.get('webhook', 0) - self._log_counts.get('webhook', 0)
+            new_errors = counts.get('error', 0) - self._log_counts.get('error', 0)
+        self._log_counts = counts
+
+        try:
+            disk_pct = disk_usage_percent(monitor.pipeline_dir)
+        except OSError:
+            disk_pct = None
+        try:
+            memory_pct = memory_usage_percent()
+        except (OSError, ValueError):
+            memory_pct = None
+
+        return {
+            'sessions': len(monitor.get_active_projects()),
+            'queue_depth': len(monitor.get_scheduled_phases()),
+            'memory_pct': memory_pct,
+            'disk_pct': disk_pct,
+            'webhooks': new_webhooks,
+            'errors': new_errors,
+            'dispatch_delay': self._new_dispatch_delay(),
+        }
+
+    def record(self):
+        """Append one sample to the metric history"""
+        if self.state_dir.exists():
+            self.metrics.record_many(self.sample())
+
+    def _new_dispatch_delay(self) -> Optional[float]:
+        """Mean delay of messages dispatched since the last sample, from dispatch_metrics.jsonl"""
+        metrics_file = self.state_dir / "dispatch_metrics.jsonl"
+        try:
+            size = metrics_file.stat().st_size
+        except OSError:
+            # Not created yet - everything written to it later is new
+            self._dispatch_offset = 0
+            return None
+        if self._dispatch_offset is None or size < self._dispatch_offset:
+            # First sample (or file rotated) - start from the end
+            self._dispatch_offset = size
+            return None
+
+        delays: List[float] = []
+        with open(metrics_file, 'rb') as f:
+            f.seek(self._dispatch_offset)
+            chunk = f.read(size - self._dispatch_offset)
+        # Only consume complete lines; a partial write is picked up next time
+        complete = chunk[:chunk.rfind(b'\n') + 1]
+        self._dispatch_offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                delays.append(float(json.loads(line)['delay_seconds']))
+            except (ValueError, KeyError, TypeError):
+                continue
+        return sum(delays) / len(delays) if delays else None
+
+    def run(self, interval: float = 5):
+        """Record every interval seconds until interrupted"""
+        while True:
+            started = time.time()
+            self.record()
+            time.sleep(max(0.0, interval - (time.time() - started)))
+
+def main():
+    parser = argparse.ArgumentParser(description='IdeaBrow Pipeline Metrics Recorder')
+    parser.add_argument('-i', '--interval', type=float, default=5,
+                        help='Seconds between samples (default: 5)')
+    parser.add_argument('--once', action='store_true',
+                        help='Record a single sample and exit')
+    args = parser.parse_args()
+
+    recorder = MetricsRecorder()
+    if not recorder.metrics.claim_writer():
+        print(f"Another metrics recorder is already writing {recorder.metrics.directory}", file=sys.stderr)
+        return 0 if args.once else 1
+
+    try:
+        if args.once:
+            recorder.record()
+        else:
+            recorder.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        recorder.metrics.close()
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+IdeaBrow Pipeline - Metrics History Store
+Compact on-disk time series: fixed-size ring buffers per metric at 1s, 1m and 1h resolution
+"""
+
+import fcntl
+import mmap
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# (bucket width in seconds, number of buckets): 1 hour of seconds, 1 day of minutes, 30 days of hours
+RESOLUTIONS = ((1, 3600), (60, 1440), (3600, 720))
+
+# Gauges report the mean of samples in a bucket, counters the sum
+METRICS = {
+    'sessions': 'gauge',
+    'queue_depth': 'gauge',
+    'memory_pct': 'gauge',
+    'disk_pct': 'gauge',
+    'webhooks': 'counter',
+    'errors': 'counter',
+    'dispatch_delay': 'gauge',
+}
+
+METRIC_LABELS = {
+    'sessions': 'Sessions',
+    'queue_depth': 'Queued phases',
+    'memory_pct': 'Memory %',
+    'disk_pct': 'Disk %',
+    'webhooks': 'Webhooks',
+    'errors': 'Errors',
+    'dispatch_delay': 'Dispatch delay',
+}
+
+SPARK_CHARS = '▁▂▃▄▅▆▇█'
+SLOT_FIELDS = 3  # bucket number, sum, sample count
+
+def parse_duration(text: str) -> int:
+    """Parse '90s', '30m', '6h', '2d' (or plain seconds) into seconds"""
+    match = re.fullmatch(r'\s*(\d+)\s*([smhd]?)\s*', text)
+    if not match:
+        raise ValueError(f"Invalid duration: {text}")
+    value, unit = int(match.group(1)), match.group(2) or 's'
+    return value * {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[unit]
+
+def sparkline(values: List[Optional[float]]) -> str:
+    """Render values as a unicode sparkline; gaps (None) become spaces"""
+    present = [v for v in values if v is not None]
+    if not present:
+        return ' ' * len(values)
+    low, high = min(present), max(present)
+    span = (high - low) or 1
+    chars = []
+    for v in values:
+        if v is None:
+            chars.append(' ')
+        else:
+            chars.append(SPARK_CHARS[int((v - low) / span * (len(SPARK_CHARS) - 1))])
+    return ''.join(chars)
+
+def format_duration(seconds: float) -> str:
+    """Inverse of parse_duration for display ('3600' -> '1h')"""
+    for unit, size in (('d', 86400), ('h', 3600), ('m', 60)):
+        if seconds >= size and seconds % size == 0:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+class RingSeries:
+    """
+    One metric at one resolution, stored as a memory-mapped array of doubles
+
+    Each slot holds (bucket number, sum, count). A slot whose bucket number
+    does not match the bucket being read is stale and treated as empty, so
+    the ring never needs to be cleared.
+    """
+
+    def __init__(self, path: Path, step: int, slots: int, writable: bool):
+        self.path = path
+        self.step = step
+        self.slots = slots
+        size = slots * SLOT_FIELDS * 8
+
+        if writable:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if os.fstat(fd).st_size != size:
+                    os.ftruncate(fd, size)
+                self._mm = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+        else:
+            with open(path, 'rb') as f:
+                self._mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        self.data = memoryview(self._mm).cast('d')
+
+    def add(self, ts: float, value: float):
+        bucket = int(ts // self.step)
+        base = (bucket % self.slots) * SLOT_FIELDS
+        if self.data[base] != bucket:
+            self.data[base] = bucket
+            self.data[base + 1] = value
+            self.data[base + 2] = 1
+        else:
+            self.data[base + 1] += value
+            self.data[base + 2] += 1
+
+    def read(self, start_bucket: int, end_bucket: int) -> List[Optional[Tuple[float, float]]]:
+        """(sum, count) per bucket in [start, end]; None where nothing was recorded"""
+        out = []
+        for bucket in range(start_bucket, end_bucket + 1):
+            base = (bucket % self.slots) * SLOT_FIELDS
+            if self.data[base] == bucket and self.data[base + 2] > 0:
+                out.append((self.data[base + 1], self.data[base + 2]))
+            else:
+                out.append(None)
+        return out
+
+    def close(self):
+        self.data.release()
+        self._mm.close()
+
+class MetricsStore:
+    """
+    Multi-resolution history of pipeline metrics
+
+    Every sample is added to each resolution's ring, so a query can be served
+    from the finest ring that still covers the requested window. Files are
+    memory-mapped and updated in place, so a dashboard reading the store sees
+    the recorder's writes without any flush step. Slot updates are not atomic,
+    so only the process holding the writer lock (claim_writer) records.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._series: Dict[Tuple[str, int, bool], RingSeries] = {}
+        self._writer_lock = None
+
+    def claim_writer(self) -> bool:
+        """Take the store's exclusive writer lock; False if another process holds it"""
+        if self._writer_lock is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            lock = open(self.directory / 'writer.lock', 'w')
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                return False
+            self._writer_lock = lock
+        return True
+
+    def _ring(self, metric: str, step: int, slots: int, writable: bool) -> Optional[RingSeries]:
+        key = (metric, step, writable)
+        if key not in self._series:
+            path = self.directory / f"{metric}.{step}s.ring"
+            if not writable and not path.exists():
+                return None
+            try:
+                self._series[key] = RingSeries(path, step, slots, writable)
+            except (OSError, ValueError):
+                return None
+        return self._series[key]
+
+    def record(self, metric: str, value: float, ts: Optional[float] = None):
+        """Add one sample to every resolution of a metric"""
+        ts = time.time() if ts is None else ts
+        for step, slots in RESOLUTIONS:
+            ring = self._ring(metric, step, slots, writable=True)
+            if ring:
+                ring.add(ts, float(value))
+
+    def record_many(self, samples: Dict[str, float], ts: Optional[float] = None):
+        ts = time.time() if ts is None else ts
+        for metric, value in samples.items():
+            if value is not None:
+                self.record(metric, value, ts)
+
+    def query(self, metric: str, since: float, now: Optional[float] = None) -> Tuple[int, List[Optional[float]]]:
+        """
+        Values for the last `since` seconds from the finest covering resolution
+        Returns (bucket width, values oldest first) - gauges as means, counters as sums.
+        """
+        now = time.time() if now is None else now
+        step, slots = next(((s, n) for s, n in RESOLUTIONS if s * n >= since), RESOLUTIONS[-1])
+        ring = self._ring(metric, step, slots, writable=False)
+        buckets = min(slots, max(1, int(since // step)))
+        if ring is None:
+            return step, [None] * buckets
+
+        end = int(now // step)
+        counter = METRICS.get(metric) == 'counter'
+        values = []
+        for entry in ring.read(end - buckets + 1, end):
+            if entry is None:
+                values.append(0.0 if counter else None)
+            else:
+                total, count = entry
+                values.append(total if counter else total / count)
+        return step, values
+
+    def series(self, metric: str, since: float, width: int = 40, now: Optional[float] = None) -> List[Optional[float]]:
+        """Query a window and downsample it to at most width points"""
+        _, values = self.query(metric, since, now)
+        if len(values) <= width:
+            return values
+        counter = METRICS.get(metric) == 'counter'
+        out = []
+        for i in range(width):
+            chunk = [v for v in values[i * len(values) // width:(i + 1) * len(values) // width] if v is not None]
+            if not chunk:
+                out.append(None)
+            else:
+                out.append(sum(chunk) if counter else sum(chunk) / len(chunk))
+        return out
+
+    def summary(self, metric: str, since: float, now: Optional[float] = None) -> Dict:
+        """min / avg / max / last over a window, plus the bucket width used"""
+        step, values = self.query(metric, since, now)
+        present = [v for v in values if v is not None]
+        if not present:
+            return {'metric': metric, 'step': step, 'samples': 0}
+        return {
+            'metric': metric,
+            'step': step,
+            'samples': len(present),
+            'min': min(present),
+            'avg': sum(present) / len(present),
+            'max': max(present),
+            'last': present[-1],
+            'total': sum(present) if METRICS.get(metric) == 'counter' else None,
+        }
+
+    def history(self, metrics: List[str], since: float, width: int = 40) -> List[Dict]:
+        """Sparkline and summary per metric, for the dashboards' history sections"""
+        rows = []
+        for metric in metrics:
+            row = self.summary(metric, since)
+            row['label'] = METRIC_LABELS.get(metric, metric)
+            row['spark'] = sparkline(self.series(metric, since, width))
+            rows.append(row)
+        return rows
+
+    def close(self):
+        for ring in self._series.values():
+            ring.close()
+        self._series.clear()
+        if self._writer_lock is not None:
+            self._writer_lock.close()
+            self._writer_lock = None
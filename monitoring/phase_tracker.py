@@ -9,12 +9,17 @@ import json
 import time
 import sys
 import os
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 import argparse
 import signal
 
+from fs_watch import FileWatcher, ParseCache
+from metrics_store import MetricsStore, format_duration, parse_duration
+from term_render import FrameRenderer, strip_ansi
+
 # ANSI color codes
 class Colors:
     HEADER = '\033[95m'
@@ -32,11 +37,16 @@ class Colors:
     SPINNER = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
 
 class PhaseTracker:
-    def __init__(self):
+    def __init__(self, low_bandwidth: bool = False):
         self.state_dir = Path("/home/wv3/ideabrow-pipeline/webhook-server/state")
         self.spinner_index = 0
         self.last_update = {}
         self.phase_history = {}
+        self.json_cache = ParseCache()
+        self.low_bandwidth = low_bandwidth
+        self.renderer: Optional[FrameRenderer] = None
+        self.metrics = MetricsStore(self.state_dir / "metrics")
+        self.history_window = 3600
         
     def get_project_phases(self, project_name: str) -> Optional[Dict]:
         """Get current phase information for a project"""
@@ -46,8 +56,7 @@ class PhaseTracker:
             return None
             
         try:
-            with open(tracker_file) as f:
-                tracker = json.load(f)
+            tracker = self.json_cache.get(tracker_file)
                 
             phases = tracker.get('phases', [])
             
@@ -72,14 +81,22 @@ class PhaseTracker:
         except Exception as e:
             return None
     
+    def get_predicted_completion(self, project_name: str) -> Optional[datetime]:
+        """Completion time predicted by the phase scheduler, if any"""
+        schedule_file = self.state_dir / f"{project_name}_schedule.json"
+        try:
+            return datetime.fromisoformat(self.json_cache.get(schedule_file)['predicted_completion'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
     def get_active_projects(self) -> List[str]:
         """Get list of active project sessions"""
         try:
             result = subprocess.run(
                 ["tmux", "list-sessions", "-F", "#{session_name}"],
-                capture_output=True,
-                text=True,
-                stderr=subprocess.DEVNULL
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
             
             sessions = []
@@ -88,9 +105,9 @@ class PhaseTracker:
                     # Verify Claude is running
                     pane_check = subprocess.run(
                         ["tmux", "list-panes", "-t", f"{session}:0", "-F", "#{pane_current_command}"],
-                        capture_output=True,
-                        text=True,
-                        stderr=subprocess.DEVNULL
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True
                     )
                     if 'claude' in pane_check.stdout.lower():
                         sessions.append(session)
@@ -105,9 +122,9 @@ class PhaseTracker:
         try:
             result = subprocess.run(
                 ["tmux", "capture-pane", "-t", f"{project_name}:0", "-p", "-S", f"-{lines}"],
-                capture_output=True,
-                text=True,
-                stderr=subprocess.DEVNULL
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
             
             if result.stdout:
@@ -167,25 +184,32 @@ class PhaseTracker:
         self.last_update[project] = current_data
         return None
     
-    def display_tracker(self, show_activity: bool = False):
-        """Display the phase tracker dashboard"""
-        os.system('clear')
+    def build_tracker_frame(self, show_activity: bool = False) -> List[str]:
+        """Build the phase tracker dashboard as a list of lines"""
+        out = []
         
-        # Header with spinner
-        spinner = Colors.SPINNER[self.spinner_index % len(Colors.SPINNER)]
+        # Header with spinner (static in low-bandwidth mode)
+        spinner = self._spinner()
         self.spinner_index += 1
         
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.CYAN}          IDEABROW PIPELINE - REAL-TIME PHASE TRACKER {spinner}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
-        print(f"{Colors.DIM}Last Update: {datetime.now().strftime('%H:%M:%S')} | Press Ctrl+C to exit{Colors.ENDC}")
-        print()
+        out.append(f"\n{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
+        out.append(f"{Colors.BOLD}{Colors.CYAN}          IDEABROW PIPELINE - REAL-TIME PHASE TRACKER {spinner}{Colors.ENDC}")
+        out.append(f"{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
+        out.append(f"{Colors.DIM}Last Update: {datetime.now().strftime('%H:%M:%S')} | Press Ctrl+C to exit{Colors.ENDC}")
+        out.append("")
         
         projects = self.get_active_projects()
         
         if not projects:
-            print(f"{Colors.YELLOW}No active projects found{Colors.ENDC}")
-            return
+            out.append(f"{Colors.YELLOW}No active projects found{Colors.ENDC}")
+            out.append("")
+            out.extend(self.history_lines())
+            return "\n".join(out).split("\n")
+        
+        # One row per project when the full layout would not fit on screen
+        rows_per_project = 6 if show_activity else 4
+        compact = (self.renderer is not None and
+                   len(projects) * rows_per_project > shutil.get_terminal_size((80, 24)).lines - 12)
             
         # Track events for notification area
         events = []
@@ -201,12 +225,18 @@ class PhaseTracker:
             if change:
                 events.append(f"{Colors.BOLD}{project}:{Colors.ENDC} {change}")
             
+            if compact:
+                out.append(self._compact_row(project, phase_data))
+                continue
+            
             # Project header
-            print(f"{Colors.BOLD}{Colors.GREEN}📂 {project}{Colors.ENDC}")
+            out.append(f"{Colors.BOLD}{Colors.GREEN}📂 {project}{Colors.ENDC}")
             
             # Progress bar
             progress_bar = self.render_progress_bar(phase_data['progress_percent'])
-            print(f"   Progress: {progress_bar} ({phase_data['completed']}/{phase_data['total']} phases)")
+            eta = self.get_predicted_completion(project)
+            eta_text = f" {Colors.DIM}ETA {eta.strftime('%H:%M')}{Colors.ENDC}" if eta and phase_data['progress_percent'] < 100 else ""
+            out.append(f"   Progress: {progress_bar} ({phase_data['completed']}/{phase_data['total']} phases){eta_text}")
             
             # Current phase
             if phase_data['current']:
@@ -215,8 +245,8 @@ class PhaseTracker:
                 phase_name = current.get('name', 'Unknown')[:50]
                 
                 # Animated indicator for current phase
-                anim = Colors.SPINNER[self.spinner_index % len(Colors.SPINNER)]
-                print(f"   {Colors.YELLOW}{anim} Current:{Colors.ENDC} Phase {phase_num} - {phase_name}")
+                anim = self._spinner()
+                out.append(f"   {Colors.YELLOW}{anim} Current:{Colors.ENDC} Phase {phase_num} - {phase_name}")
                 
                 # Show start time if available
                 if 'started_at' in current:
@@ -225,31 +255,31 @@ class PhaseTracker:
                         duration = datetime.now() - started
                         mins = int(duration.total_seconds() / 60)
                         secs = int(duration.total_seconds() % 60)
-                        print(f"   {Colors.DIM}Running for: {mins}m {secs}s{Colors.ENDC}")
+                        out.append(f"   {Colors.DIM}Running for: {mins}m {secs}s{Colors.ENDC}")
                     except:
                         pass
             else:
                 if phase_data['completed'] == phase_data['total']:
-                    print(f"   {Colors.GREEN}✅ All phases completed!{Colors.ENDC}")
+                    out.append(f"   {Colors.GREEN}✅ All phases completed!{Colors.ENDC}")
                 else:
-                    print(f"   {Colors.DIM}⏸ Waiting for next phase...{Colors.ENDC}")
+                    out.append(f"   {Colors.DIM}⏸ Waiting for next phase...{Colors.ENDC}")
             
             # Show recent activity if enabled
             if show_activity:
                 activity = self.get_recent_activity(project, 2)
                 if activity:
-                    print(f"   {Colors.DIM}Recent activity:{Colors.ENDC}")
+                    out.append(f"   {Colors.DIM}Recent activity:{Colors.ENDC}")
                     for line in activity:
                         if len(line) > 60:
                             line = line[:57] + "..."
-                        print(f"     {Colors.DIM}{line}{Colors.ENDC}")
+                        out.append(f"     {Colors.DIM}{line}{Colors.ENDC}")
             
-            print()
+            out.append("")
         
         # Show scheduled phases
         scheduled = self.get_scheduled_phases()
         if scheduled:
-            print(f"{Colors.BOLD}{Colors.YELLOW}⏰ Upcoming Phases:{Colors.ENDC}")
+            out.append(f"{Colors.BOLD}{Colors.YELLOW}⏰ Upcoming Phases:{Colors.ENDC}")
             for item in scheduled[:3]:  # Show next 3
                 mins = item['minutes_from_now']
                 if mins < 1:
@@ -259,15 +289,64 @@ class PhaseTracker:
                 else:
                     time_str = f"{Colors.GREEN}{mins} minutes{Colors.ENDC}"
                     
-                print(f"   • {item['project']} Phase {item['phase']} in {time_str}")
-            print()
+                out.append(f"   • {item['project']} Phase {item['phase']} in {time_str}")
+            out.append("")
+        
+        # Sparklines from the metric history (recorded by metrics_recorder.py)
+        out.extend(self.history_lines())
         
         # Show recent events
         if events:
-            print(f"{Colors.BOLD}{Colors.CYAN}📢 Recent Events:{Colors.ENDC}")
+            out.append(f"{Colors.BOLD}{Colors.CYAN}📢 Recent Events:{Colors.ENDC}")
             for event in events[-5:]:  # Show last 5 events
-                print(f"   {event}")
-            print()
+                out.append(f"   {event}")
+            out.append("")
+        
+        return "\n".join(out).split("\n")
+    
+    def history_lines(self, since: Optional[float] = None) -> List[str]:
+        """Sparkline rows for sessions, queued phases and webhook traffic"""
+        since = since or self.history_window
+        out = [f"{Colors.BOLD}{Colors.CYAN}📈 Last {format_duration(since)}:{Colors.ENDC}"]
+        for row in self.metrics.history(['sessions', 'queue_depth', 'webhooks'], since, width=40):
+            if not row['samples']:
+                out.append(f"   {row['label']:<14} {Colors.DIM}no data{Colors.ENDC}")
+            elif row['total'] is not None:
+                out.append(f"   {row['label']:<14} {Colors.CYAN}{row['spark']}{Colors.ENDC} {Colors.DIM}total {row['total']:.0f}{Colors.ENDC}")
+            else:
+                out.append(f"   {row['label']:<14} {Colors.CYAN}{row['spark']}{Colors.ENDC} {Colors.DIM}now {row['last']:.0f}, max {row['max']:.0f}{Colors.ENDC}")
+        out.append("")
+        return out
+    
+    def _spinner(self) -> str:
+        if self.low_bandwidth:
+            return '•'
+        return Colors.SPINNER[self.spinner_index % len(Colors.SPINNER)]
+    
+    def _compact_row(self, project: str, phase_data: Dict) -> str:
+        """Single-line project summary used when many projects are on screen"""
+        bar = self.render_progress_bar(phase_data['progress_percent'], width=10)
+        current = phase_data['current']
+        if current:
+            phase = f"Phase {current.get('phase_number', '?')} - {current.get('name', 'Unknown')[:30]}"
+        elif phase_data['completed'] == phase_data['total']:
+            phase = f"{Colors.GREEN}✅ done{Colors.ENDC}"
+        else:
+            phase = f"{Colors.DIM}waiting{Colors.ENDC}"
+        eta = self.get_predicted_completion(project)
+        if eta and phase_data['progress_percent'] < 100:
+            phase += f" {Colors.DIM}ETA {eta.strftime('%H:%M')}{Colors.ENDC}"
+        return f"{Colors.GREEN}📂{Colors.ENDC} {project[:40]:<40} {bar} {phase}"
+    
+    def display_tracker(self, show_activity: bool = False):
+        """Display the phase tracker dashboard"""
+        lines = self.build_tracker_frame(show_activity)
+        if self.renderer:
+            self.renderer.render(lines)
+        elif self.low_bandwidth:
+            print(strip_ansi("\n".join(lines)))
+        else:
+            print("\n".join(lines))
     
     def get_scheduled_phases(self) -> List[Dict]:
         """Get scheduled phases"""
@@ -280,12 +359,12 @@ class PhaseTracker:
             
             scheduled = []
             for line in result.stdout.split('\n'):
-                if 'sleep' in line and 'PHASE' in line:
+                if 'sleep' in line and ('PHASE' in line or 'message_dispatcher' in line):
                     import re
                     
                     sleep_match = re.search(r'sleep (\d+)', line)
                     proj_match = re.search(r'(\S+):0', line)
-                    phase_match = re.search(r'PHASE (\d+)', line)
+                    phase_match = re.search(r'(?:PHASE |--source phase-)(\d+)', line)
                     
                     if sleep_match and proj_match and phase_match:
                         scheduled.append({
@@ -307,12 +386,58 @@ class PhaseTracker:
             
         signal.signal(signal.SIGINT, signal_handler)
         
+        self.renderer = FrameRenderer(low_bandwidth=self.low_bandwidth)
         try:
             while True:
                 self.display_tracker(show_activity)
                 time.sleep(interval)
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}Phase tracker stopped{Colors.ENDC}")
+        finally:
+            self.renderer.close()
+
+    def run_events(self, show_activity: bool = False, min_frame_interval: float = 0.5,
+                   max_interval: float = 30.0):
+        """
+        Run the tracker driven by filesystem events
+        Redraws when a *_tracker.json file actually changes, at most once per
+        min_frame_interval. tmux sessions and scheduled phases are not on disk,
+        so the screen is still refreshed at least every max_interval seconds.
+        """
+        def signal_handler(sig, frame):
+            print(f"\n{Colors.YELLOW}Stopping phase tracker...{Colors.ENDC}")
+            sys.exit(0)
+            
+        signal.signal(signal.SIGINT, signal_handler)
+        
+        watcher = FileWatcher([self.state_dir])
+        self.renderer = FrameRenderer(low_bandwidth=self.low_bandwidth)
+        try:
+            self.display_tracker(show_activity)
+            last_frame = time.monotonic()
+            
+            while True:
+                changed = watcher.wait(max_interval)
+                
+                if changed:
+                    # Coalesce bursts of events into a single frame
+                    hold = min_frame_interval - (time.monotonic() - last_frame)
+                    if hold > 0:
+                        changed |= watcher.gather(hold)
+                    
+                    # Only redraw if a tracker file parses to different data
+                    refreshed = [self.json_cache.refresh(path) for path in changed
+                                 if path.name.endswith(('_tracker.json', '_schedule.json'))]
+                    if not any(refreshed):
+                        continue
+                
+                self.display_tracker(show_activity)
+                last_frame = time.monotonic()
+        except KeyboardInterrupt:
+            print(f"\n{Colors.YELLOW}Phase tracker stopped{Colors.ENDC}")
+        finally:
+            watcher.close()
+            self.renderer.close()
 
 def main():
     parser = argparse.ArgumentParser(description='Real-time Phase Tracker for IdeaBrow Pipeline')
@@ -322,18 +447,40 @@ def main():
                        help='Show recent activity from tmux panes')
     parser.add_argument('--once', action='store_true',
                        help='Run once and exit (no continuous updates)')
+    parser.add_argument('--low-bandwidth', action='store_true',
+                       help='No colors or animation - for watching over slow SSH links')
+    parser.add_argument('-e', '--events', action='store_true',
+                       help='Redraw on tracker file changes instead of every interval')
+    parser.add_argument('--min-frame-interval', type=float, default=0.5,
+                       help='Minimum seconds between redraws in events mode (default: 0.5)')
+    parser.add_argument('--max-interval', type=float, default=30.0,
+                       help='Maximum seconds between redraws in events mode (default: 30)')
+    parser.add_argument('--since', type=parse_duration, metavar='DURATION',
+                       help='History window for the sparklines, e.g. 30m, 6h, 7d (with --once: print only the history)')
     
     args = parser.parse_args()
     
-    tracker = PhaseTracker()
+    tracker = PhaseTracker(low_bandwidth=args.low_bandwidth)
+    if args.since:
+        tracker.history_window = args.since
     
-    if args.once:
+    if args.once and args.since:
+        # Answered from the metric rings alone
+        output = "\n".join(tracker.history_lines())
+        print(strip_ansi(output) if args.low_bandwidth else output)
+    elif args.once:
         tracker.display_tracker(args.activity)
     else:
         print(f"{Colors.CYAN}Starting real-time phase tracker...{Colors.ENDC}")
-        print(f"{Colors.DIM}Update interval: {args.interval}s | Press Ctrl+C to stop{Colors.ENDC}")
+        if args.events:
+            print(f"{Colors.DIM}Updating on file changes (every {args.max_interval}s at most) | Press Ctrl+C to stop{Colors.ENDC}")
+        else:
+            print(f"{Colors.DIM}Update interval: {args.interval}s | Press Ctrl+C to stop{Colors.ENDC}")
         time.sleep(1)
-        tracker.run(args.interval, args.activity)
+        if args.events:
+            tracker.run_events(args.activity, args.min_frame_interval, args.max_interval)
+        else:
+            tracker.run(args.interval, args.activity)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
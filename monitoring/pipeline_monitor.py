@@ -8,11 +8,20 @@ import subprocess
 import json
 import re
 import os
+import shutil
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from fs_watch import FileWatcher, ParseCache, stat_key
+from log_tailer import LogTailer, LogRing
+from metrics_store import MetricsStore, format_duration, parse_duration
+from term_render import FrameRenderer, strip_ansi
+from system_probes import (CachedProbe, check_github_ssh, disk_usage_percent,
+                           find_processes, is_port_listening, memory_usage_percent)
 
 # ANSI color codes for CLI formatting
 class Colors:
@@ -28,27 +37,103 @@ class Colors:
     DIM = '\033[2m'
 
 class PipelineMonitor:
-    def __init__(self):
+    def __init__(self, low_bandwidth: bool = False):
         self.pipeline_dir = Path("/home/wv3/ideabrow-pipeline")
         self.state_dir = self.pipeline_dir / "webhook-server" / "state"
         self.logs_dir = self.pipeline_dir / "webhook-server" / "logs"
         self.orchestrator_path = self.pipeline_dir / "orchestrator"
+        self.low_bandwidth = low_bandwidth
+        self.renderer: Optional[FrameRenderer] = None
+        
+        # Parsed *_state.json / *_tracker.json, re-read only when mtime or size change
+        self.json_cache = ParseCache()
+        
+        # Persistent webhook log reader - each refresh parses only new lines
+        self.webhook_log = LogRing(
+            LogTailer(self.logs_dir / "webhook.log"),
+            self._parse_webhook_log_line,
+            maxlen=50
+        )
+        
+        # Per-project detail collection: bounded pool, per-project timeout,
+        # results reused while a session's inputs are unchanged
+        self.detail_timeout = 3.0
+        self._detail_pool = ThreadPoolExecutor(max_workers=8)
+        self._detail_cache: Dict[str, Tuple[tuple, Optional[Dict]]] = {}
+        
+        # GitHub SSH takes seconds - probe in the background, re-check every 5 min
+        self.github_ssh_probe = CachedProbe(check_github_ssh, ttl=300, default=False)
+        self.github_ssh_probe.refresh()
+        
+        # Metric history (sparklines and --since queries) kept under state/metrics;
+        # written only by metrics_recorder.py, the dashboards just read it
+        self.metrics = MetricsStore(self.state_dir / "metrics")
+        self.history_window = 3600
         
     def get_active_projects(self) -> List[Dict]:
-        """Get all active tmux sessions with their current status"""
+        """
+        Get all active tmux sessions with their current status
+        Details are collected concurrently; sessions whose tmux activity and
+        state/tracker files are unchanged since the last refresh reuse the
+        previous result without touching tmux.
+        """
         try:
             result = subprocess.run(
-                ["tmux", "list-sessions", "-F", "#{session_name}"],
+                ["tmux", "list-sessions", "-F", "#{session_name}\t#{session_activity}"],
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=self.detail_timeout
             )
             
-            projects = []
-            for session_name in result.stdout.strip().split('\n'):
+            sessions = {}
+            for line in result.stdout.strip().split('\n'):
+                session_name, _, activity = line.partition('\t')
                 if session_name and session_name not in ['tmux-orc', 'server']:
-                    project_info = self._get_project_details(session_name)
-                    if project_info:
-                        projects.append(project_info)
+                    sessions[session_name] = (
+                        activity,
+                        stat_key(self.state_dir / f"{session_name}_state.json"),
+                        stat_key(self.state_dir / f"{session_name}_tracker.json"),
+                        stat_key(self.state_dir / f"{session_name}_schedule.json")
+                    )
+            
+            # Forget sessions that have gone away
+            for session_name in list(self._detail_cache):
+                if session_name not in sessions:
+                    del self._detail_cache[session_name]
+            
+            futures = {}
+            for session_name, inputs in sessions.items():
+                cached = self._detail_cache.get(session_name)
+                if cached is None or cached[0] != inputs:
+                    futures[self._detail_pool.submit(self._get_project_details, session_name)] = (session_name, inputs)
+            
+            done, not_done = wait(futures, timeout=self.detail_timeout)
+            for future in done:
+                session_name, inputs = futures[future]
+                try:
+                    self._detail_cache[session_name] = (inputs, future.result())
+                except Exception:
+                    self._detail_cache.pop(session_name, None)
+            
+            projects = []
+            for session_name in sessions:
+                cached = self._detail_cache.get(session_name)
+                if cached and cached[1]:
+                    projects.append(cached[1])
+            
+            for future in not_done:
+                # One hung pane must not stall the dashboard - show it as stale
+                session_name, _ = futures[future]
+                future.cancel()
+                if session_name not in self._detail_cache:
+                    projects.append({
+                        'name': session_name,
+                        'status': 'unknown',
+                        'current_phase': 'Unknown',
+                        'created': 'Unknown',
+                        'repo_url': None,
+                        'errors': [f'Detail collection timed out after {self.detail_timeout}s']
+                    })
             
             return sorted(projects, key=lambda x: x.get('created', ''))
             
@@ -61,9 +146,10 @@ class PipelineMonitor:
             # Check if Claude is running in this session
             pane_result = subprocess.run(
                 ["tmux", "list-panes", "-t", f"{session_name}:0", "-F", "#{pane_current_command}"],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                stderr=subprocess.DEVNULL
+                timeout=self.detail_timeout
             )
             
             if 'claude' not in pane_result.stdout.lower():
@@ -79,44 +165,52 @@ class PipelineMonitor:
                 'current_phase': 'Unknown',
                 'created': 'Unknown',
                 'repo_url': None,
+                'eta': None,
                 'errors': []
             }
             
+            # Predicted completion written by the phase scheduler
+            schedule_file = self.state_dir / f"{session_name}_schedule.json"
+            if schedule_file.exists():
+                try:
+                    project_info['eta'] = self.json_cache.get(schedule_file).get('predicted_completion')
+                except (OSError, ValueError, AttributeError):
+                    pass
+            
             # Read state file
             if state_file.exists():
                 try:
-                    with open(state_file) as f:
-                        data = json.load(f)
-                        project_info['created'] = data.get('timestamp', 'Unknown')
-                        project_info['repo_url'] = data.get('repo_url')
+                    data = self.json_cache.get(state_file)
+                    project_info['created'] = data.get('timestamp', 'Unknown')
+                    project_info['repo_url'] = data.get('repo_url')
                 except:
                     project_info['errors'].append('Invalid state file')
             
             # Read tracker file for current phase
             if tracker_file.exists():
                 try:
-                    with open(tracker_file) as f:
-                        tracker = json.load(f)
-                        # Find current phase
-                        for phase in tracker.get('phases', []):
-                            if phase.get('status') == 'in_progress':
-                                project_info['current_phase'] = f"Phase {phase.get('phase_number', '?')}: {phase.get('name', 'Unknown')}"
-                                break
-                        else:
-                            # Check for completed phases
-                            completed = [p for p in tracker.get('phases', []) if p.get('status') == 'completed']
-                            if completed:
-                                last = completed[-1]
-                                project_info['current_phase'] = f"Completed Phase {last.get('phase_number', '?')}"
+                    tracker = self.json_cache.get(tracker_file)
+                    # Find current phase
+                    for phase in tracker.get('phases', []):
+                        if phase.get('status') == 'in_progress':
+                            project_info['current_phase'] = f"Phase {phase.get('phase_number', '?')}: {phase.get('name', 'Unknown')}"
+                            break
+                    else:
+                        # Check for completed phases
+                        completed = [p for p in tracker.get('phases', []) if p.get('status') == 'completed']
+                        if completed:
+                            last = completed[-1]
+                            project_info['current_phase'] = f"Completed Phase {last.get('phase_number', '?')}"
                 except:
                     project_info['errors'].append('Invalid tracker file')
             
             # Check for recent activity in pane
             capture_result = subprocess.run(
                 ["tmux", "capture-pane", "-t", f"{session_name}:0", "-p", "-S", "-10"],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                stderr=subprocess.DEVNULL
+                timeout=self.detail_timeout
             )
             
             if capture_result.stdout:
@@ -143,7 +237,7 @@ class PipelineMonitor:
             scheduled = []
             for line in result.stdout.split('\n'):
                 # Look for sleep processes with phase scheduling
-                if 'sleep' in line and ('send-claude-message' in line or 'PHASE' in line):
+                if 'sleep' in line and ('send-claude-message' in line or 'message_dispatcher' in line or 'PHASE' in line):
                     # Extract details
                     match = re.search(r'sleep (\d+)', line)
                     if match:
@@ -154,7 +248,7 @@ class PipelineMonitor:
                         project_name = proj_match.group(1) if proj_match else "Unknown"
                         
                         # Extract phase number
-                        phase_match = re.search(r'PHASE (\d+)', line)
+                        phase_match = re.search(r'(?:PHASE |--source phase-)(\d+)', line)
                         phase_num = phase_match.group(1) if phase_match else "?"
                         
                         # Extract PID
@@ -187,55 +281,42 @@ class PipelineMonitor:
         }
         
         # Check if server is running
-        result = subprocess.run(
-            ["pgrep", "-f", "webhook_server.py"],
-            capture_output=True
-        )
-        status['running'] = result.returncode == 0
+        try:
+            pids = find_processes("webhook_server.py")
+        except Exception:
+            pids = []
+        status['running'] = bool(pids)
         
-        if status['running']:
-            # Get PID and check port
-            pid = result.stdout.decode().strip().split('\n')[0]
-            port_check = subprocess.run(
-                ["lsof", "-i", f":8090", "-t"],
-                capture_output=True,
-                text=True
-            )
-            if port_check.returncode != 0:
-                status['errors'].append("Server running but port 8090 not bound")
-        
-        # Check recent webhook log
-        webhook_log = self.logs_dir / "webhook.log"
-        if webhook_log.exists():
-            try:
-                # Get last 100 lines
-                result = subprocess.run(
-                    ["tail", "-100", str(webhook_log)],
-                    capture_output=True,
-                    text=True
-                )
-                
-                for line in result.stdout.split('\n'):
-                    if 'Processing webhook' in line:
-                        # Extract timestamp and repo
-                        timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                        repo_match = re.search(r'repo: (\S+)', line)
-                        if timestamp_match and repo_match:
-                            status['recent_webhooks'].append({
-                                'time': timestamp_match.group(1),
-                                'repo': repo_match.group(1)
-                            })
-                    elif 'ERROR' in line:
-                        status['errors'].append(line.strip()[:100])
-                
-                # Keep only last 5 webhooks
-                status['recent_webhooks'] = status['recent_webhooks'][-5:]
-                
-            except:
-                pass
+        if status['running'] and not is_port_listening(8090):
+            status['errors'].append("Server running but port 8090 not bound")
+        
+        # Pick up webhook log lines appended since the last refresh
+        try:
+            self.webhook_log.refresh()
+        except Exception:
+            pass
+        
+        status['recent_webhooks'] = self.webhook_log.recent('webhook', 5)
+        status['errors'].extend(self.webhook_log.recent('error', 10))
         
         return status
     
+    @staticmethod
+    def _parse_webhook_log_line(line: str) -> Optional[Tuple[str, object]]:
+        """Classify a webhook.log line as a received webhook or an error"""
+        if 'Processing webhook' in line or 'Received webhook:' in line:
+            # Extract timestamp and repo / project
+            timestamp_match = re.search(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
+            repo_match = re.search(r'repo: (\S+)', line) or re.search(r'Received webhook: (\S+)', line)
+            if timestamp_match and repo_match:
+                return 'webhook', {
+                    'time': timestamp_match.group(1),
+                    'repo': repo_match.group(1)
+                }
+        elif 'ERROR' in line:
+            return 'error', line.strip()[:100]
+        return None
+    
     def check_duplicates(self) -> List[str]:
         """Check for duplicate project sessions or scheduled phases"""
         duplicates = []
@@ -255,20 +336,23 @@ class PipelineMonitor:
             projects = {}
             for state_file in self.state_dir.glob("*_state.json"):
                 try:
-                    with open(state_file) as f:
-                        data = json.load(f)
-                        repo = data.get('repo_url', '').split('/')[-1]
-                        if repo and repo in projects:
-                            duplicates.append(f"Duplicate repo: {repo} in {state_file.name} and {projects[repo]}")
-                        elif repo:
-                            projects[repo] = state_file.name
+                    data = self.json_cache.get(state_file)
+                    repo = data.get('repo_url', '').split('/')[-1]
+                    if repo and repo in projects:
+                        duplicates.append(f"Duplicate repo: {repo} in {state_file.name} and {projects[repo]}")
+                    elif repo:
+                        projects[repo] = state_file.name
                 except:
                     pass
         
         return duplicates
     
-    def get_system_health(self) -> Dict:
-        """Comprehensive system health check"""
+    def get_system_health(self, github_ssh_wait: float = 0) -> Dict:
+        """
+        Comprehensive system health check
+        All probes run in-process; the GitHub SSH result comes from a cache
+        unless github_ssh_wait allows waiting for the first check.
+        """
         health = {
             'webhook_server': False,
             'orchestrator_scripts': False,
@@ -306,92 +390,97 @@ class PipelineMonitor:
         if not health['state_directory']:
             health['issues'].append("State directory missing")
         
-        # Check GitHub SSH
-        result = subprocess.run(
-            ["ssh", "-T", "git@github.com"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        health['github_ssh'] = "successfully authenticated" in result.stderr
+        # Check GitHub SSH (cached, refreshed in the background)
+        health['github_ssh'] = bool(self.github_ssh_probe.get(wait=github_ssh_wait))
         
         # Check disk space
         try:
-            result = subprocess.run(
-                ["df", "-h", str(self.pipeline_dir)],
-                capture_output=True,
-                text=True
-            )
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                parts = lines[1].split()
-                if len(parts) >= 5:
-                    usage = parts[4].rstrip('%')
-                    health['disk_space'] = int(usage)
-                    if health['disk_space'] > 90:
-                        health['issues'].append(f"Low disk space: {usage}% used")
-        except:
+            health['disk_space'] = disk_usage_percent(self.pipeline_dir)
+            if health['disk_space'] > 90:
+                health['issues'].append(f"Low disk space: {health['disk_space']}% used")
+        except OSError:
             pass
         
         # Check memory usage
         try:
-            result = subprocess.run(
-                ["free", "-m"],
-                capture_output=True,
-                text=True
-            )
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                parts = lines[1].split()
-                if len(parts) >= 3:
-                    total = int(parts[1])
-                    used = int(parts[2])
-                    health['memory_usage'] = int((used / total) * 100)
-                    if health['memory_usage'] > 90:
-                        health['issues'].append(f"High memory usage: {health['memory_usage']}%")
-        except:
+            health['memory_usage'] = memory_usage_percent()
+            if health['memory_usage'] > 90:
+                health['issues'].append(f"High memory usage: {health['memory_usage']}%")
+        except (OSError, ValueError):
             pass
         
         return health
     
-    def display_status(self, watch_mode=False):
-        """Display comprehensive status dashboard"""
-        if watch_mode:
-            os.system('clear')
+    def get_history(self, since: Optional[float] = None, width: int = 40) -> List[Dict]:
+        """Sparklines and min/avg/max per metric over the last `since` seconds"""
+        return self.metrics.history(
+            ['sessions', 'queue_depth', 'webhooks', 'errors', 'dispatch_delay', 'memory_pct', 'disk_pct'],
+            since or self.history_window,
+            width
+        )
+    
+    def history_lines(self, since: Optional[float] = None) -> List[str]:
+        """Format get_history() as dashboard lines"""
+        out = []
+        for row in self.get_history(since):
+            if not row['samples']:
+                out.append(f"  {row['label']:<14} {Colors.DIM}no data{Colors.ENDC}")
+                continue
+            if row['total'] is not None:
+                stats = f"total {row['total']:.0f}, peak {row['max']:.0f}/{format_duration(row['step'])}"
+            else:
+                stats = f"now {row['last']:.0f}, min {row['min']:.0f}, avg {row['avg']:.1f}, max {row['max']:.0f}"
+            out.append(f"  {row['label']:<14} {Colors.CYAN}{row['spark']}{Colors.ENDC} {Colors.DIM}{stats}{Colors.ENDC}")
+        return out
+    
+    def build_status_frame(self, watch_mode=False) -> List[str]:
+        """Build the status dashboard as a list of lines"""
+        out = []
         
         # Header
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.CYAN}              IDEABROW PIPELINE - CLI MONITORING DASHBOARD{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
+        out.append(f"\n{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
+        out.append(f"{Colors.BOLD}{Colors.CYAN}              IDEABROW PIPELINE - CLI MONITORING DASHBOARD{Colors.ENDC}")
+        out.append(f"{Colors.BOLD}{Colors.CYAN}{'═' * 80}{Colors.ENDC}")
         
         # Active Projects Section
         projects = self.get_active_projects()
-        print(f"\n{Colors.BOLD}{Colors.GREEN}📂 ACTIVE PROJECTS ({len(projects)}){Colors.ENDC}")
-        print(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+        out.append(f"\n{Colors.BOLD}{Colors.GREEN}📂 ACTIVE PROJECTS ({len(projects)}){Colors.ENDC}")
+        out.append(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+        
+        # One row per project when the full layout would not fit on screen
+        compact = (self.renderer is not None and
+                   len(projects) * 5 > shutil.get_terminal_size((80, 24)).lines - 30)
         
-        if projects:
+        if projects and compact:
+            for proj in projects:
+                status_color = Colors.GREEN if not proj['errors'] else Colors.YELLOW
+                errors = f" {Colors.RED}⚠ {len(proj['errors'])}{Colors.ENDC}" if proj['errors'] else ""
+                out.append(f"  {status_color}•{Colors.ENDC} {proj['name'][:40]:<40} {proj['current_phase'][:30]}{errors}")
+        elif projects:
             for proj in projects:
                 # Project name and status
                 status_color = Colors.GREEN if not proj['errors'] else Colors.YELLOW
-                print(f"  {Colors.BOLD}• {proj['name']}{Colors.ENDC}")
-                print(f"    {Colors.BLUE}Phase:{Colors.ENDC} {proj['current_phase']}")
-                print(f"    {Colors.BLUE}Created:{Colors.ENDC} {proj['created']}")
+                out.append(f"  {Colors.BOLD}• {proj['name']}{Colors.ENDC}")
+                out.append(f"    {Colors.BLUE}Phase:{Colors.ENDC} {proj['current_phase']}")
+                out.append(f"    {Colors.BLUE}Created:{Colors.ENDC} {proj['created']}")
+                if proj.get('eta'):
+                    out.append(f"    {Colors.BLUE}ETA:{Colors.ENDC} {proj['eta'].replace('T', ' ')}")
                 
                 if proj['repo_url']:
-                    print(f"    {Colors.BLUE}Repo:{Colors.ENDC} {proj['repo_url']}")
+                    out.append(f"    {Colors.BLUE}Repo:{Colors.ENDC} {proj['repo_url']}")
                 
                 if proj['errors']:
                     for error in proj['errors'][:2]:  # Show max 2 errors
-                        print(f"    {Colors.RED}⚠ {error}{Colors.ENDC}")
+                        out.append(f"    {Colors.RED}⚠ {error}{Colors.ENDC}")
                 
-                print()
+                out.append("")
         else:
-            print(f"  {Colors.DIM}No active projects{Colors.ENDC}")
+            out.append(f"  {Colors.DIM}No active projects{Colors.ENDC}")
         
         # Scheduled Phases Section
         scheduled = self.get_scheduled_phases()
-        print(f"\n{Colors.BOLD}{Colors.YELLOW}⏰ SCHEDULED PHASES ({len(scheduled)}){Colors.ENDC}")
-        print(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+        out.append(f"\n{Colors.BOLD}{Colors.YELLOW}⏰ SCHEDULED PHASES ({len(scheduled)}){Colors.ENDC}")
+        out.append(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
         
         if scheduled:
             for phase in scheduled[:5]:  # Show max 5 upcoming
@@ -406,44 +495,44 @@ class PipelineMonitor:
                 else:
                     time_color = Colors.GREEN
                 
-                print(f"  • {Colors.BOLD}{phase['project']}{Colors.ENDC} - Phase {phase['phase']}")
-                print(f"    {time_color}Runs at: {time_str} ({mins} min){Colors.ENDC}")
-                print(f"    {Colors.DIM}PID: {phase['pid']}{Colors.ENDC}")
-                print()
+                out.append(f"  • {Colors.BOLD}{phase['project']}{Colors.ENDC} - Phase {phase['phase']}")
+                out.append(f"    {time_color}Runs at: {time_str} ({mins} min){Colors.ENDC}")
+                out.append(f"    {Colors.DIM}PID: {phase['pid']}{Colors.ENDC}")
+                out.append("")
         else:
-            print(f"  {Colors.DIM}No phases scheduled{Colors.ENDC}")
+            out.append(f"  {Colors.DIM}No phases scheduled{Colors.ENDC}")
         
         # Webhook Status Section
         webhook = self.get_webhook_status()
         status_icon = "✅" if webhook['running'] else "❌"
         status_color = Colors.GREEN if webhook['running'] else Colors.RED
         
-        print(f"\n{Colors.BOLD}{Colors.BLUE}🔗 WEBHOOK SERVER{Colors.ENDC}")
-        print(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
-        print(f"  {status_color}{status_icon} Status: {'Running' if webhook['running'] else 'Not Running'} on port {webhook['port']}{Colors.ENDC}")
+        out.append(f"\n{Colors.BOLD}{Colors.BLUE}🔗 WEBHOOK SERVER{Colors.ENDC}")
+        out.append(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+        out.append(f"  {status_color}{status_icon} Status: {'Running' if webhook['running'] else 'Not Running'} on port {webhook['port']}{Colors.ENDC}")
         
         if webhook['recent_webhooks']:
-            print(f"  {Colors.BLUE}Recent webhooks:{Colors.ENDC}")
+            out.append(f"  {Colors.BLUE}Recent webhooks:{Colors.ENDC}")
             for wh in webhook['recent_webhooks'][-3:]:  # Show last 3
-                print(f"    • {wh['time']} - {wh['repo']}")
+                out.append(f"    • {wh['time']} - {wh['repo']}")
         
         if webhook['errors']:
-            print(f"  {Colors.RED}Recent errors:{Colors.ENDC}")
+            out.append(f"  {Colors.RED}Recent errors:{Colors.ENDC}")
             for error in webhook['errors'][-2:]:  # Show last 2 errors
-                print(f"    ⚠ {error[:80]}")
+                out.append(f"    ⚠ {error[:80]}")
         
         # Duplicate Detection Section
         duplicates = self.check_duplicates()
         if duplicates:
-            print(f"\n{Colors.BOLD}{Colors.RED}⚠️  DUPLICATE DETECTION{Colors.ENDC}")
-            print(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+            out.append(f"\n{Colors.BOLD}{Colors.RED}⚠️  DUPLICATE DETECTION{Colors.ENDC}")
+            out.append(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
             for dup in duplicates:
-                print(f"  {Colors.RED}• {dup}{Colors.ENDC}")
+                out.append(f"  {Colors.RED}• {dup}{Colors.ENDC}")
         
         # System Health Section
-        health = self.get_system_health()
-        print(f"\n{Colors.BOLD}{Colors.CYAN}🔧 SYSTEM HEALTH{Colors.ENDC}")
-        print(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+        health = self.get_system_health(github_ssh_wait=0 if watch_mode else 6)
+        out.append(f"\n{Colors.BOLD}{Colors.CYAN}🔧 SYSTEM HEALTH{Colors.ENDC}")
+        out.append(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
         
         # Health indicators
         indicators = [
@@ -456,41 +545,105 @@ class PipelineMonitor:
         for name, status in indicators:
             icon = "✅" if status else "❌"
             color = Colors.GREEN if status else Colors.RED
-            print(f"  {color}{icon} {name}{Colors.ENDC}")
+            out.append(f"  {color}{icon} {name}{Colors.ENDC}")
         
         # Resource usage
-        print(f"\n  {Colors.BLUE}Resources:{Colors.ENDC}")
+        out.append(f"\n  {Colors.BLUE}Resources:{Colors.ENDC}")
         
         disk_color = Colors.GREEN if health['disk_space'] < 80 else Colors.YELLOW if health['disk_space'] < 90 else Colors.RED
-        print(f"    {disk_color}Disk: {health['disk_space']}% used{Colors.ENDC}")
+        out.append(f"    {disk_color}Disk: {health['disk_space']}% used{Colors.ENDC}")
         
         mem_color = Colors.GREEN if health['memory_usage'] < 80 else Colors.YELLOW if health['memory_usage'] < 90 else Colors.RED
-        print(f"    {mem_color}Memory: {health['memory_usage']}% used{Colors.ENDC}")
+        out.append(f"    {mem_color}Memory: {health['memory_usage']}% used{Colors.ENDC}")
         
         # Issues Summary
         if health['issues']:
-            print(f"\n{Colors.BOLD}{Colors.RED}⚠️  ISSUES DETECTED{Colors.ENDC}")
-            print(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+            out.append(f"\n{Colors.BOLD}{Colors.RED}⚠️  ISSUES DETECTED{Colors.ENDC}")
+            out.append(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
             for issue in health['issues']:
-                print(f"  {Colors.RED}• {issue}{Colors.ENDC}")
+                out.append(f"  {Colors.RED}• {issue}{Colors.ENDC}")
         else:
-            print(f"\n{Colors.BOLD}{Colors.GREEN}✅ All systems operational{Colors.ENDC}")
+            out.append(f"\n{Colors.BOLD}{Colors.GREEN}✅ All systems operational{Colors.ENDC}")
+        
+        # History Section
+        out.append(f"\n{Colors.BOLD}{Colors.CYAN}📈 HISTORY (last {format_duration(self.history_window)}){Colors.ENDC}")
+        out.append(f"{Colors.DIM}{'─' * 60}{Colors.ENDC}")
+        out.extend(self.history_lines())
         
         # Footer
-        print(f"\n{Colors.DIM}{'─' * 80}{Colors.ENDC}")
-        print(f"{Colors.DIM}Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.ENDC}")
+        out.append(f"\n{Colors.DIM}{'─' * 80}{Colors.ENDC}")
+        out.append(f"{Colors.DIM}Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.ENDC}")
         if watch_mode:
-            print(f"{Colors.DIM}Press Ctrl+C to exit watch mode{Colors.ENDC}")
-        print(f"{Colors.CYAN}{'═' * 80}{Colors.ENDC}\n")
+            out.append(f"{Colors.DIM}Press Ctrl+C to exit watch mode{Colors.ENDC}")
+        out.append(f"{Colors.CYAN}{'═' * 80}{Colors.ENDC}\n")
+        
+        return "\n".join(out).split("\n")
+    
+    def display_status(self, watch_mode=False):
+        """Display comprehensive status dashboard"""
+        lines = self.build_status_frame(watch_mode)
+        if watch_mode and self.renderer:
+            self.renderer.render(lines)
+        elif self.low_bandwidth:
+            print(strip_ansi("\n".join(lines)))
+        else:
+            print("\n".join(lines))
     
     def watch(self, interval=5):
         """Watch mode - auto-refresh display"""
+        self.renderer = FrameRenderer(low_bandwidth=self.low_bandwidth)
         try:
             while True:
                 self.display_status(watch_mode=True)
                 time.sleep(interval)
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}Exiting watch mode...{Colors.ENDC}")
+        finally:
+            self.renderer.close()
+    
+    def _files_changed(self, changed) -> bool:
+        """Re-read changed files; True if anything shown on the dashboard differs"""
+        data_changed = False
+        for path in changed:
+            if path.name.endswith(('_state.json', '_tracker.json', '_schedule.json')):
+                data_changed |= self.json_cache.refresh(path)
+            elif path.name == 'webhook.log':
+                before = (self.webhook_log.recent('webhook'), self.webhook_log.recent('error'))
+                self.webhook_log.refresh()
+                data_changed |= before != (self.webhook_log.recent('webhook'), self.webhook_log.recent('error'))
+        return data_changed
+    
+    def watch_events(self, min_frame_interval=0.5, max_interval=30):
+        """
+        Event-driven watch mode
+        Redraws when state/tracker files or webhook.log change in a way that
+        affects the dashboard, at most once per min_frame_interval. tmux and
+        process data are not on disk, so it also redraws every max_interval.
+        """
+        watcher = FileWatcher([self.state_dir, self.logs_dir / "webhook.log"])
+        self.renderer = FrameRenderer(low_bandwidth=self.low_bandwidth)
+        try:
+            self.display_status(watch_mode=True)
+            last_frame = time.monotonic()
+            
+            while True:
+                changed = watcher.wait(max_interval)
+                
+                if changed:
+                    # Coalesce bursts of events into a single frame
+                    hold = min_frame_interval - (time.monotonic() - last_frame)
+                    if hold > 0:
+                        changed |= watcher.gather(hold)
+                    if not self._files_changed(changed):
+                        continue
+                
+                self.display_status(watch_mode=True)
+                last_frame = time.monotonic()
+        except KeyboardInterrupt:
+            print(f"\n{Colors.YELLOW}Exiting watch mode...{Colors.ENDC}")
+        finally:
+            watcher.close()
+            self.renderer.close()
 
 def main():
     import argparse
@@ -502,10 +655,33 @@ def main():
                        help='Refresh interval for watch mode (seconds)')
     parser.add_argument('--json', action='store_true',
                        help='Output status as JSON')
+    parser.add_argument('--low-bandwidth', action='store_true',
+                       help='No colors - for watching over slow SSH links')
+    parser.add_argument('-e', '--events', action='store_true',
+                       help='Watch mode that redraws on state/log file changes instead of every interval')
+    parser.add_argument('--min-frame-interval', type=float, default=0.5,
+                       help='Minimum seconds between redraws in events mode (default: 0.5)')
+    parser.add_argument('--max-interval', type=float, default=30.0,
+                       help='Maximum seconds between redraws in events mode (default: 30)')
+    parser.add_argument('--since', type=parse_duration, metavar='DURATION',
+                       help='Metric history window, e.g. 30m, 6h, 7d (alone: print the history and exit)')
     
     args = parser.parse_args()
     
-    monitor = PipelineMonitor()
+    monitor = PipelineMonitor(low_bandwidth=args.low_bandwidth)
+    if args.since:
+        monitor.history_window = args.since
+    
+    if args.since and not (args.watch or args.events):
+        # Answered from the metric rings alone - no tmux, ps or log scanning
+        if args.json:
+            print(json.dumps(monitor.get_history(args.since), indent=2))
+        else:
+            lines = [f"{Colors.BOLD}{Colors.CYAN}📈 HISTORY (last {format_duration(args.since)}){Colors.ENDC}"]
+            lines.extend(monitor.history_lines(args.since))
+            output = "\n".join(lines)
+            print(strip_ansi(output) if args.low_bandwidth else output)
+        return 0
     
     if args.json:
         # JSON output for integration with other tools
@@ -524,9 +700,12 @@ def main():
             ],
             'webhook': monitor.get_webhook_status(),
             'duplicates': monitor.check_duplicates(),
-            'health': monitor.get_system_health()
+            'health': monitor.get_system_health(github_ssh_wait=6)
         }
+        status['history'] = monitor.get_history()
         print(json.dumps(status, indent=2))
+    elif args.events:
+        monitor.watch_events(args.min_frame_interval, args.max_interval)
     elif args.watch:
         monitor.watch(args.interval)
     else:
@@ -137,15 +137,15 @@ except Exception as e:
     
     # Check for scheduled phases
     echo -e "\n${BOLD}Scheduled Phases:${NC}"
-    SCHEDULED=$(ps aux | grep -E "sleep.*$project_name.*PHASE" | grep -v grep)
+    SCHEDULED=$(ps aux | grep -E "sleep.*$project_name.*(PHASE|--source phase-)" | grep -v grep)
     if [ ! -z "$SCHEDULED" ]; then
         echo "$SCHEDULED" | while read line; do
             if [[ "$line" =~ sleep[[:space:]]+([0-9]+) ]]; then
                 SECONDS="${BASH_REMATCH[1]}"
                 MINUTES=$((SECONDS / 60))
                 
-                if [[ "$line" =~ PHASE[[:space:]]+([0-9]+) ]]; then
-                    PHASE_NUM="${BASH_REMATCH[1]}"
+                if [[ "$line" =~ (PHASE[[:space:]]+|phase-)([0-9]+) ]]; then
+                    PHASE_NUM="${BASH_REMATCH[2]}"
                     echo -e "  ${YELLOW}⏰ Phase $PHASE_NUM scheduled in $MINUTES minutes${NC}"
                 fi
             fi
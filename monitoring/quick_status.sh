@@ -53,7 +53,7 @@ case "$MODE" in
     summary)
         # Quick one-line summary
         PROJECTS=$(tmux list-sessions 2>/dev/null | grep -v "server\|tmux-orc" | wc -l)
-        PHASES=$(ps aux | grep -E "sleep.*PHASE" | grep -v grep | wc -l)
+        PHASES=$(ps aux | grep -E "sleep.*(PHASE|--source phase-)" | grep -v grep | wc -l)
         WEBHOOK=$(pgrep -f webhook_server.py > /dev/null && echo "UP" || echo "DOWN")
         
         if [ "$WEBHOOK" = "UP" ]; then
@@ -93,10 +93,10 @@ with open('$TRACKER') as f:
         
     phases)
         echo -e "${BOLD}Scheduled Phases:${NC}"
-        ps aux | grep -E "sleep.*PHASE" | grep -v grep | while read line; do
-            if [[ "$line" =~ sleep[[:space:]]+([0-9]+) ]] && [[ "$line" =~ ([^[:space:]]+):0.*PHASE[[:space:]]+([0-9]+) ]]; then
-                SECONDS="${BASH_REMATCH[1]}"
-                PROJECT="${BASH_REMATCH[2]}"
+        ps aux | grep -E "sleep.*(PHASE|--source phase-)" | grep -v grep | while read line; do
+            [[ "$line" =~ sleep[[:space:]]+([0-9]+) ]] && SECONDS="${BASH_REMATCH[1]}" || continue
+            if [[ "$line" =~ ([^[:space:]]+):0.*(PHASE[[:space:]]+|phase-)([0-9]+) ]]; then
+                PROJECT="${BASH_REMATCH[1]}"
                 PHASE="${BASH_REMATCH[3]}"
                 MINUTES=$((SECONDS / 60))
                 
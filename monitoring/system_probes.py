@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+IdeaBrow Pipeline - In-process System Probes
+Process, port, disk and memory checks without forking df/free/pgrep/lsof
+"""
+
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    # Fallback - read /proc directly when psutil is not installed
+    psutil = None
+
+TCP_LISTEN = '0A'
+
+def find_processes(pattern: str) -> List[int]:
+    """Return PIDs whose command line contains pattern (like pgrep -f)"""
+    own_pid = os.getpid()
+    pids = []
+
+    if psutil:
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            try:
+                cmdline = ' '.join(proc.info['cmdline'] or [])
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if pattern in cmdline and proc.info['pid'] != own_pid:
+                pids.append(proc.info['pid'])
+        return pids
+
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                cmdline = f.read().replace(b'\0', b' ').decode(errors='replace')
+        except OSError:
+            continue
+        if pattern in cmdline and int(entry.name) != own_pid:
+            pids.append(int(entry.name))
+    return pids
+
+def is_port_listening(port: int) -> bool:
+    """Check whether anything is listening on a local TCP port (like lsof -i)"""
+    if psutil:
+        try:
+            return any(
+                conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN
+                for conn in psutil.net_connections(kind='tcp')
+            )
+        except (psutil.AccessDenied, OSError):
+            pass
+
+    port_hex = f'{port:04X}'
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table) as f:
+                next(f, None)
+                for line in f:
+                    parts = line.split()
+                    if len(parts) > 3 and parts[3] == TCP_LISTEN and parts[1].endswith(f':{port_hex}'):
+                        return True
+        except OSError:
+            continue
+    return False
+
+def disk_usage_percent(path: Path) -> int:
+    """Percentage of the filesystem holding path that is in use (df Use%)"""
+    path = Path(path)
+    while not path.exists() and path != path.parent:
+        path = path.parent
+
+    st = os.statvfs(path)
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    available = st.f_bavail * st.f_frsize
+    if used + available == 0:
+        return 0
+    # df rounds the percentage up
+    return -(-used * 100 // (used + available))
+
+def memory_usage_percent() -> int:
+    """Percentage of physical memory in use"""
+    if psutil:
+        return int(psutil.virtual_memory().percent)
+
+    meminfo = {}
+    with open('/proc/meminfo') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            meminfo[key] = int(value.split()[0])
+    total = meminfo.get('MemTotal', 0)
+    if not total:
+        return 0
+    available = meminfo.get('MemAvailable', meminfo.get('MemFree', 0))
+    return int((total - available) * 100 / total)
+
+def check_github_ssh(timeout: float = 5) -> bool:
+    """Slow probe: can we authenticate to GitHub over SSH?"""
+    try:
+        result = subprocess.run(
+            ["ssh", "-T", "-o", "BatchMode=yes", "git@github.com"],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return "successfully authenticated" in result.stderr
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+
+class CachedProbe:
+    """
+    Runs an expensive probe in the background and caches its result
+
+    get() never blocks on the probe (unless asked to wait for the first
+    result); a stale value triggers a refresh in a daemon thread and the
+    last known value is returned meanwhile.
+    """
+
+    def __init__(self, probe: Callable[[], object], ttl: float = 300, default=None):
+        self.probe = probe
+        self.ttl = ttl
+        self.value = default
+        self.updated_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._done = threading.Event()
+
+    def _run(self):
+        try:
+            value = self.probe()
+        except Exception:
+            value = self.value
+        with self._lock:
+            self.value = value
+            self.updated_at = time.monotonic()
+            self._running = False
+        self._done.set()
+
+    def refresh(self):
+        """Start a background refresh unless one is already running"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def get(self, wait: float = 0):
+        """Return the cached value, refreshing in the background if stale"""
+        if self.updated_at is None or time.monotonic() - self.updated_at > self.ttl:
+            self.refresh()
+        if wait and self.updated_at is None:
+            self._done.wait(wait)
+        return self.value
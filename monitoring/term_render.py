@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+IdeaBrow Pipeline - Differential Terminal Renderer
+Keeps the previous frame and rewrites only the lines that changed
+"""
+
+import re
+import shutil
+import sys
+import unicodedata
+from typing import List, TextIO
+
+ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+HIDE_CURSOR = '\x1b[?25l'
+SHOW_CURSOR = '\x1b[?25h'
+CLEAR_SCREEN = '\x1b[H\x1b[2J'
+CLEAR_LINE = '\x1b[K'
+RESET = '\x1b[0m'
+
+def strip_ansi(text: str) -> str:
+    """Remove color/style escape sequences"""
+    return ANSI_RE.sub('', text)
+
+def _char_width(ch: str) -> int:
+    if unicodedata.combining(ch) or ch in '\u200d\ufe0f':
+        return 0
+    return 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+
+def fit_line(line: str, width: int) -> str:
+    """Clip a line to width visible columns, keeping escape sequences intact"""
+    out = []
+    used = 0
+    pos = 0
+    while pos < len(line):
+        match = ANSI_RE.match(line, pos)
+        if match:
+            out.append(match.group(0))
+            pos = match.end()
+            continue
+        ch = line[pos]
+        w = _char_width(ch)
+        if used + w > width:
+            break
+        out.append(ch)
+        used += w
+        pos += 1
+    return ''.join(out)
+
+class FrameRenderer:
+    """
+    Cursor-addressed renderer for full-screen dashboards
+
+    render() takes the complete frame as a list of lines and writes only
+    the rows whose content differs from the previous frame, in a single
+    write. Lines are clipped to the terminal so rows never wrap. In
+    low-bandwidth mode colors are stripped, which keeps each update small
+    over slow SSH links.
+    """
+
+    def __init__(self, stream: TextIO = None, low_bandwidth: bool = False):
+        self.stream = stream or sys.stdout
+        self.low_bandwidth = low_bandwidth
+        self.previous: List[str] = []
+        self.size = None
+        self.bytes_written = 0
+
+    def reset(self):
+        """Force a full repaint on the next frame"""
+        self.previous = []
+        self.size = None
+
+    def render(self, lines: List[str]) -> int:
+        """Draw a frame; return the number of rows rewritten"""
+        size = shutil.get_terminal_size((80, 24))
+        width, height = size.columns, size.lines
+
+        if self.low_bandwidth:
+            lines = [strip_ansi(line) for line in lines]
+
+        if len(lines) > height:
+            hidden = len(lines) - height + 1
+            lines = lines[:height - 1] + [f"... {hidden} more lines (enlarge the terminal to see them)"]
+        lines = [fit_line(line, width) for line in lines]
+
+        out = []
+        if size != self.size:
+            # First frame or terminal resized - repaint everything
+            out.append(HIDE_CURSOR + CLEAR_SCREEN)
+            self.previous = []
+            self.size = size
+
+        rows = 0
+        for row, line in enumerate(lines):
+            if row < len(self.previous) and self.previous[row] == line:
+                continue
+            out.append(f'\x1b[{row + 1};1H{line}{RESET}{CLEAR_LINE}')
+            rows += 1
+
+        # Blank rows left over from a longer previous frame
+        for row in range(len(lines), len(self.previous)):
+            out.append(f'\x1b[{row + 1};1H{CLEAR_LINE}')
+            rows += 1
+
+        if out:
+            data = ''.join(out)
+            self.stream.write(data)
+            self.stream.flush()
+            self.bytes_written += len(data.encode('utf-8', errors='replace'))
+
+        self.previous = lines
+        return rows
+
+    def close(self):
+        """Restore the cursor below the last frame"""
+        self.stream.write(f'\x1b[{len(self.previous) + 1};1H{SHOW_CURSOR}')
+        self.stream.flush()
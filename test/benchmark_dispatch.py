@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Message Delivery Benchmark - tmux buffer paste vs send-claude-message.sh typing
+Usage: python3 benchmark_dispatch.py [--messages 20] [--size 1500] [--submit-delay 0.5]
+
+Runs on a private tmux server (tmux -L), so live sessions are not touched.
+The pane runs `cat` into a file, which is compared with what was sent.
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "webhook-server"))
+from message_dispatcher import MessageDispatcher
+
+SOCKET = "dispatch-bench"
+
+# Same steps as the orchestrator's send-claude-message.sh, pointed at the private server
+SCRIPT_TEMPLATE = """#!/bin/bash
+tmux -L {socket} send-keys -t "$1" "$2"
+sleep {delay}
+tmux -L {socket} send-keys -t "$1" Enter
+"""
+
+PARAGRAPH = ("PHASE 2 - CORE FEATURE DEVELOPMENT 🚀\n"
+             "- Build the \"main\" user flow end-to-end; don't stub it\n"
+             "- Update PROGRESS_TRACKER.md ✅ after each task (it's the source of truth)\n"
+             "- Run `npm test` and fix failures before moving on: $HOME & <tags> stay literal\n")
+
+def make_message(size, index):
+    text = f"[message {index}]\n"
+    while len(text) < size:
+        text += PARAGRAPH
+    return text[:size].rstrip("\n")
+
+def tmux(*args):
+    return subprocess.run(["tmux", "-L", SOCKET] + list(args), capture_output=True, text=True)
+
+def wait_for_output(path, expected, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if path.exists() and len(path.read_bytes()) >= len(expected.encode()):
+            break
+        time.sleep(0.1)
+    return path.read_text(errors='replace') if path.exists() else ""
+
+def run_method(method, messages, submit_delay, workdir):
+    output = workdir / f"{method}.out"
+    session = f"bench-{method}"
+    tmux("new-session", "-d", "-s", session, "-x", "200", "-y", "50", f"stty -echo; cat > {output}")
+    time.sleep(0.5)
+
+    script = workdir / "send-claude-message.sh"
+    script.write_text(SCRIPT_TEMPLATE.format(socket=SOCKET, delay=submit_delay))
+    script.chmod(0o755)
+
+    dispatcher = MessageDispatcher(workdir / f"state-{method}", rate_per_minute=1e6, burst=len(messages),
+                                   jitter_seconds=0, send_script=script, method=method,
+                                   submit_delay=submit_delay, tmux_socket=SOCKET)
+    latencies = []
+    failures = 0
+    started = time.time()
+    for message in messages:
+        t0 = time.time()
+        result = dispatcher.dispatch(f"{session}:0.0", message, source="benchmark", jitter=False)
+        latencies.append(time.time() - t0)
+        failures += 0 if result['success'] else 1
+    elapsed = time.time() - started
+
+    expected = "".join(m + "\n" for m in messages)
+    received = wait_for_output(output, expected)
+    tmux("kill-session", "-t", session)
+
+    total_bytes = sum(len(m.encode()) for m in messages)
+    return {
+        'method': method,
+        'messages': len(messages),
+        'failures': failures,
+        'elapsed': elapsed,
+        'per_second': len(messages) / elapsed,
+        'kb_per_second': total_bytes / 1024 / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'max_ms': max(latencies) * 1000,
+        'intact': received == expected
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark tmux buffer delivery against the send script')
+    parser.add_argument('--messages', type=int, default=20, help='Messages per method (default: 20)')
+    parser.add_argument('--size', type=int, default=1500, help='Characters per message (default: 1500)')
+    parser.add_argument('--submit-delay', type=float, default=0.5,
+                        help='Pause before Enter, used by both methods (default: 0.5)')
+    args = parser.parse_args()
+
+    if not shutil.which("tmux"):
+        print("❌ tmux not found")
+        return 1
+
+    messages = [make_message(args.size, i) for i in range(args.messages)]
+    workdir = Path(tempfile.mkdtemp(prefix="dispatch-bench-"))
+    try:
+        results = [run_method(method, messages, args.submit_delay, workdir) for method in ('script', 'buffer')]
+    finally:
+        tmux("kill-server")
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{args.messages} messages x {args.size} chars, submit delay {args.submit_delay}s\n")
+    print(f"{'method':<8} {'msg/s':>7} {'KB/s':>8} {'p50 ms':>8} {'max ms':>8} {'fail':>5}  intact")
+    for r in results:
+        print(f"{r['method']:<8} {r['per_second']:>7.2f} {r['kb_per_second']:>8.1f} {r['p50_ms']:>8.0f} "
+              f"{r['max_ms']:>8.0f} {r['failures']:>5}  {'✅' if r['intact'] else '❌'}")
+    script, buffer = results
+    print(f"\nbuffer/script throughput: {buffer['per_second'] / script['per_second']:.1f}x")
+    return 0 if all(r['intact'] and not r['failures'] for r in results) else 1
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tracker Generation Benchmark - docs/ through generate_tracker_template_aware.py against the local stub
+Usage: python3 benchmark_tracker_generation.py [--runs 3] [--modes default,stream,chunked,batch]
+                                               [--latency lognormal:0.8,0.5] [--error-rate 0.05]
+
+Starts openai_stub_server.py on a free port and runs the generator as a
+subprocess, the way the process-docs workflow does, with a fresh response
+cache per run. No API key or network access is needed.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from openai_stub_server import StubConfig, create_stub_server, serve_in_thread
+
+REPO_DIR = Path(__file__).parent.parent
+GENERATOR = REPO_DIR / "automated-dev-orchestrator" / "scripts" / "generate_tracker_template_aware.py"
+
+MODE_FLAGS = {
+    'default': [],
+    'stream': ['--stream'],
+    'chunked': ['--chunked', '--chunk-tokens', '1500'],
+}
+
+def fetch_stats(base_url):
+    with urllib.request.urlopen(base_url.rsplit("/v1", 1)[0] + "/stats") as response:
+        return json.load(response)
+
+def run_generator(mode, docs_dirs, workdir, base_url, concurrency):
+    cache_dir = workdir / "cache"
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    command = [sys.executable, str(GENERATOR), '--cache-dir', str(cache_dir),
+               '--concurrency', str(concurrency), '--base-url', base_url]
+    if mode == 'batch':
+        command += ['--batch'] + [str(d) for d in docs_dirs] + ['--output-dir', str(workdir / "trackers")]
+    else:
+        command += ['--project-path', str(docs_dirs[0]), '--output', str(workdir / "PROGRESS_TRACKER.md"),
+                    '--extract-project-name'] + MODE_FLAGS[mode]
+
+    env = dict(os.environ, OPENROUTER_API_KEY="stub", OPENROUTER_BASE_URL=base_url)
+    started = time.time()
+    result = subprocess.run(command, capture_output=True, text=True, env=env, timeout=900)
+    elapsed = time.time() - started
+
+    if mode == 'batch':
+        summary = workdir / "trackers" / "batch_summary.jsonl"
+        records = [json.loads(line) for line in summary.read_text().splitlines()] if summary.exists() else []
+        ok = result.returncode == 0 and len(records) == len(docs_dirs) and all(r['success'] for r in records)
+    else:
+        tracker = workdir / "PROGRESS_TRACKER.md"
+        ok = (result.returncode == 0 and "PROJECT_NAME:" in result.stdout and tracker.exists()
+              and tracker.read_text().startswith("# Project:"))
+
+    # The client is shared across a batch, so the last count is the run's total
+    retries = 0
+    for line in result.stdout.splitlines():
+        if line.startswith("API retries:"):
+            retries = int(line.split(":")[1])
+    if not ok:
+        print(f"❌ {mode} run failed (exit {result.returncode}):\n{result.stdout[-2000:]}{result.stderr[-2000:]}")
+    return {'ok': ok, 'elapsed': elapsed, 'retries': retries}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark tracker generation end to end against the OpenAI stub')
+    parser.add_argument('--docs', type=str, default=str(REPO_DIR / "docs"),
+                        help='Requirements directory (default: repo docs/)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per mode (default: 3)')
+    parser.add_argument('--modes', type=str, default='default,stream,chunked,batch',
+                        help='Comma-separated: default, stream, chunked, batch (default: all)')
+    parser.add_argument('--latency', type=str, default='lognormal:0.8,0.5',
+                        help='Stub time-to-first-token distribution (default: lognormal:0.8,0.5)')
+    parser.add_argument('--tokens-per-second', type=float, default=60.0, help='Stub generation speed (default: 60)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Stub 500 rate (default: 0)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Stub 429 rate (default: 0)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Generator --concurrency (default: 4)')
+    parser.add_argument('--seed', type=int, default=42, help='Stub random seed (default: 42)')
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODE_FLAGS and m != 'batch']
+    if unknown:
+        print(f"❌ Unknown mode(s): {', '.join(unknown)}")
+        return 1
+
+    docs = Path(args.docs)
+    if not list(docs.glob("**/*.md")):
+        print(f"❌ No markdown files in {docs}")
+        return 1
+    # Batch mode runs the docs alongside the sample docs used by mock_github.py
+    batch_dirs = [docs, Path(__file__).parent / "sample-docs"]
+
+    config = StubConfig(args.latency, args.tokens_per_second, args.error_rate, args.rate_limit_rate,
+                        retry_after=0.5, seed=args.seed)
+    server = create_stub_server(port=0, config=config)
+    base_url = serve_in_thread(server)
+    workdir = Path(tempfile.mkdtemp(prefix="tracker-bench-"))
+    print(f"Stub: {base_url} latency={args.latency} tokens/s={args.tokens_per_second:g} "
+          f"errors={args.error_rate:g} rate-limited={args.rate_limit_rate:g}")
+    print(f"Docs: {docs} ({len(list(docs.glob('**/*.md')))} files), {args.runs} run(s) per mode\n")
+
+    results = []
+    try:
+        for mode in modes:
+            before = fetch_stats(base_url)
+            runs = [run_generator(mode, batch_dirs if mode == 'batch' else [docs], workdir, base_url,
+                                  args.concurrency) for _ in range(args.runs)]
+            after = fetch_stats(base_url)
+            times = [r['elapsed'] for r in runs]
+            results.append({
+                'mode': mode,
+                'ok': sum(r['ok'] for r in runs),
+                'p50': statistics.median(times),
+                'max': max(times),
+                'requests': (after['requests'] - before['requests']) / len(runs),
+                'errors': (after['server_errors'] + after['rate_limited']
+                           - before['server_errors'] - before['rate_limited']) / len(runs),
+                'retries': sum(r['retries'] for r in runs) / len(runs)
+            })
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'mode':<8} {'ok':>5} {'p50 s':>7} {'max s':>7} {'req/run':>8} {'err/run':>8} {'retry/run':>10}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['ok']:>2}/{args.runs:<2} {r['p50']:>7.2f} {r['max']:>7.2f} "
+              f"{r['requests']:>8.1f} {r['errors']:>8.1f} {r['retries']:>10.1f}")
+    return 0 if all(r['ok'] == args.runs for r in results) else 1
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Mock GitHub API Server - offline stand-in for the GitHub REST endpoints the pipeline uses
+Usage: python3 mock_github_api.py [--port 8789] [--rate-limit 5000] [--rate-limit-window 3600]
+                                  [--secondary-rate 0.05] [--error-rate 0.02] [--latency 0.05]
+
+Point the GitHub client at it:
+    GITHUB_API_URL=http://127.0.0.1:8789 GH_PAT=mock \\
+        python3 automated-dev-orchestrator/scripts/github_client.py create my-project
+
+Serves GET /repos/{owner}/{repo} (with ETag / 304), POST /orgs/{org}/repos
+(422 "name already exists" on duplicates), GET /rate_limit and GET /stats,
+plus the Git Data API (blobs, trees, commits, refs) and PUT .../contents/{path}.
+Like GitHub, Git Data calls on a repository with no commits get 409
+"Git Repository is empty."
+
+Every response carries X-RateLimit-* headers; once --rate-limit requests are
+used in a window the server answers 403 until the reset, like GitHub's
+primary limit. --secondary-rate answers 403 + Retry-After with GitHub's
+"secondary rate limit" message. Any Authorization header is accepted.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+class MockGitHubState:
+    """Repositories and rate-limit counters shared by all request handlers"""
+
+    def __init__(self, rate_limit=5000, rate_limit_window=3600, secondary_rate=0.0, error_rate=0.0,
+                 retry_after=1.0, latency=0.0, seed=None):
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.secondary_rate = secondary_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.repos = {}
+        self.git = {}
+        self.used = 0
+        self.reset_at = int(time.time() + rate_limit_window)
+        self.next_id = 1
+        self.stats = {"requests": 0, "not_modified": 0, "created": 0, "duplicates": 0,
+                      "primary_limited": 0, "secondary_limited": 0, "server_errors": 0, "unauthorized": 0,
+                      "blobs": 0, "trees": 0, "commits": 0, "ref_updates": 0}
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def consume(self):
+        """Use one request from the primary limit; False if it is exhausted"""
+        with self.lock:
+            now = time.time()
+            if now >= self.reset_at:
+                self.used = 0
+                self.reset_at = int(now + self.rate_limit_window)
+            if self.used >= self.rate_limit:
+                return False
+            self.used += 1
+            return True
+
+    def rate_headers(self):
+        with self.lock:
+            return {
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(max(self.rate_limit - self.used, 0)),
+                "X-RateLimit-Reset": str(self.reset_at),
+                "X-RateLimit-Used": str(self.used),
+                "X-RateLimit-Resource": "core"
+            }
+
+    def roll(self):
+        """One random draw per counted request: ok, secondary_limited or server_error"""
+        with self.lock:
+            r = self.rng.random()
+        if r < self.secondary_rate:
+            return "secondary_limited"
+        if r < self.secondary_rate + self.error_rate:
+            return "server_error"
+        return "ok"
+
+    def create_repo(self, owner, payload):
+        """Repository dict, or None if the name is taken"""
+        name = payload.get("name", "")
+        with self.lock:
+            key = (owner.lower(), name.lower())
+            if key in self.repos:
+                self.stats["duplicates"] += 1
+                return None
+            repo = {
+                "id": self.next_id,
+                "name": name,
+                "full_name": f"{owner}/{name}",
+                "private": payload.get("private", True),
+                "description": payload.get("description"),
+                "html_url": f"https://github.com/{owner}/{name}",
+                "ssh_url": f"git@github.com:{owner}/{name}.git",
+                "clone_url": f"https://github.com/{owner}/{name}.git",
+                "default_branch": "main",
+                "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "size": 0
+            }
+            self.next_id += 1
+            self.repos[key] = repo
+            self.stats["created"] += 1
+            return repo
+
+    def get_repo(self, owner, name):
+        with self.lock:
+            return self.repos.get((owner.lower(), name.lower()))
+
+    def git_store(self, owner, name):
+        """Objects and refs of a repository, or None if it does not exist"""
+        key = (owner.lower(), name.lower())
+        with self.lock:
+            if key not in self.repos:
+                return None
+            return self.git.setdefault(key, {"objects": {}, "refs": {}})
+
+    def add_object(self, store, obj):
+        """Store a git object and return its sha (blobs hash like `git hash-object`)"""
+        if obj["type"] == "blob":
+            sha = hashlib.sha1(b"blob %d\0" % len(obj["content"]) + obj["content"]).hexdigest()
+        else:
+            sha = hashlib.sha1(json.dumps(obj, sort_keys=True).encode()).hexdigest()
+        with self.lock:
+            store["objects"][sha] = obj
+            self.stats[obj["type"] + "s"] += 1
+        return sha
+
+    def files_at(self, owner, name, branch="main"):
+        """{path: bytes} at the tip of a branch - for checking what a client committed"""
+        store = self.git_store(owner, name)
+        sha = store and store["refs"].get(f"refs/heads/{branch}")
+        if not sha:
+            return {}
+        tree = store["objects"][store["objects"][sha]["tree"]]
+        return {e["path"]: store["objects"][e["sha"]]["content"] for e in tree["entries"]}
+
+    def is_ancestor(self, store, ancestor, sha):
+        pending = [sha]
+        while pending:
+            current = pending.pop()
+            if current == ancestor:
+                return True
+            pending.extend(store["objects"].get(current, {}).get("parents", []))
+        return False
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.stats, repos=len(self.repos), rate_limit_used=self.used)
+
+def etag_for(payload):
+    return '"' + hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest() + '"'
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in self.state.rate_headers().items():
+            self.send_header(name, value)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return None
+
+    def _admit(self):
+        """Auth, injected failures and the primary limit; False if a response was already sent"""
+        if not self.headers.get("Authorization"):
+            self.state.count("unauthorized")
+            self._send_json(401, {"message": "Requires authentication"})
+            return False
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        outcome = self.state.roll()
+        if outcome == "secondary_limited":
+            self.state.count("secondary_limited")
+            self._send_json(403, {"message": "You have exceeded a secondary rate limit. Please wait a few "
+                                             "minutes before you try again."},
+                            {"Retry-After": f"{self.state.retry_after:g}"})
+            return False
+        if outcome == "server_error":
+            self.state.count("server_errors")
+            self._send_json(502, {"message": "Server Error"})
+            return False
+        if not self.state.consume():
+            self.state.count("primary_limited")
+            self._send_json(403, {"message": "API rate limit exceeded (mock)"})
+            return False
+        return True
+
+    def do_GET(self):
+        path = self.path.split("?")[0].rstrip("/")
+        if path == "/stats":
+            self._send_json(200, self.state.snapshot())
+            return
+        if path == "/rate_limit":
+            # Like GitHub, checking the rate limit does not use it
+            headers = self.state.rate_headers()
+            core = {"limit": int(headers["X-RateLimit-Limit"]), "remaining": int(headers["X-RateLimit-Remaining"]),
+                    "reset": int(headers["X-RateLimit-Reset"]), "used": int(headers["X-RateLimit-Used"])}
+            self._send_json(200, {"resources": {"core": core}, "rate": core})
+            return
+
+        match = re.fullmatch(r"/repos/([^/]+)/([^/]+)", path)
+        if match:
+            self.state.count("requests")
+            repo = self.state.get_repo(*match.groups())
+            etag = etag_for(repo) if repo else None
+            if repo and self.headers.get("If-None-Match") == etag and self.headers.get("Authorization"):
+                # Conditional requests answered with 304 do not count against the limit
+                self.state.count("not_modified")
+                self._send_json(304, None, {"ETag": etag})
+                return
+            if not self._admit():
+                return
+            if repo:
+                self._send_json(200, repo, {"ETag": etag})
+            else:
+                self._send_json(404, {"message": "Not Found"})
+            return
+        self._route("GET")
+
+    def do_POST(self):
+        self._route("POST")
+
+    def do_PUT(self):
+        self._route("PUT")
+
+    def do_PATCH(self):
+        self._route("PATCH")
+
+    def _route(self, method):
+        path = unquote(self.path.split("?")[0].rstrip("/"))
+        self.state.count("requests")
+        payload = self._read_json() if method != "GET" else {}
+        if payload is None:
+            self._send_json(400, {"message": "Problems parsing JSON"})
+            return
+
+        for route_method, pattern, handler in self.ROUTES:
+            match = re.fullmatch(pattern, path)
+            if route_method == method and match:
+                if not self._admit():
+                    return
+                getattr(self, handler)(payload, *match.groups())
+                return
+        self._send_json(404, {"message": "Not Found"})
+
+    ROUTES = [
+        ("POST", r"/orgs/([^/]+)/repos", "_create_repo"),
+        ("PUT", r"/repos/([^/]+)/([^/]+)/contents/(.+)", "_put_contents"),
+        ("POST", r"/repos/([^/]+)/([^/]+)/git/blobs", "_create_blob"),
+        ("POST", r"/repos/([^/]+)/([^/]+)/git/trees", "_create_tree"),
+        ("POST", r"/repos/([^/]+)/([^/]+)/git/commits", "_create_commit"),
+        ("GET", r"/repos/([^/]+)/([^/]+)/git/commits/([0-9a-f]+)", "_get_commit"),
+        ("GET", r"/repos/([^/]+)/([^/]+)/git/ref/(heads/.+)", "_get_ref"),
+        ("POST", r"/repos/([^/]+)/([^/]+)/git/refs", "_create_ref"),
+        ("PATCH", r"/repos/([^/]+)/([^/]+)/git/refs/(heads/.+)", "_update_ref"),
+    ]
+
+    def _create_repo(self, payload, owner):
+        if not payload.get("name"):
+            self._send_json(422, {"message": "Repository creation failed.",
+                                  "errors": [{"resource": "Repository", "code": "missing_field", "field": "name"}]})
+            return
+        repo = self.state.create_repo(owner, payload)
+        if repo is None:
+            self._send_json(422, {"message": "Repository creation failed.",
+                                  "errors": [{"resource": "Repository", "code": "custom", "field": "name",
+                                              "message": "name already exists on this account"}]})
+            return
+        self._send_json(201, repo)
+
+    def _git_store(self, owner, name, allow_empty=False):
+        """The repository's git store, or None after sending 404 / GitHub's empty-repository 409"""
+        store = self.state.git_store(owner, name)
+        if store is None:
+            self._send_json(404, {"message": "Not Found"})
+            return None
+        if not store["refs"] and not allow_empty:
+            self._send_json(409, {"message": "Git Repository is empty."})
+            return None
+        return store
+
+    def _put_contents(self, payload, owner, name, path):
+        store = self._git_store(owner, name, allow_empty=True)
+        if store is None:
+            return
+        ref = f"refs/heads/{payload.get('branch', 'main')}"
+        parent = store["refs"].get(ref)
+        entries = []
+        if parent:
+            tree = store["objects"][store["objects"][parent]["tree"]]
+            entries = [e for e in tree["entries"] if e["path"] != path]
+        blob = self.state.add_object(store, {"type": "blob", "content": base64.b64decode(payload.get("content", ""))})
+        entries.append({"path": path, "mode": "100644", "type": "blob", "sha": blob})
+        tree_sha = self.state.add_object(store, {"type": "tree", "entries": sorted(entries, key=lambda e: e["path"])})
+        commit = self.state.add_object(store, {"type": "commit", "tree": tree_sha, "parents": [parent] if parent else [],
+                                               "message": payload.get("message", "")})
+        store["refs"][ref] = commit
+        self._send_json(201, {"content": {"path": path, "sha": blob}, "commit": {"sha": commit}})
+
+    def _create_blob(self, payload, owner, name):
+        store = self._git_store(owner, name)
+        if store is None:
+            return
+        content = payload.get("content", "")
+        data = base64.b64decode(content) if payload.get("encoding") == "base64" else content.encode()
+        self._send_json(201, {"sha": self.state.add_object(store, {"type": "blob", "content": data})})
+
+    def _create_tree(self, payload, owner, name):
+        store = self._git_store(owner, name)
+        if store is None:
+            return
+        base_tree = payload.get("base_tree")
+        if base_tree and store["objects"].get(base_tree, {}).get("type") != "tree":
+            self._send_json(422, {"message": "base_tree does not exist"})
+            return
+        # Entries of the base tree are kept unless the request overrides them
+        entries = {e["path"]: e for e in store["objects"][base_tree]["entries"]} if base_tree else {}
+        for entry in payload.get("tree", []):
+            if "content" in entry:
+                sha = self.state.add_object(store, {"type": "blob", "content": entry["content"].encode()})
+            elif store["objects"].get(entry.get("sha"), {}).get("type") == "blob":
+                sha = entry["sha"]
+            else:
+                self._send_json(422, {"message": f"Invalid tree info for {entry.get('path')}"})
+                return
+            entries[entry["path"]] = {"path": entry["path"], "mode": entry.get("mode", "100644"), "type": "blob", "sha": sha}
+        entries = sorted(entries.values(), key=lambda e: e["path"])
+        sha = self.state.add_object(store, {"type": "tree", "entries": entries})
+        self._send_json(201, {"sha": sha, "tree": entries})
+
+    def _create_commit(self, payload, owner, name):
+        store = self._git_store(owner, name)
+        if store is None:
+            return
+        tree, parents = payload.get("tree"), payload.get("parents", [])
+        if store["objects"].get(tree, {}).get("type") != "tree" or any(p not in store["objects"] for p in parents):
+            self._send_json(422, {"message": "Tree SHA or parent SHA does not exist"})
+            return
+        sha = self.state.add_object(store, {"type": "commit", "tree": tree, "parents": parents,
+                                            "message": payload.get("message", ""), "author": payload.get("author")})
+        self._send_json(201, {"sha": sha, "tree": {"sha": tree}, "parents": [{"sha": p} for p in parents]})
+
+    def _get_commit(self, payload, owner, name, sha):
+        store = self._git_store(owner, name)
+        if store is None:
+            return
+        commit = store["objects"].get(sha)
+        if not commit or commit["type"] != "commit":
+            self._send_json(404, {"message": "Not Found"})
+            return
+        self._send_json(200, {"sha": sha, "tree": {"sha": commit["tree"]}, "message": commit["message"],
+                              "parents": [{"sha": p} for p in commit["parents"]]})
+
+    def _get_ref(self, payload, owner, name, ref):
+        store = self._git_store(owner, name)
+        if store is None:
+            return
+        sha = store["refs"].get(f"refs/{ref}")
+        if not sha:
+            self._send_json(404, {"message": "Not Found"})
+            return
+        self._send_json(200, {"ref": f"refs/{ref}", "object": {"sha": sha, "type": "commit"}})
+
+    def _create_ref(self, payload, owner, name):
+        store = self._git_store(owner, name)
+        if store is None:
+            return
+        ref, sha = payload.get("ref", ""), payload.get("sha")
+        if ref in store["refs"]:
+            self._send_json(422, {"message": "Reference already exists"})
+            return
+        if store["objects"].get(sha, {}).get("type") != "commit":
+            self._send_json(422, {"message": "Object does not exist"})
+            return
+        store["refs"][ref] = sha
+        self.state.count("ref_updates")
+        self._send_json(201, {"ref": ref, "object": {"sha": sha, "type": "commit"}})
+
+    def _update_ref(self, payload, owner, name, ref):
+        store = self._git_store(owner, name)
+        if store is None:
+            return
+        ref, sha = f"refs/{ref}", payload.get("sha")
+        if ref not in store["refs"]:
+            self._send_json(422, {"message": "Reference does not exist"})
+            return
+        if store["objects"].get(sha, {}).get("type") != "commit":
+            self._send_json(422, {"message": "Object does not exist"})
+            return
+        if not payload.get("force") and not self.state.is_ancestor(store, store["refs"][ref], sha):
+            self._send_json(422, {"message": "Update is not a fast forward"})
+            return
+        store["refs"][ref] = sha
+        self.state.count("ref_updates")
+        self._send_json(200, {"ref": ref, "object": {"sha": sha, "type": "commit"}})
+
+def create_mock_server(host="127.0.0.1", port=8789, state=None):
+    """Factory function - port 0 picks a free port (see server.server_address)"""
+    handler = type("ConfiguredMockGitHubHandler", (MockGitHubHandler,), {"state": state or MockGitHubState()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def serve_in_thread(server):
+    """Run the server on a daemon thread and return its API URL"""
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock GitHub REST API for offline runs')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8789, help='Port (default: 8789, 0 for any free port)')
+    parser.add_argument('--rate-limit', type=int, default=5000, help='Requests per window (default: 5000)')
+    parser.add_argument('--rate-limit-window', type=float, default=3600,
+                        help='Primary rate limit window in seconds (default: 3600)')
+    parser.add_argument('--secondary-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with a secondary rate limit 403')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 502')
+    parser.add_argument('--retry-after', type=float, default=1.0,
+                        help='Retry-After seconds on secondary limits (default: 1)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to each request (default: 0)')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible failures')
+    args = parser.parse_args()
+
+    state = MockGitHubState(args.rate_limit, args.rate_limit_window, args.secondary_rate, args.error_rate,
+                            args.retry_after, args.latency, args.seed)
+    server = create_mock_server(args.host, args.port, state)
+    host, port = server.server_address[:2]
+    print(f"🐙 Mock GitHub API listening on http://{host}:{port}")
+    print(f"   rate-limit={args.rate_limit}/{args.rate_limit_window:g}s secondary={args.secondary_rate:g} "
+          f"errors={args.error_rate:g}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+        print(json.dumps(state.snapshot(), indent=2))
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
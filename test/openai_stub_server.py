@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+OpenAI-compatible Stub Server - offline stand-in for OpenRouter chat completions
+Usage: python3 openai_stub_server.py [--port 8787] [--latency lognormal:0.8,0.5] [--tokens-per-second 60]
+                                     [--error-rate 0.02] [--rate-limit-rate 0.05] [--responses canned.json]
+
+Point the tracker generator at it:
+    OPENROUTER_BASE_URL=http://127.0.0.1:8787/v1 OPENROUTER_API_KEY=stub \\
+        python3 automated-dev-orchestrator/scripts/generate_tracker_template_aware.py --project-path docs
+
+Serves POST .../chat/completions (plain JSON and `stream: true` server-sent
+events), GET .../models and GET /stats. Responses are templated per
+generator stage (analysis, plan, tracker, ...) and can be replaced with
+--responses, a JSON object mapping stage name to a template string.
+Templates may use {project}, {model} and {stage}.
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Generator stage detection: first system-prompt keyword that matches wins
+STAGE_MARKERS = [
+    ("tracker", "PROGRESS_TRACKER"),
+    ("name", "Suggest a short"),
+    ("merge", "Merge the partial analyses"),
+    ("chunk", "ONE PART"),
+    ("plan", "phased development plan"),
+    ("analysis", "requirements analyst"),
+]
+
+DEFAULT_RESPONSES = {
+    "analysis": """# {project}
+
+## Requirements Analysis
+
+1. Core functionality requirements
+- User accounts with profiles and saved preferences
+- Dashboard summarising the user's current items and their status
+- Create, edit and archive the project's primary records
+- Notifications when a tracked item changes state
+
+2. User stories and primary workflows
+- As a new user I can sign up and complete onboarding in under two minutes
+- As a returning user I can see what changed since my last visit
+- As an admin I can review and moderate user-submitted content
+
+3. Technical constraints and dependencies
+- Mobile-first responsive UI, WCAG AA accessibility
+- Third-party email and push notification providers
+
+4. Success criteria and key metrics
+- 60% of new users complete onboarding; p95 page load under 2 seconds
+
+5. Primary application category
+SaaS dashboard""",
+    "chunk": """# {project}
+
+1. Core functionality requirements
+- Features described in this part of the {project} documentation
+2. User stories and primary workflows
+- Workflows referenced in this part
+3. Technical constraints and dependencies
+None in this part
+4. Success criteria and key metrics
+None in this part
+5. Hints about the application category
+SaaS dashboard""",
+    "merge": "{analysis}",
+    "plan": """## Phased Development Plan: {project}
+
+Phase 1: Template Analysis & Adaptation
+- Deliverables: map of template features to requirements, list of gaps
+- Acceptance: every requirement is mapped to an existing or new component
+
+Phase 2: Core Features
+- Deliverables: primary records, dashboard and onboarding flow
+- Acceptance: a new user can sign up and create their first record
+
+Phase 3: Enhanced Features
+- Deliverables: notifications, search and filtering
+- Acceptance: state changes notify subscribed users within a minute
+
+Phase 4: Integration & Polish
+- Deliverables: email/push providers, responsive and accessible UI
+- Acceptance: Lighthouse accessibility score of 90 or more
+
+Phase 5: Testing & Deployment
+- Deliverables: end-to-end tests, production deployment
+- Acceptance: all critical flows pass in CI and on the deployed site""",
+    "tracker": """# Project: {project}
+
+## Phase 1: Template Analysis & Adaptation
+- [ ] Review the template's auth, database and UI components
+- [ ] Map each requirement to a template feature or a gap
+- [ ] Plan extensions to existing components
+
+## Phase 2: Core Features
+- [ ] Build the primary records on the template's database layer
+- [ ] Extend the dashboard with the user's items
+- [ ] Add onboarding to the template's auth flow
+
+## Phase 3: Enhanced Features
+- [ ] Notifications on state changes
+- [ ] Search and filtering
+
+## Phase 4: Integration & Polish
+- [ ] Email and push providers
+- [ ] Responsive and accessible UI pass
+
+## Phase 5: Testing & Deployment
+- [ ] End-to-end tests for critical flows
+- [ ] Production deployment and smoke test""",
+    "name": "{project}",
+    "default": "Stub response from {model}.",
+}
+
+def parse_distribution(spec):
+    """
+    Turn a latency spec into a sampler returning seconds
+
+    Accepted forms: "0.5" or "fixed:0.5", "uniform:MIN,MAX", "normal:MEAN,SD",
+    "lognormal:MEDIAN,SIGMA" and "exp:MEAN". Samples are clamped at zero.
+    """
+    kind, _, params = spec.partition(":") if ":" in spec else ("fixed", "", spec)
+    try:
+        values = [float(v) for v in params.split(",")] if params else []
+    except ValueError:
+        raise ValueError(f"Invalid distribution parameters: {spec}")
+
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exp": 1}
+    if kind not in expected or len(values) != expected[kind]:
+        raise ValueError(f"Invalid distribution '{spec}' (use fixed:S, uniform:A,B, normal:M,SD, "
+                         f"lognormal:MEDIAN,SIGMA or exp:MEAN)")
+
+    if kind == "fixed":
+        return lambda rng: max(0.0, values[0])
+    if kind == "uniform":
+        return lambda rng: max(0.0, rng.uniform(values[0], values[1]))
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda rng: rng.lognormvariate(math.log(max(values[0], 1e-6)), values[1])
+    return lambda rng: rng.expovariate(1.0 / values[0]) if values[0] > 0 else 0.0
+
+def detect_stage(messages):
+    system = " ".join(m.get("content") or "" for m in messages if m.get("role") == "system")
+    for stage, marker in STAGE_MARKERS:
+        if marker in system:
+            return stage
+    return "default"
+
+def detect_project(messages):
+    """Project name for templates: a "Project: X" line, else the first heading in the prompt"""
+    text = "\n".join(m.get("content") or "" for m in messages if m.get("role") == "user")
+    match = re.search(r'^Project:\s*(.+)$', text, re.MULTILINE)
+    if not match:
+        match = re.search(r'^#{1,2}\s+(?!File:|Partial analysis)(.+)$', text, re.MULTILINE)
+    name = match.group(1).strip() if match else "Stub Project"
+    return re.sub(r'\s*\((?:part \d+ of \d+)\)$', '', name)[:60]
+
+def tokenize(text):
+    """Word-sized pieces, used both for streaming deltas and as the token count"""
+    return re.findall(r'\S+\s*|\s+', text)
+
+class StubConfig:
+    """Behaviour shared by all request handlers"""
+
+    def __init__(self, latency="lognormal:0.8,0.5", tokens_per_second=60.0, error_rate=0.0,
+                 rate_limit_rate=0.0, retry_after=1.0, responses=None, seed=None):
+        self.latency = parse_distribution(latency)
+        self.latency_spec = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.responses = dict(DEFAULT_RESPONSES)
+        self.responses.update(responses or {})
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "streamed": 0, "server_errors": 0, "rate_limited": 0,
+                      "completion_tokens": 0, "by_stage": {}}
+
+    def roll(self):
+        """One random draw per request: (outcome, latency)"""
+        with self.lock:
+            r = self.rng.random()
+            latency = self.latency(self.rng)
+        if r < self.rate_limit_rate:
+            return "rate_limited", latency
+        if r < self.rate_limit_rate + self.error_rate:
+            return "server_error", latency
+        return "ok", latency
+
+    def render(self, stage, messages, model):
+        project = detect_project(messages)
+        template = self.responses.get(stage, self.responses["default"])
+        values = {"project": project, "model": model, "stage": stage}
+        values["analysis"] = DEFAULT_RESPONSES["analysis"].format(**values)
+        return re.sub(r'\{(\w+)\}', lambda m: str(values.get(m.group(1), m.group(0))), template)
+
+    def count(self, key, stage=None, tokens=0):
+        with self.lock:
+            self.stats[key] += 1
+            self.stats["completion_tokens"] += tokens
+            if stage:
+                self.stats["by_stage"][stage] = self.stats["by_stage"].get(stage, 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return json.loads(json.dumps(self.stats))
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/stats"):
+            self._send_json(200, self.config.snapshot())
+        elif self.path.rstrip("/").endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "not_found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body", "type": "invalid_request_error"}})
+            return
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "not_found"}})
+            return
+
+        messages = request.get("messages") or []
+        model = request.get("model", "stub")
+        stage = detect_stage(messages)
+        outcome, latency = self.config.roll()
+
+        if outcome == "rate_limited":
+            self.config.count("rate_limited")
+            self._send_json(429, {"error": {"message": "Rate limit exceeded (stub)", "type": "rate_limit_error"}},
+                            {"Retry-After": f"{self.config.retry_after:g}"})
+            return
+        if outcome == "server_error":
+            time.sleep(latency)
+            self.config.count("server_errors")
+            self._send_json(500, {"error": {"message": "Internal server error (stub)", "type": "server_error"}})
+            return
+
+        content = self.config.render(stage, messages, model)
+        pieces = tokenize(content)
+        prompt_tokens = sum(len(tokenize(m.get("content") or "")) for m in messages)
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(pieces),
+                 "total_tokens": prompt_tokens + len(pieces)}
+        interval = 1.0 / self.config.tokens_per_second if self.config.tokens_per_second > 0 else 0.0
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+
+        if not request.get("stream"):
+            time.sleep(latency + interval * len(pieces))
+            self.config.count("requests", stage, len(pieces))
+            self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": "stop"}],
+                "usage": usage
+            })
+            return
+
+        # Streaming: chunked server-sent events, one word per delta
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(choices, extra=None):
+            payload = {"id": completion_id, "object": "chat.completion.chunk", "created": created,
+                       "model": model, "choices": choices}
+            payload.update(extra or {})
+            self._write_chunk(f"data: {json.dumps(payload)}\n\n".encode())
+
+        try:
+            time.sleep(latency)
+            event([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+            for piece in pieces:
+                time.sleep(interval)
+                event([{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+            event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+            if (request.get("stream_options") or {}).get("include_usage"):
+                event([], {"usage": usage})
+            self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+            return
+        self.config.count("requests", stage, len(pieces))
+        self.config.count("streamed")
+
+def create_stub_server(host="127.0.0.1", port=8787, config=None):
+    """Factory function - port 0 picks a free port (see server.server_address)"""
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"config": config or StubConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def serve_in_thread(server):
+    """Run the server on a daemon thread and return its base URL"""
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/v1"
+
+def main():
+    parser = argparse.ArgumentParser(description='OpenAI-compatible chat completions stub for offline runs')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8787, help='Port (default: 8787, 0 for any free port)')
+    parser.add_argument('--latency', default='lognormal:0.8,0.5',
+                        help='Time to first token: fixed:S, uniform:A,B, normal:M,SD, lognormal:MEDIAN,SIGMA '
+                             'or exp:MEAN (default: lognormal:0.8,0.5)')
+    parser.add_argument('--tokens-per-second', type=float, default=60.0,
+                        help='Generation speed after the first token, 0 for instant (default: 60)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with 429 + Retry-After')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds on 429 (default: 1)')
+    parser.add_argument('--responses', type=str, help='JSON file mapping stage name to a response template')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible latency and errors')
+    args = parser.parse_args()
+
+    responses = json.loads(Path(args.responses).read_text()) if args.responses else None
+    config = StubConfig(args.latency, args.tokens_per_second, args.error_rate, args.rate_limit_rate,
+                        args.retry_after, responses, args.seed)
+    server = create_stub_server(args.host, args.port, config)
+    host, port = server.server_address[:2]
+    print(f"🤖 OpenAI stub listening on http://{host}:{port}/v1")
+    print(f"   latency={args.latency} tokens/s={args.tokens_per_second:g} "
+          f"errors={args.error_rate:g} rate-limited={args.rate_limit_rate:g}")
+    print(f"   stages: {', '.join(s for s, _ in STAGE_MARKERS)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+        print(json.dumps(config.snapshot(), indent=2))
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -110,7 +110,7 @@ class PipelineTester:
             
             scheduled_count = 0
             for line in result.stdout.split('\n'):
-                if 'sleep' in line and 'send-claude-message' in line and project_name in line:
+                if 'sleep' in line and ('send-claude-message' in line or 'message_dispatcher' in line) and project_name in line:
                     scheduled_count += 1
             
             if scheduled_count >= 4:  # Phases 2-5
@@ -21,6 +21,11 @@ SERVICE_DIR = Path("/home/wv3/ideabrow-automation/webhook-server")
 SERVICE_CMD = "python3 webhook_server.py"
 LOG_FILE = SERVICE_DIR / "webhook_server.log"
 STATE_FILE = SERVICE_DIR / "webhook_state.json"
+PROCESSED_DIR = Path("/home/wv3/ideabrow-automation/processed")
+
+# SQLite index of processed/ (kept up to date by process_docs_pipeline.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "automated-dev-orchestrator" / "scripts"))
+from processed_index import ProcessedIndex, format_project
 
 class WebhookManager:
     def __init__(self):
@@ -398,18 +403,44 @@ def show_state():
     
     # Show GitHub Actions activity
     print(f"\n🔗 Recent GitHub Activity:")
-    processed_dir = Path("/home/wv3/ideabrow-automation/processed")
-    if processed_dir.exists():
-        recent_projects = sorted(processed_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True)[:3]
+    if PROCESSED_DIR.exists():
+        index = ProcessedIndex(PROCESSED_DIR)
+        index.sync()  # picks up projects pulled in from the automation repo
+        recent_projects = index.recent(3)
         if recent_projects:
             for project in recent_projects:
-                mtime = datetime.fromtimestamp(project.stat().st_mtime)
-                print(f"  📦 {project.name} - {mtime.strftime('%m-%d %H:%M')}")
+                processed_at = datetime.fromisoformat(project['processed_at'])
+                print(f"  📦 {project['name']} - {processed_at.strftime('%m-%d %H:%M')}")
         else:
             print("  No processed projects found")
     else:
         print("  No processed directory found")
 
+def show_projects():
+    """Browse processed projects: recent, keyword search and duplicate docs"""
+    if not PROCESSED_DIR.exists():
+        print("  No processed directory found")
+        return
+    
+    index = ProcessedIndex(PROCESSED_DIR)
+    sync = index.sync()
+    print(f"\n📦 Processed Projects ({sync['total']} indexed):")
+    for project in index.recent(10):
+        print(f"  {format_project(project)}")
+    
+    duplicates = index.duplicates()
+    if duplicates['projects']:
+        print(f"\n🔁 Same documents processed more than once:")
+        for group in duplicates['projects']:
+            print(f"  {', '.join(group['names'])}")
+    
+    keywords = input("\nSearch keywords (Enter to skip): ").strip()
+    if keywords:
+        matches = index.search(keywords)
+        print(f"\n🔍 {len(matches)} match(es) for '{keywords}':")
+        for project in matches:
+            print(f"  {format_project(project)}")
+
 def clear_state():
     """Clear service state"""
     if not manager.state_file.exists():
@@ -477,9 +508,10 @@ def main_menu():
         print("3. Show state & activity")
         print("4. Restart service")
         print("5. Manage tunnel")
+        print("6. Processed projects")
         print("0. Exit")
         
-        choice = input("\nEnter choice (0-5): ").strip()
+        choice = input("\nEnter choice (0-6): ").strip()
         
         if choice == '1':
             show_phases()
@@ -491,6 +523,8 @@ def main_menu():
             restart_service()
         elif choice == '5':
             manage_tunnel()
+        elif choice == '6':
+            show_projects()
         elif choice == '0':
             print("👋 Goodbye!")
             break
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Adaptive Phase Transitions
+Advances a project to its next phase when PROGRESS_TRACKER.md shows the current
+phase is (nearly) done, instead of on a fixed clock
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PHASE_HEADING = re.compile(r'^##\s+Phase\s+(\d+)\s*[:\-–—]?\s*(.*?)\s*$', re.IGNORECASE)
+SECTION_HEADING = re.compile(r'^##\s')
+CHECKBOX = re.compile(r'^\s*[-*+]\s+\[([ xX])\]')
+
+def parse_progress_tracker(text):
+    """
+    Count checkboxes per '## Phase N: Name' section
+    Returns {phase_num: {'name', 'done', 'total'}}; nested '###' headings
+    stay within their phase, any other '## ' heading ends it.
+    """
+    phases = {}
+    current = None
+    for line in text.splitlines():
+        heading = PHASE_HEADING.match(line)
+        if heading:
+            current = phases.setdefault(int(heading.group(1)), {
+                'name': heading.group(2),
+                'done': 0,
+                'total': 0
+            })
+            continue
+        if SECTION_HEADING.match(line):
+            current = None
+            continue
+        box = CHECKBOX.match(line)
+        if box and current is not None:
+            current['total'] += 1
+            if box.group(1) in 'xX':
+                current['done'] += 1
+    return phases
+
+def phase_completion(phases, phase_num):
+    """Fraction of checked boxes in a phase, or None when it has none"""
+    section = phases.get(phase_num)
+    if not section or not section['total']:
+        return None
+    return section['done'] / section['total']
+
+class AdaptivePhaseRunner:
+    """
+    Drives one project's phases from its progress tracker
+
+    The next phase fires when the current phase's checkboxes reach
+    `threshold` (but not before min_factor x its planned duration), or
+    when max_factor x the planned duration has passed. Phases without
+    checkboxes, or a missing tracker, fall back to the planned duration.
+    Planned durations come from the duration model when given, otherwise
+    from the scheduler's phase_config.
+    Progress is saved to state/{project}_adaptive.json so a restarted server
+    can resume, and the time saved against the fixed schedule is reported.
+    """
+
+    def __init__(self, scheduler, project_name, workspace, state_file,
+                 threshold=0.8, min_factor=0.3, max_factor=1.5, poll_interval=30,
+                 started_at=None, clock=time.time, template=None, requirement_chars=None,
+                 planned_minutes=None):
+        self.scheduler = scheduler
+        self.project_name = project_name
+        self.tracker_file = Path(workspace) / "PROGRESS_TRACKER.md"
+        self.state_file = Path(state_file)
+        self.threshold = threshold
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self._tracker_key = None
+        self._tracker_phases = {}
+
+        self.state = self._load_state()
+        if self.state is None:
+            now = started_at if started_at is not None else clock()
+            self.state = {
+                'project': project_name,
+                'current_phase': 1,
+                'phase_started_at': now,
+                'started_at': now,
+                'finished': False,
+                'threshold': threshold,
+                'template': template,
+                'requirement_chars': requirement_chars,
+                'planned_minutes': {str(p): m for p, m in (planned_minutes or {}).items()},
+                'phases': {},
+                'time_saved_minutes': 0.0
+            }
+            self._save_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self):
+        try:
+            tmp = self.state_file.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self.state, f, indent=2)
+            os.replace(tmp, self.state_file)
+        except OSError as e:
+            logger.error(f"Error saving adaptive phase state for {self.project_name}: {e}")
+
+    def _read_tracker(self):
+        """Parse the tracker only when its mtime or size changed"""
+        try:
+            st = self.tracker_file.stat()
+        except OSError:
+            self._tracker_key, self._tracker_phases = None, {}
+            return self._tracker_phases
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._tracker_key:
+            try:
+                self._tracker_phases = parse_progress_tracker(self.tracker_file.read_text(errors='replace'))
+                self._tracker_key = key
+            except OSError:
+                pass
+        return self._tracker_phases
+
+    def evaluate(self, now=None):
+        """
+        Check the current phase once
+        Returns the trigger ('progress', 'timeout' or 'schedule') if the
+        phase ended, else None.
+        """
+        if self.state['finished']:
+            return None
+        now = self.clock() if now is None else now
+
+        phase_num = self.state['current_phase']
+        fixed_minutes = self.scheduler.phase_config[phase_num]['duration_minutes']
+        planned_minutes = self.state.get('planned_minutes', {}).get(str(phase_num), fixed_minutes)
+        elapsed_minutes = (now - self.state['phase_started_at']) / 60
+        completion = phase_completion(self._read_tracker(), phase_num)
+
+        if completion is None:
+            trigger = 'schedule' if elapsed_minutes >= planned_minutes else None
+        elif completion >= self.threshold and elapsed_minutes >= planned_minutes * self.min_factor:
+            trigger = 'progress'
+        elif elapsed_minutes >= planned_minutes * self.max_factor:
+            trigger = 'timeout'
+        else:
+            trigger = None
+
+        if trigger is None:
+            return None
+
+        saved = fixed_minutes - elapsed_minutes
+        self.state['phases'][str(phase_num)] = {
+            'planned_minutes': planned_minutes,
+            'actual_minutes': round(elapsed_minutes, 1),
+            'completion': round(completion, 2) if completion is not None else None,
+            'trigger': trigger,
+            'ended_at': datetime.fromtimestamp(now).isoformat(timespec='seconds')
+        }
+        self.state['time_saved_minutes'] = round(self.state['time_saved_minutes'] + saved, 1)
+        logger.info(f"{self.project_name}: Phase {phase_num} ended by {trigger} after "
+                    f"{elapsed_minutes:.1f}/{planned_minutes} min ({saved:+.1f} min vs schedule)")
+
+        next_phase = phase_num + 1
+        if next_phase in self.scheduler.phase_config:
+            if not self.scheduler.send_phase_message(self.project_name, next_phase):
+                # Leave the phase open and retry on the next poll
+                del self.state['phases'][str(phase_num)]
+                self.state['time_saved_minutes'] = round(self.state['time_saved_minutes'] - saved, 1)
+                return None
+            self.state['current_phase'] = next_phase
+            self.state['phase_started_at'] = now
+        else:
+            self.state['finished'] = True
+            logger.info(f"{self.project_name}: all phases done, "
+                        f"{self.state['time_saved_minutes']:+.1f} min vs fixed schedule")
+
+        self._save_state()
+        self.scheduler.phase_finished(self.project_name, phase_num, elapsed_minutes, trigger, self.state)
+        return trigger
+
+    def run(self, stop_event=None):
+        stop_event = stop_event or threading.Event()
+        while not self.state['finished'] and not stop_event.is_set():
+            try:
+                self.evaluate()
+            except Exception as e:
+                logger.error(f"Adaptive phase check failed for {self.project_name}: {e}")
+            stop_event.wait(self.poll_interval)
+
+    def start(self):
+        """Follow the project in a daemon thread"""
+        thread = threading.Thread(target=self.run, daemon=True, name=f"adaptive-{self.project_name}")
+        thread.start()
+        return thread
+
+    def report(self):
+        return dict(self.state, completion=phase_completion(self._read_tracker(), self.state['current_phase']))
+
+def load_adaptive_reports(state_dir):
+    """Saved adaptive phase state for every project, keyed by project name"""
+    reports = {}
+    for path in Path(state_dir).glob("*_adaptive.json"):
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        reports[data.get('project', path.name[:-len("_adaptive.json")])] = data
+    return reports
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Message Dispatcher for Claude Sessions
+Single path for every outbound message to a Claude session: a global token
+bucket, per-session ordering and jittered staggering, shared across processes
+"""
+
+import fcntl
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEND_SCRIPT = "/home/wv3/.claude/orchestrator/send-claude-message.sh"
+DELIVERY_METHODS = ('buffer', 'script')
+
+# First contact with a new session goes ahead of phase messages and nudges
+PRIORITY_SOURCES = ('pm-init', 'starter-prompt')
+
+# A project needs about 6 messages (PM init, starter prompt, phases 2-5), so
+# 20/min sustains roughly 200 projects/hour
+DEFAULT_RATE_PER_MINUTE = 20.0
+DEFAULT_BURST = 5
+
+# dispatch_metrics.jsonl rolls over to .1 at this size (about 20k dispatches)
+METRICS_MAX_BYTES = 5 * 1024 * 1024
+
+@contextmanager
+def locked_json(path):
+    """
+    Exclusive flock on a small JSON state file for a read-modify-write
+    Works across processes - the nohup phase timers and the server share it.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        raw = b''
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            raw += chunk
+        try:
+            data = json.loads(raw) if raw else {}
+        except ValueError:
+            data = {}
+        yield data
+        encoded = json.dumps(data).encode()
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, encoded)
+    finally:
+        os.close(fd)  # releases the lock
+
+class MessageDispatcher:
+    """
+    Rate-limited, ordered delivery of messages to tmux panes
+
+    - Jitter: scheduled messages wait a random 0..jitter_seconds first, so
+      projects accepted in the same burst do not all fire at one instant
+    - Token bucket: at most `burst` sends at once, refilled at
+      rate_per_minute, shared by every process through a locked state file.
+      Messages from PRIORITY_SOURCES register as priority waiters; while any
+      are waiting, other messages leave the tokens to them.
+    - Per-session ordering: each send takes a ticket for its session and
+      waits its turn, so messages to one session never interleave and go out
+      in the order they were submitted. The turn of a sender whose process
+      has died is skipped.
+
+    Delivery is method="buffer" (load the text into a named tmux buffer and
+    paste it in one go, then press Enter) or method="script" (hand it to
+    send-claude-message.sh, which types it into the pane).
+
+    Every dispatch appends its delays to state/dispatch_metrics.jsonl, which
+    rolls over to dispatch_metrics.jsonl.1 at METRICS_MAX_BYTES.
+    """
+
+    def __init__(self, state_dir, rate_per_minute=DEFAULT_RATE_PER_MINUTE, burst=DEFAULT_BURST, jitter_seconds=30.0,
+                 send_script=DEFAULT_SEND_SCRIPT, send_timeout=60, method='buffer',
+                 submit_delay=0.5, tmux_socket=None):
+        self.state_dir = Path(state_dir)
+        self.dispatch_dir = self.state_dir / "dispatch"
+        self.dispatch_dir.mkdir(parents=True, exist_ok=True)
+        self.bucket_file = self.dispatch_dir / "bucket.json"
+        self.metrics_file = self.state_dir / "dispatch_metrics.jsonl"
+        self.metrics_lock = self.dispatch_dir / "metrics.lock"
+        self.rate_per_second = rate_per_minute / 60.0
+        self.burst = burst
+        self.jitter_seconds = jitter_seconds
+        self.send_script = str(send_script)
+        self.send_timeout = send_timeout
+        if method not in DELIVERY_METHODS:
+            raise ValueError(f"Unknown delivery method: {method}")
+        self.method = method
+        self.submit_delay = submit_delay
+        self.tmux = ["tmux", "-L", tmux_socket] if tmux_socket else ["tmux"]
+
+    # Token bucket
+
+    def _acquire_token(self, priority=False):
+        """Block until the global bucket has a token; return seconds waited"""
+        started = time.time()
+        waiter = f"{os.getpid()}-{random.getrandbits(32):08x}"
+        try:
+            while True:
+                with locked_json(self.bucket_file) as bucket:
+                    now = time.time()
+                    tokens = bucket.get('tokens', float(self.burst))
+                    updated = bucket.get('updated', now)
+                    tokens = min(float(self.burst), tokens + (now - updated) * self.rate_per_second)
+                    waiters = bucket.setdefault('priority_waiters', {})
+                    for key, pid in list(waiters.items()):
+                        if not self._pid_alive(pid):
+                            del waiters[key]
+                    if tokens >= 1 and (priority or not waiters):
+                        waiters.pop(waiter, None)
+                        bucket['tokens'] = tokens - 1
+                        bucket['updated'] = now
+                        return now - started
+                    if priority:
+                        waiters[waiter] = os.getpid()
+                    bucket['tokens'] = tokens
+                    bucket['updated'] = now
+                    # A token may be there but reserved for priority waiters
+                    wait = (1 - tokens) / self.rate_per_second if tokens < 1 else 0.2
+                # Small random offset so waiting processes do not retry in lockstep
+                time.sleep(wait + random.uniform(0, 0.25))
+        except BaseException:
+            if priority:
+                with locked_json(self.bucket_file) as bucket:
+                    bucket.get('priority_waiters', {}).pop(waiter, None)
+            raise
+
+    # Per-session ordering
+
+    def _session_file(self, session):
+        safe = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in session)
+        return self.dispatch_dir / f"{safe}.order.json"
+
+    @staticmethod
+    def _pid_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def _take_ticket(self, session):
+        with locked_json(self._session_file(session)) as order:
+            ticket = order.get('next_ticket', 0)
+            order['next_ticket'] = ticket + 1
+            order.setdefault('serving', ticket)
+            order.setdefault('holders', {})[str(ticket)] = os.getpid()
+            return ticket
+
+    def _wait_turn(self, session, ticket):
+        """Block until it is this ticket's turn; return seconds waited"""
+        started = time.time()
+        while True:
+            with locked_json(self._session_file(session)) as order:
+                serving = order.get('serving', ticket)
+                if serving >= ticket:
+                    return time.time() - started
+                holders = order.setdefault('holders', {})
+                pid = holders.get(str(serving))
+                if pid is None or not self._pid_alive(pid):
+                    # Earlier sender died without finishing - skip its turn
+                    logger.warning(f"Skipping abandoned dispatch turn {serving} for {session}")
+                    holders.pop(str(serving), None)
+                    order['serving'] = serving + 1
+                    continue
+            time.sleep(0.2)
+
+    def _finish_turn(self, session, ticket):
+        with locked_json(self._session_file(session)) as order:
+            order.setdefault('holders', {}).pop(str(ticket), None)
+            if order.get('serving', ticket) <= ticket:
+                order['serving'] = ticket + 1
+
+    # Delivery
+
+    def _send(self, target, message):
+        if self.method == 'buffer':
+            return self._send_buffer(target, message)
+        return self._send_script(target, message)
+
+    def _send_script(self, target, message):
+        return subprocess.run(
+            [self.send_script, target, message],
+            capture_output=True,
+            text=True,
+            timeout=self.send_timeout
+        )
+
+    def _send_buffer(self, target, message):
+        """
+        Paste the message through a named tmux buffer, then submit it
+        The text goes to tmux on stdin, so it is never quoted by a shell and
+        arrives in the pane as a single (bracketed, where supported) paste.
+        """
+        buffer_name = f"dispatch-{os.getpid()}-{random.getrandbits(32):08x}"
+        # One tmux call: load from stdin, then paste. -d deletes the buffer
+        # after pasting, -p uses bracketed paste if the pane asked for it
+        pasted = subprocess.run(
+            self.tmux + ["load-buffer", "-b", buffer_name, "-", ";",
+                         "paste-buffer", "-d", "-p", "-b", buffer_name, "-t", target],
+            input=message.encode('utf-8'),
+            capture_output=True,
+            timeout=self.send_timeout
+        )
+        if pasted.returncode != 0:
+            subprocess.run(self.tmux + ["delete-buffer", "-b", buffer_name],
+                           capture_output=True, timeout=self.send_timeout)
+            return subprocess.CompletedProcess(pasted.args, pasted.returncode, "",
+                                               pasted.stderr.decode(errors='replace'))
+
+        # Give the pane a moment to take the paste before submitting it
+        if self.submit_delay:
+            time.sleep(self.submit_delay)
+        return subprocess.run(
+            self.tmux + ["send-keys", "-t", target, "Enter"],
+            capture_output=True,
+            text=True,
+            timeout=self.send_timeout
+        )
+
+    def dispatch(self, target, message, source='message', jitter=True):
+        """
+        Deliver one message to a tmux target (e.g. "project:0.0")
+        Returns {"success", "returncode", "stdout", "stderr", "delay_seconds"}.
+        """
+        requested_at = time.time()
+        session = target.split(':', 1)[0]
+        ticket = self._take_ticket(session)
+        jitter_wait = random.uniform(0, self.jitter_seconds) if jitter and self.jitter_seconds > 0 else 0.0
+
+        result = {"success": False, "returncode": None, "stdout": "", "stderr": ""}
+        order_wait = bucket_wait = 0.0
+        try:
+            if jitter_wait:
+                time.sleep(jitter_wait)
+            order_wait = self._wait_turn(session, ticket)
+            bucket_wait = self._acquire_token(priority=source in PRIORITY_SOURCES)
+            try:
+                completed = self._send(target, message)
+                result.update(success=completed.returncode == 0, returncode=completed.returncode,
+                              stdout=completed.stdout, stderr=completed.stderr)
+            except subprocess.TimeoutExpired:
+                result['stderr'] = f"send timed out after {self.send_timeout}s"
+            except OSError as e:
+                result['stderr'] = str(e)
+        finally:
+            self._finish_turn(session, ticket)
+
+        sent_at = time.time()
+        result['delay_seconds'] = round(sent_at - requested_at, 3)
+        self._record(session, source, requested_at, sent_at, jitter_wait, order_wait, bucket_wait, result)
+        if result['success']:
+            logger.info(f"Dispatched {source} to {target} after {result['delay_seconds']:.1f}s")
+        else:
+            logger.error(f"Dispatch of {source} to {target} failed: {result['stderr']}")
+        return result
+
+    def _record(self, session, source, requested_at, sent_at, jitter_wait, order_wait, bucket_wait, result):
+        entry = {
+            'time': datetime.fromtimestamp(sent_at).isoformat(timespec='seconds'),
+            'session': session,
+            'source': source,
+            'jitter_seconds': round(jitter_wait, 3),
+            'order_wait_seconds': round(order_wait, 3),
+            'bucket_wait_seconds': round(bucket_wait, 3),
+            'delay_seconds': round(sent_at - requested_at, 3),
+            'method': self.method,
+            'success': result['success']
+        }
+        try:
+            # The lock keeps a rotation in one process from racing appends in another
+            with open(self.metrics_lock, 'w') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    if self.metrics_file.stat().st_size >= METRICS_MAX_BYTES:
+                        os.replace(self.metrics_file, self.metrics_file.with_name(self.metrics_file.name + '.1'))
+                except FileNotFoundError:
+                    pass
+                with open(self.metrics_file, 'a') as f:
+                    f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            logger.error(f"Error recording dispatch metrics: {e}")
+
+def tail_lines(path, count, block_size=65536):
+    """The last count lines of a file, reading backwards from the end"""
+    try:
+        with open(path, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            data = b''
+            while end > 0 and data.count(b'\n') <= count:
+                start = max(0, end - block_size)
+                f.seek(start)
+                data = f.read(end - start) + data
+                end = start
+    except OSError:
+        return []
+    lines = data.splitlines()
+    if end > 0:
+        lines = lines[1:]  # first line is cut off
+    return lines[-count:]
+
+def summarize_dispatch_metrics(metrics_file, last=1000):
+    """Delay percentiles and failure counts over the most recent dispatches"""
+    entries = []
+    for line in tail_lines(metrics_file, last):
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue
+    if not entries:
+        return {'dispatches': 0}
+
+    def percentiles(key):
+        values = sorted(e.get(key, 0) for e in entries)
+        return {
+            'p50': round(statistics.median(values), 2),
+            'p95': round(values[min(len(values) - 1, int(len(values) * 0.95))], 2),
+            'max': round(values[-1], 2)
+        }
+
+    by_source = {}
+    for e in entries:
+        by_source[e.get('source', 'unknown')] = by_source.get(e.get('source', 'unknown'), 0) + 1
+    return {
+        'dispatches': len(entries),
+        'failures': sum(1 for e in entries if not e.get('success')),
+        'since': entries[0].get('time'),
+        'delay_seconds': percentiles('delay_seconds'),
+        'bucket_wait_seconds': percentiles('bucket_wait_seconds'),
+        'order_wait_seconds': percentiles('order_wait_seconds'),
+        'jitter_seconds': percentiles('jitter_seconds'),
+        'by_source': by_source
+    }
+
+def create_message_dispatcher(state_dir=None):
+    """
+    Factory function - DISPATCH_RATE_PER_MINUTE, DISPATCH_BURST, DISPATCH_JITTER_SECONDS
+    and DISPATCH_METHOD (buffer or script) override the defaults
+    At about 6 messages per project the ceiling is rate x 10 projects/hour.
+    """
+    return MessageDispatcher(
+        state_dir or Path(__file__).parent / "state",
+        rate_per_minute=float(os.environ.get('DISPATCH_RATE_PER_MINUTE', DEFAULT_RATE_PER_MINUTE)),
+        burst=int(os.environ.get('DISPATCH_BURST', DEFAULT_BURST)),
+        jitter_seconds=float(os.environ.get('DISPATCH_JITTER_SECONDS', 30)),
+        send_script=os.environ.get('SEND_MESSAGE_SCRIPT', DEFAULT_SEND_SCRIPT),
+        method=os.environ.get('DISPATCH_METHOD', 'buffer')
+    )
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rate-limited delivery of messages to Claude sessions')
+    parser.add_argument('--state-dir', default=str(Path(__file__).parent / "state"))
+    sub = parser.add_subparsers(dest='command')
+
+    send = sub.add_parser('send', help='Deliver one message')
+    send.add_argument('--target', required=True, help='tmux target, e.g. my-project:0.0')
+    send.add_argument('--message', help='Message text')
+    send.add_argument('--message-file', help='Read the message from a file')
+    send.add_argument('--source', default='message', help='Label recorded in the dispatch metrics')
+    send.add_argument('--no-jitter', action='store_true', help='Send without the random stagger')
+    send.add_argument('--consume', action='store_true',
+                      help='Delete --message-file after the delivery attempt, successful or not')
+
+    sub.add_parser('stats', help='Dispatch delay summary')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    dispatcher = create_message_dispatcher(args.state_dir)
+
+    if args.command == 'send':
+        if args.message_file:
+            with open(args.message_file, 'r') as f:
+                message = f.read()
+        elif args.message is not None:
+            message = args.message
+        else:
+            message = sys.stdin.read()
+        try:
+            result = dispatcher.dispatch(args.target, message, source=args.source, jitter=not args.no_jitter)
+        finally:
+            # A scheduled timer fires once - a file left behind would never be used
+            if args.consume and args.message_file:
+                try:
+                    os.remove(args.message_file)
+                except OSError:
+                    pass
+        return 0 if result['success'] else 1
+
+    print(json.dumps(summarize_dispatch_metrics(dispatcher.metrics_file), indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
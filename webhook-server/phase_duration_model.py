@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Phase Duration Model
+Learns per-template, per-phase durations from recorded history and predicts
+phase delays and project completion, falling back to the static phase config
+"""
+
+import json
+import logging
+import math
+import os
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+def censored_median(samples):
+    """
+    Kaplan-Meier median of (minutes, censored) samples
+    A censored sample is a lower bound - the phase was cut off by the
+    timeout while still running. If too few phases finished for the
+    survival curve to reach 0.5, the largest sample is returned (the median
+    is at least that). Without censored samples this is the plain median.
+    """
+    if not any(censored for _, censored in samples):
+        return statistics.median(value for value, _ in samples)
+    ordered = sorted(samples, key=lambda s: (s[0], s[1]))
+    at_risk = len(ordered)
+    survival = 1.0
+    i = 0
+    while i < len(ordered):
+        value = ordered[i][0]
+        events = censored = 0
+        while i < len(ordered) and ordered[i][0] == value:
+            if ordered[i][1]:
+                censored += 1
+            else:
+                events += 1
+            i += 1
+        if events:
+            survival *= 1 - events / at_risk
+            if survival <= 0.5:
+                return value
+        at_risk -= events + censored
+    return ordered[-1][0] if ordered else None
+
+class PhaseDurationModel:
+    """
+    Simple multiplicative estimator over recorded phase durations
+
+    minutes = phase_median x template_factor x (size / median_size) ^ size_exponent
+
+    - phase_median: median of all recorded durations for the phase
+    - template_factor: median ratio of the template's durations to the phase
+      median, shrunk towards 1 by `prior_weight` pseudo-samples
+    - size_exponent: least-squares slope of the template-adjusted log ratio
+      on log(size), only fitted once a phase has 2 x min_samples sized records
+
+    Phases that ended on the timeout are recorded as censored: they ran at
+    least that long. Both medians are Kaplan-Meier medians, so timeouts pull
+    the estimate up instead of being dropped; the size fit uses finished
+    phases only.
+
+    A phase with fewer than min_samples records uses the static config.
+    Predictions are clamped to [0.3x, 3x] of the static duration. The model
+    refits before predicting whenever the history file has changed.
+    """
+
+    def __init__(self, history_file, phase_config, min_samples=3, prior_weight=3):
+        self.history_file = Path(history_file)
+        self.phase_config = phase_config
+        self.min_samples = min_samples
+        self.prior_weight = prior_weight
+        self.phase_medians = {}
+        self.template_factors = {}
+        self.size_fits = {}
+        self.sample_counts = {}
+        self.censored_counts = {}
+        self._fitted_key = None
+        self.fit()
+
+    def load_records(self):
+        records = []
+        try:
+            with open(self.history_file, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get('minutes', 0) > 0 and record.get('phase') in self.phase_config:
+                        records.append(record)
+        except OSError:
+            pass
+        return records
+
+    def _history_key(self):
+        try:
+            st = self.history_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self):
+        """Refit if the history file changed since the last fit"""
+        if self._history_key() != self._fitted_key:
+            self.fit()
+        return self
+
+    def fit(self):
+        """(Re)build the estimator from the history file"""
+        self._fitted_key = self._history_key()
+        by_phase = {}
+        for record in self.load_records():
+            by_phase.setdefault(record['phase'], []).append(record)
+
+        self.phase_medians, self.template_factors, self.size_fits, self.sample_counts = {}, {}, {}, {}
+        self.censored_counts = {}
+        for phase, records in by_phase.items():
+            self.sample_counts[phase] = len(records)
+            self.censored_counts[phase] = sum(1 for r in records if r.get('censored'))
+            if len(records) < self.min_samples:
+                continue
+            median = censored_median([(r['minutes'], bool(r.get('censored'))) for r in records])
+            self.phase_medians[phase] = median
+
+            ratios = {}
+            for r in records:
+                ratios.setdefault(r.get('template') or 'unknown', []).append((r['minutes'] / median, bool(r.get('censored'))))
+            for template, values in ratios.items():
+                n = len(values)
+                factor = (n * censored_median(values) + self.prior_weight) / (n + self.prior_weight)
+                self.template_factors[(template, phase)] = factor
+
+            sized = [r for r in records if r.get('requirement_chars') and not r.get('censored')]
+            if len(sized) >= 2 * self.min_samples:
+                median_size = statistics.median(r['requirement_chars'] for r in sized)
+                xs = [math.log(r['requirement_chars'] / median_size) for r in sized]
+                ys = [math.log(r['minutes'] / (median * self.template_factors[(r.get('template') or 'unknown', phase)]))
+                      for r in sized]
+                mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+                var_x = sum((x - mean_x) ** 2 for x in xs)
+                if var_x > 0:
+                    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+                    self.size_fits[phase] = (median_size, max(-0.5, min(1.0, slope)))
+        return self
+
+    def predict(self, template, phase, requirement_chars=None):
+        """Predicted minutes for one phase and whether it came from history"""
+        self.refresh()
+        static = self.phase_config[phase]['duration_minutes']
+        if phase not in self.phase_medians:
+            return static, 'static'
+
+        minutes = self.phase_medians[phase] * self.template_factors.get((template, phase), 1.0)
+        if requirement_chars and phase in self.size_fits:
+            median_size, slope = self.size_fits[phase]
+            minutes *= (requirement_chars / median_size) ** slope
+        return round(max(static * 0.3, min(static * 3, minutes)), 1), 'learned'
+
+    def predict_schedule(self, template, requirement_chars=None):
+        """{phase: (minutes, source)} for every configured phase"""
+        return {phase: self.predict(template, phase, requirement_chars) for phase in self.phase_config}
+
+    def summary(self):
+        """Fitted parameters, for reporting"""
+        self.refresh()
+        return {
+            'samples': {str(p): n for p, n in self.sample_counts.items()},
+            'censored': {str(p): n for p, n in self.censored_counts.items() if n},
+            'phase_medians': {str(p): m for p, m in self.phase_medians.items()},
+            'template_factors': {f"{t}/{p}": round(f, 2) for (t, p), f in self.template_factors.items()},
+            'size_exponents': {str(p): round(fit[1], 2) for p, fit in self.size_fits.items()}
+        }
+
+def record_phase_duration(history_file, project, template, phase, minutes,
+                          requirement_chars=None, source='adaptive', censored=False):
+    """
+    Append one observed phase duration to the history file
+    censored=True marks a lower bound (the phase was cut off by a timeout).
+    """
+    record = {
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'project': project,
+        'template': template,
+        'phase': phase,
+        'minutes': round(minutes, 1),
+        'requirement_chars': requirement_chars,
+        'source': source
+    }
+    if censored:
+        record['censored'] = True
+    try:
+        with open(history_file, 'a') as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        logger.error(f"Error recording phase duration: {e}")
+
+def write_schedule_prediction(state_dir, project, template, schedule, current_phase=1, phase_started_at=None):
+    """
+    Save the predicted timeline to state/{project}_schedule.json
+    schedule is {phase: (minutes, source)}; phases before current_phase are
+    already done, the current phase runs from phase_started_at.
+    """
+    start = phase_started_at if phase_started_at is not None else time.time()
+    phases = []
+    for phase in sorted(schedule):
+        if phase < current_phase:
+            continue
+        minutes, source = schedule[phase]
+        end = start + minutes * 60
+        phases.append({
+            'phase': phase,
+            'planned_minutes': minutes,
+            'source': source,
+            'starts_at': datetime.fromtimestamp(start).isoformat(timespec='seconds'),
+            'ends_at': datetime.fromtimestamp(end).isoformat(timespec='seconds')
+        })
+        start = end
+
+    data = {
+        'project': project,
+        'template': template,
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+        'current_phase': current_phase,
+        'phases': phases,
+        'predicted_completion': datetime.fromtimestamp(start).isoformat(timespec='seconds')
+    }
+    path = Path(state_dir) / f"{project}_schedule.json"
+    try:
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.error(f"Error saving schedule prediction for {project}: {e}")
+    return data
+
+def create_phase_duration_model(state_dir, phase_config):
+    """Factory function - history lives in state/phase_durations.jsonl"""
+    return PhaseDurationModel(Path(state_dir) / "phase_durations.jsonl", phase_config)
+
+def main():
+    import argparse
+    from phase_scheduler import PHASES
+
+    parser = argparse.ArgumentParser(description='Inspect or extend the learned phase duration model')
+    parser.add_argument('--state-dir', default=str(Path(__file__).parent / "state"))
+    sub = parser.add_subparsers(dest='command')
+
+    predict = sub.add_parser('predict', help='Predicted phase durations for a template')
+    predict.add_argument('template')
+    predict.add_argument('--requirement-chars', type=int)
+
+    record = sub.add_parser('record', help='Record an observed phase duration (operator override)')
+    record.add_argument('--project', required=True)
+    record.add_argument('--template', required=True)
+    record.add_argument('--phase', type=int, required=True)
+    record.add_argument('--minutes', type=float, required=True)
+    record.add_argument('--requirement-chars', type=int)
+
+    sub.add_parser('summary', help='Show fitted parameters')
+    args = parser.parse_args()
+
+    phase_config = PHASES
+    model = create_phase_duration_model(args.state_dir, phase_config)
+
+    if args.command == 'record':
+        record_phase_duration(model.history_file, args.project, args.template, args.phase,
+                              args.minutes, args.requirement_chars, source='override')
+        print(f"Recorded Phase {args.phase} of {args.project}: {args.minutes} min")
+    elif args.command == 'predict':
+        total = 0
+        for phase, (minutes, source) in model.predict_schedule(args.template, args.requirement_chars).items():
+            total += minutes
+            print(f"Phase {phase} {phase_config[phase]['name']:<35} {minutes:>6.1f} min  ({source})")
+        print(f"{'Total':<43} {total:>6.1f} min")
+    else:
+        print(json.dumps(model.summary(), indent=2))
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -7,9 +7,12 @@ Handles automated phase progression for development projects
 import os
 import json
 import logging
+import shlex
 import subprocess
+import sys
 import threading
 import time
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -21,54 +24,118 @@ except ImportError:
     def create_testing_manager():
         return None
 
+from adaptive_phases import AdaptivePhaseRunner, load_adaptive_reports
+from phase_duration_model import create_phase_duration_model, record_phase_duration, write_schedule_prediction
+from message_dispatcher import create_message_dispatcher, locked_json
+
 logger = logging.getLogger(__name__)
 
+# Phase names and durations - easily customizable
+PHASES = {
+    1: {"name": "Template Analysis & Setup", "duration_minutes": 15},
+    2: {"name": "Core Feature Development", "duration_minutes": 30},
+    3: {"name": "Enhanced Features & Integration", "duration_minutes": 30},
+    4: {"name": "Polish & Testing", "duration_minutes": 20},
+    5: {"name": "Final Review & Git Commit", "duration_minutes": 15}
+}
+
+# Testing server actions taken when a phase message goes out
+PHASE_SERVER_ACTIONS = {
+    2: 'start',    # Core features exist - bring up the dev server
+    4: 'restart'   # Polish & Testing - pick up dependencies added since Phase 2
+}
+
+# One thread per process works through state/server_actions.json
+_action_runner = None
+_action_runner_lock = threading.Lock()
+_actions_changed = threading.Event()
+
+def configured_phase_mode():
+    """The PHASE_MODE setting ("fixed" or "adaptive") without building a scheduler"""
+    return os.environ.get('PHASE_MODE', 'fixed')
+
 class PhaseScheduler:
     """
     Manages phase-based scheduling for project development
     Each project gets automated phase transitions at configured intervals
     """
     
-    def __init__(self, orchestrator_script_path="/home/wv3/.claude/orchestrator"):
+    def __init__(self, orchestrator_script_path="/home/wv3/.claude/orchestrator", mode=None,
+                 clock=time.time, sink=None, state_dir=None, testing_manager=None):
         self.orchestrator_path = Path(orchestrator_script_path)
         self.send_message_script = self.orchestrator_path / "send-claude-message.sh"
+        self.dispatcher_script = Path(__file__).parent / "message_dispatcher.py"
         self.schedule_script = self.orchestrator_path / "schedule_with_note.sh"
-        self.testing_manager = create_testing_manager()
+        self._testing_manager = testing_manager
+        self.state_dir = Path(state_dir) if state_dir else Path(__file__).parent / "state"
+        
+        # Simulation hooks: a virtual clock, and a sink that receives
+        # (target, message, source, fire_at, jitter) instead of real timers and sends
+        self.clock = clock
+        self.sink = sink
+        self.projects_dir = Path(os.environ.get('PROJECTS_DIR', '/home/wv3/projects'))
+        
+        # "fixed": nohup timers at cumulative offsets
+        # "adaptive": advance when PROGRESS_TRACKER.md shows the phase is done
+        self.mode = mode or configured_phase_mode()
+        self.adaptive_threshold = float(os.environ.get('PHASE_ADVANCE_THRESHOLD', 0.8))
+        self.adaptive_max_factor = float(os.environ.get('PHASE_MAX_FACTOR', 1.5))
+        self.adaptive_runners = {}
         
-        # Phase configuration - easily customizable
+        # Minutes the testing server stays up after the last phase
+        self.server_linger_minutes = float(os.environ.get('TESTING_SERVER_LINGER_MINUTES', 30))
+        
+        # Phase configuration - names and durations in PHASES, plus the messages
+        messages = {
+            1: self._get_phase_1_message,
+            2: self._get_phase_2_message,
+            3: self._get_phase_3_message,
+            4: self._get_phase_4_message,
+            5: self._get_phase_5_message
+        }
         self.phase_config = {
-            1: {
-                "name": "Template Analysis & Setup",
-                "duration_minutes": 15,
-                "message": self._get_phase_1_message()
-            },
-            2: {
-                "name": "Core Feature Development", 
-                "duration_minutes": 30,
-                "message": self._get_phase_2_message()
-            },
-            3: {
-                "name": "Enhanced Features & Integration",
-                "duration_minutes": 30, 
-                "message": self._get_phase_3_message()
-            },
-            4: {
-                "name": "Polish & Testing",
-                "duration_minutes": 20,
-                "message": self._get_phase_4_message()
-            },
-            5: {
-                "name": "Final Review & Git Commit",
-                "duration_minutes": 15,
-                "message": self._get_phase_5_message()
-            }
+            phase_num: dict(info, message=messages[phase_num]())
+            for phase_num, info in PHASES.items()
         }
+        
+        # Durations learned from past projects; falls back to the config above
+        self.duration_model = create_phase_duration_model(self.state_dir, self.phase_config)
+        
+        # Every outbound message goes through the rate-limited dispatcher
+        self.dispatcher = create_message_dispatcher(self.state_dir)
+        self.messages_dir = self.state_dir / "messages"
+        self.messages_dir.mkdir(parents=True, exist_ok=True)
+        self.server_actions_file = self.state_dir / "server_actions.json"
+    
+    @property
+    def testing_manager(self):
+        """
+        The shared testing manager, created on first use
+        Creating it adopts the live server registry and can start the
+        supervisor, so a simulation (sink set) never gets one and code that
+        only reads phase_config never creates one.
+        """
+        if self._testing_manager is None and self.sink is None:
+            self._testing_manager = create_testing_manager()
+        return self._testing_manager
     
     def schedule_all_phases(self, project_name, session_params=None):
         """
         Schedule all phases for a project from the beginning
         This is called after initial orchestrator setup
         """
+        template, requirement_chars = self._project_profile(session_params)
+        schedule = self.duration_model.predict_schedule(template, requirement_chars)
+        write_schedule_prediction(self.state_dir, project_name, template, schedule,
+                                  phase_started_at=self.clock())
+        learned = [str(p) for p, (_, source) in schedule.items() if source == 'learned']
+        if learned:
+            logger.info(f"Using learned durations for {template} phases {', '.join(learned)}")
+        
+        if self.mode == 'adaptive':
+            return self._start_adaptive(project_name, fresh=True, template=template,
+                                        requirement_chars=requirement_chars, schedule=schedule)
+        
         try:
             logger.info(f"Scheduling all phases for project: {project_name}")
             
@@ -78,10 +145,10 @@ class PhaseScheduler:
             for phase_num, phase_info in self.phase_config.items():
                 if phase_num == 1:
                     # Phase 1 is already started, schedule the transition to phase 2
-                    total_minutes += phase_info["duration_minutes"]
+                    total_minutes += schedule[phase_num][0]
                     continue
                 
-                total_minutes += phase_info["duration_minutes"]
+                total_minutes += schedule[phase_num][0]
                 
                 # Create the phase transition message
                 phase_message = phase_info["message"].format(
@@ -97,6 +164,8 @@ class PhaseScheduler:
                     delay_minutes=total_minutes,
                     message=phase_message
                 )
+            
+            self._schedule_server_action(project_name, 'stop', (total_minutes + self.server_linger_minutes) * 60)
                 
             logger.info(f"All phases scheduled for {project_name}")
             return True
@@ -105,28 +174,220 @@ class PhaseScheduler:
             logger.error(f"Error scheduling phases for {project_name}: {e}")
             return False
     
+    @staticmethod
+    def _project_profile(session_params):
+        """Template name and requirement size used by the duration model"""
+        params = session_params or {}
+        size = params.get('requirements_chars') or len(params.get('progress_tracker') or '') or None
+        return params.get('template_name'), size
+    
+    def _start_adaptive(self, project_name, fresh=False, template=None, requirement_chars=None, schedule=None):
+        """Follow the project's progress tracker instead of scheduling fixed timers"""
+        try:
+            state_file = self.state_dir / f"{project_name}_adaptive.json"
+            if fresh and state_file.exists():
+                state_file.unlink()
+            runner = AdaptivePhaseRunner(
+                self,
+                project_name,
+                workspace=self.projects_dir / project_name,
+                state_file=state_file,
+                threshold=self.adaptive_threshold,
+                max_factor=self.adaptive_max_factor,
+                template=template,
+                requirement_chars=requirement_chars,
+                planned_minutes={p: m for p, (m, _) in schedule.items()} if schedule else None
+            )
+            self.adaptive_runners[project_name] = runner
+            runner.start()
+            logger.info(f"Adaptive phase transitions started for {project_name} "
+                        f"(advance at {self.adaptive_threshold:.0%} complete)")
+            return True
+        except Exception as e:
+            logger.error(f"Error starting adaptive phases for {project_name}: {e}")
+            return False
+    
+    def resume_adaptive(self):
+        """Restart adaptive runners for unfinished projects (after a server restart)"""
+        resumed = []
+        for project_name, state in load_adaptive_reports(self.state_dir).items():
+            if not state.get('finished') and project_name not in self.adaptive_runners:
+                if self._start_adaptive(project_name):
+                    resumed.append(project_name)
+        return resumed
+    
+    def phase_finished(self, project_name, phase_num, minutes, trigger, state):
+        """
+        Called by the adaptive runner when a phase ends
+        Progress-triggered endings are real durations. A timeout only says the
+        phase needed at least `minutes`, so it is recorded as censored rather
+        than dropped (dropping it biases the model short). Schedule fallbacks
+        carry no information about the phase and are not recorded.
+        """
+        template = state.get('template')
+        if trigger in ('progress', 'timeout'):
+            record_phase_duration(self.duration_model.history_file, project_name, template,
+                                  phase_num, minutes, state.get('requirement_chars'), source='adaptive',
+                                  censored=trigger == 'timeout')
+        
+        # Re-predict the remaining phases from now
+        schedule = self.duration_model.predict_schedule(template, state.get('requirement_chars'))
+        if not state.get('finished'):
+            write_schedule_prediction(self.state_dir, project_name, template, schedule,
+                                      current_phase=state['current_phase'],
+                                      phase_started_at=state['phase_started_at'])
+        else:
+            self._schedule_server_action(project_name, 'stop', self.server_linger_minutes * 60)
+    
+    def run_server_action(self, project_name, action):
+        """Start, restart or stop the project's testing server"""
+        if not self.testing_manager:
+            return None
+        if action == 'stop':
+            return self.testing_manager.stop_testing_server(project_name, reason="project finished")
+        workspace = self.projects_dir / project_name
+        if action == 'restart':
+            result = self.testing_manager.restart_testing_server(project_name, workspace)
+        else:
+            result = self.testing_manager.start_testing_server(project_name, workspace)
+        if result['success']:
+            logger.info(f"Testing server for {project_name}: {result['url']} ({action})")
+        else:
+            logger.warning(f"Testing server {action} for {project_name} failed: {result['error']}")
+        return result
+    
+    def _schedule_server_action(self, project_name, action, delay_seconds):
+        """
+        Queue a testing server action in state/server_actions.json
+        The queue outlives the process like the nohup phase timers do;
+        actions that fell due while the server was down run when
+        start_server_actions() is called again.
+        """
+        if self.sink:
+            return
+        with locked_json(self.server_actions_file) as queue:
+            queue.setdefault('actions', []).append({
+                'project': project_name,
+                'action': action,
+                'due_at': time.time() + delay_seconds
+            })
+        _actions_changed.set()
+        self.start_server_actions()
+    
+    def start_server_actions(self):
+        """Run queued testing server actions in a background thread (one per process)"""
+        global _action_runner
+        with _action_runner_lock:
+            if _action_runner is None or not _action_runner.is_alive():
+                _action_runner = threading.Thread(target=self._run_server_actions, daemon=True,
+                                                  name="server-actions")
+                _action_runner.start()
+    
+    def run_due_server_actions(self, now=None):
+        """
+        Take the due actions off the queue and run them
+        After downtime only the latest due action per project is run (a
+        start followed by a stop is just a stop). Returns the next due time.
+        """
+        now = time.time() if now is None else now
+        with locked_json(self.server_actions_file) as queue:
+            actions = queue.get('actions', [])
+            due = sorted((a for a in actions if a['due_at'] <= now), key=lambda a: a['due_at'])
+            queue['actions'] = [a for a in actions if a['due_at'] > now]
+            next_due = min((a['due_at'] for a in queue['actions']), default=None)
+        
+        latest = {}
+        for entry in due:
+            latest[entry['project']] = entry
+        for entry in latest.values():
+            try:
+                self.run_server_action(entry['project'], entry['action'])
+            except Exception as e:
+                logger.error(f"Testing server {entry['action']} for {entry['project']} failed: {e}")
+        return next_due
+    
+    def _run_server_actions(self):
+        while True:
+            _actions_changed.clear()
+            try:
+                next_due = self.run_due_server_actions()
+            except Exception as e:
+                logger.error(f"Error running testing server actions: {e}")
+                next_due = None
+            wait = 60 if next_due is None else min(60, max(0, next_due - time.time()))
+            _actions_changed.wait(wait)
+    
+    def _format_phase_message(self, project_name, phase_num):
+        phase_info = self.phase_config[phase_num]
+        return phase_info["message"].format(
+            project_name=project_name,
+            phase_num=phase_num,
+            phase_name=phase_info["name"]
+        )
+    
+    def send_phase_message(self, project_name, phase_num):
+        """Send a phase's instructions to the project right now"""
+        if self.sink:
+            self.sink(f"{project_name}:0.0", self._format_phase_message(project_name, phase_num),
+                      f"phase-{phase_num}", self.clock(), False)
+            return True
+        try:
+            result = self.dispatcher.dispatch(
+                f"{project_name}:0.0",
+                self._format_phase_message(project_name, phase_num),
+                source=f"phase-{phase_num}",
+                jitter=False
+            )
+            if not result['success']:
+                logger.error(f"Failed to send Phase {phase_num} to {project_name}: {result['stderr']}")
+                return False
+            
+            logger.info(f"Sent Phase {phase_num} to {project_name}")
+            if phase_num in PHASE_SERVER_ACTIONS:
+                self._schedule_server_action(project_name, PHASE_SERVER_ACTIONS[phase_num], 0)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error sending Phase {phase_num} to {project_name}: {e}")
+            return False
+    
     def _schedule_phase_transition(self, project_name, phase_num, delay_minutes, message):
         """
         Schedule a single phase transition using the orchestrator's scheduling system
         Uses nohup-based scheduling for persistence across process exits
         """
+        message_file = None
         try:
             target_window = f"{project_name}:0.0"  # Claude Code is in pane 0 of window 0
             
-            # Escape the message for shell safety
-            import shlex
-            escaped_message = shlex.quote(message)
+            if self.sink:
+                self.sink(target_window, message, f"phase-{phase_num}", self.clock() + delay_minutes * 60, True)
+                return
+            
+            # The message is written to a file rather than quoted into the
+            # command line; the dispatcher pastes it and removes the file.
+            # One file per timer - a reschedule or re-sent webhook must not
+            # share (and delete) another timer's file
+            message_file = self.messages_dir / f"{project_name}_phase{phase_num}_{uuid.uuid4().hex[:12]}.txt"
+            message_file.write_text(message, encoding='utf-8')
             
             # Create a command that will be executed after the delay
-            # Using the send-claude-message.sh script directly
-            delayed_command = f"{self.send_message_script} {target_window} {escaped_message}"
+            # Delivery goes through the dispatcher so simultaneous timers from
+            # different projects are staggered and rate limited
+            delayed_command = " ".join(shlex.quote(part) for part in [
+                sys.executable, str(self.dispatcher_script), "send",
+                "--target", target_window,
+                "--source", f"phase-{phase_num}",
+                "--consume",
+                "--message-file", str(message_file)
+            ])
             
             # Calculate delay in seconds
-            delay_seconds = delay_minutes * 60
+            delay_seconds = int(delay_minutes * 60)
             
             # Use nohup with sleep to schedule the message
             # This persists even if the parent process exits
-            cmd = f"nohup bash -c 'sleep {delay_seconds} && {delayed_command}' > /dev/null 2>&1 &"
+            cmd = f"nohup bash -c {shlex.quote(f'sleep {delay_seconds} && {delayed_command}')} > /dev/null 2>&1 &"
             
             logger.info(f"Scheduling Phase {phase_num} for {project_name} in {delay_minutes} minutes")
             
@@ -136,18 +397,19 @@ class PhaseScheduler:
             if result.returncode == 0:
                 logger.info(f"Successfully scheduled Phase {phase_num} for {project_name} with nohup")
                 
-                # Special handling for Phase 2 - testing server
-                if phase_num == 2 and self.testing_manager:
-                    # Schedule testing server start
-                    test_cmd = f"nohup bash -c 'sleep {delay_seconds} && echo \"Starting testing server for {project_name}\"' > /dev/null 2>&1 &"
-                    subprocess.run(test_cmd, shell=True)
-                    logger.info(f"Scheduled testing server start for Phase 2")
+                # Testing server start/restart at the same moment
+                if phase_num in PHASE_SERVER_ACTIONS:
+                    self._schedule_server_action(project_name, PHASE_SERVER_ACTIONS[phase_num], delay_seconds)
+                    logger.info(f"Scheduled testing server {PHASE_SERVER_ACTIONS[phase_num]} for Phase {phase_num}")
                 
             else:
                 logger.error(f"Failed to schedule Phase {phase_num} for {project_name}: {result.stderr}")
+                message_file.unlink(missing_ok=True)
                 
         except Exception as e:
             logger.error(f"Error in _schedule_phase_transition: {e}")
+            if message_file is not None:
+                message_file.unlink(missing_ok=True)
     
     
     def _get_phase_1_message(self):
@@ -331,14 +593,92 @@ FINAL CHECKLIST:
 
 Deploy final swarm for comprehensive review and commit!"""
     
-    def get_phase_status(self, project_name):
+    def get_phase_status(self, project_name, started_at=None):
         """
         Get the current phase status for a project
-        This could be enhanced to track actual progress
+        Calculated from the time elapsed since the session started
+        (started_at: datetime or ISO string, e.g. the timestamp in *_params.json)
+        """
+        # Adaptive projects record their real phase
+        adaptive = None
+        try:
+            with open(self.state_dir / f"{project_name}_adaptive.json", 'r') as f:
+                adaptive = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if adaptive:
+            phase_num = adaptive['current_phase']
+            return {
+                "project": project_name,
+                "phase": phase_num,
+                "name": self.phase_config.get(phase_num, {}).get("name"),
+                "status": "completed" if adaptive.get('finished') else "in_progress",
+                "phase_started_at": datetime.fromtimestamp(adaptive['phase_started_at']).isoformat(timespec='seconds'),
+                "time_saved_minutes": adaptive.get('time_saved_minutes', 0),
+                "predicted_completion": self._predicted_completion(project_name),
+                "estimated": False
+            }
+        
+        if started_at is None:
+            return {"project": project_name, "phase": None, "status": "unknown"}
+        if isinstance(started_at, str):
+            try:
+                started_at = datetime.fromisoformat(started_at)
+            except ValueError:
+                return {"project": project_name, "phase": None, "status": "unknown"}
+
+        # Same durations the timers were scheduled with (learned or configured)
+        durations = self._scheduled_durations(project_name)
+        elapsed_minutes = (datetime.now() - started_at).total_seconds() / 60
+        phase_start = 0
+        for phase_num, phase_info in self.phase_config.items():
+            phase_end = phase_start + durations[phase_num]
+            if elapsed_minutes < phase_end:
+                return {
+                    "project": project_name,
+                    "phase": phase_num,
+                    "name": phase_info["name"],
+                    "status": "in_progress",
+                    "phase_started_at": (started_at + timedelta(minutes=phase_start)).isoformat(timespec='seconds'),
+                    "next_phase_at": (started_at + timedelta(minutes=phase_end)).isoformat(timespec='seconds'),
+                    "predicted_completion": self._predicted_completion(project_name),
+                    "estimated": True
+                }
+            phase_start = phase_end
+
+        last_phase = max(self.phase_config)
+        return {
+            "project": project_name,
+            "phase": last_phase,
+            "name": self.phase_config[last_phase]["name"],
+            "status": "completed",
+            "completed_at": (started_at + timedelta(minutes=phase_start)).isoformat(timespec='seconds'),
+            "estimated": True
+        }
+    
+    def _load_schedule(self, project_name):
+        try:
+            with open(self.state_dir / f"{project_name}_schedule.json", 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _predicted_completion(self, project_name):
+        return self._load_schedule(project_name).get('predicted_completion')
+    
+    def _scheduled_durations(self, project_name):
+        """
+        Minutes per phase from the project's saved schedule prediction
+        Phases without one use the configured duration.
         """
-        # For now, we calculate based on time elapsed
-        # In the future, this could check actual progress markers
-        return {"phase": "calculated", "status": "estimated"}
+        durations = {phase: info["duration_minutes"] for phase, info in self.phase_config.items()}
+        for entry in self._load_schedule(project_name).get('phases', []):
+            try:
+                if entry['phase'] in durations:
+                    durations[entry['phase']] = float(entry['planned_minutes'])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return durations
     
     def reschedule_phase(self, project_name, phase_num, new_delay_minutes):
         """
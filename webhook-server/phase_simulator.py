@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Phase Scheduler Simulator
+Replays a recorded or synthetic project arrival trace through PhaseScheduler on a
+virtual clock and models the message dispatcher, so schedule and rate-limit
+changes can be evaluated in seconds instead of hours
+"""
+
+import heapq
+import json
+import logging
+import math
+import random
+import shutil
+import statistics
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from message_dispatcher import PRIORITY_SOURCES, create_message_dispatcher
+from phase_scheduler import PhaseScheduler
+
+logger = logging.getLogger(__name__)
+
+STARTER_PROMPT_DELAY = 3  # webhook_server waits this long between PM init and starter prompt
+
+class VirtualClock:
+    """A clock that only moves when told to - pass it wherever time.time is expected"""
+
+    def __init__(self, start=0.0):
+        self.now = float(start)
+
+    def __call__(self):
+        return self.now
+
+    def advance_to(self, when):
+        self.now = max(self.now, when)
+
+def load_trace(path):
+    """
+    Arrivals from a JSONL trace: {"time", "project", "template", "requirements_chars"}
+    time is epoch seconds or an ISO timestamp.
+    """
+    arrivals = []
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            arrival = _parse_time(entry.get('time'))
+            if arrival is None:
+                continue
+            arrivals.append({
+                'time': arrival,
+                'project': entry.get('project') or f"project-{len(arrivals)}",
+                'template': entry.get('template'),
+                'requirements_chars': entry.get('requirements_chars')
+            })
+    return sorted(arrivals, key=lambda a: a['time'])
+
+def recorded_arrivals(state_dir):
+    """Arrivals recorded by the webhook server in state/*_params.json"""
+    arrivals = []
+    for path in Path(state_dir).glob("*_params.json"):
+        try:
+            with open(path, 'r') as f:
+                params = json.load(f)
+        except (OSError, ValueError):
+            continue
+        arrival = _parse_time(params.get('timestamp'))
+        if arrival is None:
+            continue
+        arrivals.append({
+            'time': arrival,
+            'project': params.get('project_name') or path.name[:-len("_params.json")],
+            'template': params.get('template_name'),
+            'requirements_chars': params.get('requirements_chars')
+        })
+    return sorted(arrivals, key=lambda a: a['time'])
+
+def synthetic_arrivals(count, per_hour, batch_size=1, templates=None, seed=0):
+    """
+    Poisson arrivals at per_hour, in batches of batch_size projects that
+    arrive together (like a batch docs push); sizes are log-normal around 6k chars
+    """
+    rng = random.Random(seed)
+    templates = templates or [None]
+    arrivals = []
+    now = 0.0
+    while len(arrivals) < count:
+        now += rng.expovariate(per_hour / batch_size / 3600)
+        for _ in range(min(batch_size, count - len(arrivals))):
+            arrivals.append({
+                'time': now,
+                'project': f"sim-{len(arrivals):05d}",
+                'template': rng.choice(templates),
+                'requirements_chars': int(rng.lognormvariate(math.log(6000), 0.5))
+            })
+    return arrivals
+
+def _parse_time(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return None
+
+class DispatchModel:
+    """
+    Discrete-event model of MessageDispatcher
+
+    Same policy as the real dispatcher: a message waits its jitter, then its
+    turn in the session (tickets in request order), then a token from the
+    global bucket, then takes send_seconds to deliver. Token waiters from
+    PRIORITY_SOURCES go first; otherwise first come, first served.
+    """
+
+    def __init__(self, rate_per_minute, burst, jitter_seconds, send_seconds, seed=0):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.burst = burst
+        self.jitter_seconds = jitter_seconds
+        self.send_seconds = send_seconds
+        self.rng = random.Random(seed)
+        self.tokens = float(burst)
+        self.updated = None
+        self.messages = []
+
+    def _refill(self, when):
+        if self.updated is None or when > self.updated:
+            elapsed = 0 if self.updated is None else when - self.updated
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate_per_second)
+            self.updated = when
+
+    def run(self, requests):
+        """
+        requests: [(fire_at, target, source, jitter)]
+        Returns one record per message with its waits and send window.
+        """
+        events = []
+        sessions = {}
+        waiting = []
+        token_event = [None]
+        for seq, (fire_at, target, source, jitter) in enumerate(sorted(requests, key=lambda r: r[0])):
+            session = target.split(':', 1)[0]
+            queue = sessions.setdefault(session, {'queue': [], 'busy': False})
+            message = {
+                'seq': seq,
+                'session': session,
+                'source': source,
+                'requested': fire_at,
+                'jitter': self.rng.uniform(0, self.jitter_seconds) if jitter and self.jitter_seconds > 0 else 0.0
+            }
+            message['ready'] = fire_at + message['jitter']
+            queue['queue'].append(message)
+            heapq.heappush(events, (message['ready'], 0, seq, 'ready', message))
+
+        def grant(now):
+            """Hand out available tokens to waiters, priority first"""
+            self._refill(now)
+            # (with a little slack for floating point refill error)
+            while waiting and self.tokens >= 1 - 1e-9:
+                _, _, _, message = heapq.heappop(waiting)
+                self.tokens = max(0.0, self.tokens - 1)
+                message['sent'] = now
+                message['done'] = now + self.send_seconds
+                heapq.heappush(events, (message['done'], 1, message['seq'], 'done', message))
+            if waiting and token_event[0] is None:
+                token_event[0] = now + (1 - self.tokens) / self.rate_per_second
+                heapq.heappush(events, (token_event[0], 2, -1, 'token', None))
+
+        while events:
+            now, _, _, kind, message = heapq.heappop(events)
+            if kind == 'token':
+                token_event[0] = None
+                grant(now)
+                continue
+            queue = sessions[message['session']]
+            if kind == 'done':
+                queue['queue'].pop(0)
+                queue['busy'] = False
+                self.messages.append(message)
+            # Whoever is at the head of the session queue may go once it is ready
+            if not queue['busy'] and queue['queue'] and queue['queue'][0]['ready'] <= now:
+                head = queue['queue'][0]
+                head['turn'] = now
+                queue['busy'] = True
+                rank = 0 if head['source'] in PRIORITY_SOURCES else 1
+                heapq.heappush(waiting, (rank, now, head['seq'], head))
+                grant(now)
+        return self.messages
+
+def _percentiles(values):
+    if not values:
+        return {'p50': 0, 'p95': 0, 'max': 0}
+    values = sorted(values)
+    return {
+        'p50': round(statistics.median(values), 1),
+        'p95': round(values[min(len(values) - 1, int(len(values) * 0.95))], 1),
+        'max': round(values[-1], 1)
+    }
+
+def summarize(messages, send_seconds):
+    """Delay distributions, contention and peak concurrency over simulated messages"""
+    if not messages:
+        return {'messages': 0}
+
+    # Peak concurrent sends from a sweep over send windows
+    edges = sorted([(m['sent'], 1) for m in messages] + [(m['done'], -1) for m in messages],
+                   key=lambda e: (e[0], e[1]))
+    in_flight = peak = 0
+    peak_at = edges[0][0]
+    for when, delta in edges:
+        in_flight += delta
+        if in_flight > peak:
+            peak, peak_at = in_flight, when
+
+    per_minute = {}
+    for m in messages:
+        minute = int(m['sent'] // 60)
+        per_minute[minute] = per_minute.get(minute, 0) + 1
+    busiest_minute = max(per_minute, key=per_minute.get)
+
+    bucket_waits = [m['sent'] - m['turn'] for m in messages]
+    by_source = {}
+    for m in messages:
+        by_source.setdefault(m['source'], []).append(m['done'] - m['requested'])
+
+    start = min(m['requested'] for m in messages)
+    return {
+        'messages': len(messages),
+        'span_hours': round((max(m['done'] for m in messages) - start) / 3600, 2),
+        'delay_seconds': _percentiles([m['done'] - m['requested'] for m in messages]),
+        'jitter_seconds': _percentiles([m['jitter'] for m in messages]),
+        'order_wait_seconds': _percentiles([m['turn'] - m['ready'] for m in messages]),
+        'bucket_wait_seconds': _percentiles(bucket_waits),
+        'rate_limited': sum(1 for w in bucket_waits if w > 1),
+        'peak_concurrent_sends': peak,
+        'peak_at_offset_minutes': round((peak_at - start) / 60, 1),
+        'busiest_minute_sends': per_minute[busiest_minute],
+        'by_source': {source: dict(_percentiles(d), count=len(d)) for source, d in sorted(by_source.items())}
+    }
+
+class PhaseSimulator:
+    """
+    Drives a real PhaseScheduler with a VirtualClock and a recording sink
+
+    Each arrival gets the server's PM init and starter prompt, then
+    schedule_all_phases() as in production; the sink collects every timer
+    and send, and the DispatchModel plays them through the rate limiter.
+    Adaptive mode has no progress trackers to read here, so the simulator
+    always schedules fixed timers from the (learned or static) durations.
+    """
+
+    def __init__(self, state_dir=None, use_history=True, rate_per_minute=None, burst=None,
+                 jitter_seconds=None, send_seconds=None, seed=0):
+        self.workdir = Path(tempfile.mkdtemp(prefix="phase-sim-"))
+        real_state = Path(state_dir) if state_dir else Path(__file__).parent / "state"
+        history = real_state / "phase_durations.jsonl"
+        if use_history and history.exists():
+            shutil.copy(history, self.workdir / history.name)
+
+        self.clock = VirtualClock()
+        self.requests = []
+        self.scheduler = PhaseScheduler(mode='fixed', clock=self.clock, sink=self._sink, state_dir=self.workdir)
+
+        # Dispatcher settings default to the live ones (DISPATCH_* env vars)
+        live = create_message_dispatcher(self.workdir)
+        if send_seconds is None:
+            send_seconds = live.submit_delay + 0.05 if live.method == 'buffer' else 1.0
+        self.dispatch = DispatchModel(
+            rate_per_minute if rate_per_minute is not None else live.rate_per_second * 60,
+            burst if burst is not None else live.burst,
+            jitter_seconds if jitter_seconds is not None else live.jitter_seconds,
+            send_seconds,
+            seed=seed
+        )
+
+    def _sink(self, target, message, source, fire_at, jitter):
+        self.requests.append((fire_at, target, source, jitter))
+
+    def run(self, arrivals):
+        for arrival in arrivals:
+            self.clock.advance_to(arrival['time'])
+            project = arrival['project']
+            self._sink(f"{project}:0", "", 'pm-init', self.clock(), False)
+            self._sink(f"{project}:0", "", 'starter-prompt', self.clock() + STARTER_PROMPT_DELAY, False)
+            self.scheduler.schedule_all_phases(project, {
+                'template_name': arrival.get('template'),
+                'requirements_chars': arrival.get('requirements_chars')
+            })
+        messages = self.dispatch.run(self.requests)
+        return messages, summarize(messages, self.dispatch.send_seconds)
+
+    def close(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Simulate phase scheduling and message dispatch on a virtual clock')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--trace', help='JSONL arrival trace (time, project, template, requirements_chars)')
+    source.add_argument('--recorded', action='store_true', help='Replay arrivals from state/*_params.json')
+    parser.add_argument('--synthetic', type=int, default=1000, help='Number of synthetic projects (default: 1000)')
+    parser.add_argument('--arrivals-per-hour', type=float, default=60, help='Synthetic arrival rate (default: 60)')
+    parser.add_argument('--batch-size', type=int, default=1, help='Synthetic projects arriving together (default: 1)')
+    parser.add_argument('--rate', type=float, help='Dispatch rate per minute (default: DISPATCH_RATE_PER_MINUTE)')
+    parser.add_argument('--burst', type=int, help='Dispatch burst (default: DISPATCH_BURST)')
+    parser.add_argument('--jitter', type=float, help='Jitter seconds (default: DISPATCH_JITTER_SECONDS)')
+    parser.add_argument('--send-seconds', type=float, help='Time one delivery takes (default: from DISPATCH_METHOD)')
+    parser.add_argument('--no-history', action='store_true', help='Ignore learned durations, use the static config')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write every simulated message (fire time, waits) as JSONL')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    state_dir = Path(__file__).parent / "state"
+
+    if args.trace:
+        arrivals = load_trace(args.trace)
+    elif args.recorded:
+        arrivals = recorded_arrivals(state_dir)
+    else:
+        templates = sorted({a['template'] for a in recorded_arrivals(state_dir) if a['template']}) or None
+        arrivals = synthetic_arrivals(args.synthetic, args.arrivals_per_hour, args.batch_size, templates, args.seed)
+    if not arrivals:
+        print("No arrivals to simulate")
+        return 1
+
+    simulator = PhaseSimulator(state_dir, use_history=not args.no_history, rate_per_minute=args.rate,
+                               burst=args.burst, jitter_seconds=args.jitter,
+                               send_seconds=args.send_seconds, seed=args.seed)
+    try:
+        started = time.time()
+        messages, summary = simulator.run(arrivals)
+        summary['wall_seconds'] = round(time.time() - started, 2)
+    finally:
+        simulator.close()
+
+    if args.output:
+        origin = arrivals[0]['time']
+        with open(args.output, 'w') as f:
+            for m in sorted(messages, key=lambda m: m['sent']):
+                f.write(json.dumps({
+                    'session': m['session'],
+                    'source': m['source'],
+                    'requested_offset': round(m['requested'] - origin, 1),
+                    'sent_offset': round(m['sent'] - origin, 1),
+                    'jitter': round(m['jitter'], 1),
+                    'order_wait': round(m['turn'] - m['ready'], 1),
+                    'bucket_wait': round(m['sent'] - m['turn'], 1)
+                }) + "\n")
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    model = simulator.dispatch
+    print(f"Simulated {len(arrivals)} projects, {summary['messages']} messages over "
+          f"{summary['span_hours']}h in {summary['wall_seconds']}s")
+    print(f"Dispatcher: {model.rate_per_second * 60:g}/min, burst {model.burst}, "
+          f"jitter {model.jitter_seconds:g}s, send {model.send_seconds:g}s\n")
+    print(f"{'':<22} {'p50':>8} {'p95':>8} {'max':>8}")
+    for key in ('delay_seconds', 'jitter_seconds', 'order_wait_seconds', 'bucket_wait_seconds'):
+        row = summary[key]
+        print(f"{key:<22} {row['p50']:>8} {row['p95']:>8} {row['max']:>8}")
+    print(f"\nRate limited (>1s wait): {summary['rate_limited']} of {summary['messages']}")
+    print(f"Peak concurrent sends:   {summary['peak_concurrent_sends']} "
+          f"(at +{summary['peak_at_offset_minutes']} min)")
+    print(f"Busiest minute:          {summary['busiest_minute_sends']} sends\n")
+    print(f"{'source':<16} {'count':>6} {'p50 delay':>10} {'p95 delay':>10}")
+    for name, row in summary['by_source'].items():
+        print(f"{name:<16} {row['count']:>6} {row['p50']:>10} {row['p95']:>10}")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
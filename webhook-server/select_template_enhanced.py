@@ -5,10 +5,33 @@ Selects from ALL available templates (300+) based on requirements
 """
 
 import os
+import sys
 import json
 import random
 from pathlib import Path
 
+# Keyword categories used by score_template and the batch scorer
+KEYWORD_CATEGORIES = {
+    "saas": ["saas", "subscription", "billing", "stripe", "payment"],
+    "blog": ["blog", "content", "markdown", "cms", "posts", "articles"],
+    "ecommerce": ["shop", "store", "product", "cart", "checkout", "commerce"],
+    "dashboard": ["dashboard", "admin", "analytics", "charts", "metrics"],
+    "social": ["social", "chat", "messaging", "feed", "friends", "posts"],
+    "crm": ["crm", "customer", "sales", "leads", "contacts"],
+    "realtime": ["realtime", "live", "websocket", "chat", "collaborative"],
+    "marketplace": ["marketplace", "vendor", "multi-vendor", "sellers"],
+    "project": ["project", "task", "kanban", "team", "management"],
+    "ai": ["ai", "ml", "gpt", "llm", "generation", "intelligent"]
+}
+
+DEFAULT_TEMPLATE_RESULT = {
+    "template": "modern-saas/nextjs-saas-clerk",
+    "full_path": "/home/wv3/templates/modern-saas/nextjs-saas-clerk",
+    "auth": "Clerk",
+    "database": "Prisma/SQLite",
+    "ui": "shadcn/ui"
+}
+
 def load_all_templates():
     """Load all available templates from index.json and directories"""
     templates_dir = Path("/home/wv3/templates")
@@ -70,22 +93,8 @@ def score_template(template_info, requirements, project_type=None):
     score = 0
     req_lower = requirements.lower()
     
-    # Keywords that boost score
-    keywords = {
-        "saas": ["saas", "subscription", "billing", "stripe", "payment"],
-        "blog": ["blog", "content", "markdown", "cms", "posts", "articles"],
-        "ecommerce": ["shop", "store", "product", "cart", "checkout", "commerce"],
-        "dashboard": ["dashboard", "admin", "analytics", "charts", "metrics"],
-        "social": ["social", "chat", "messaging", "feed", "friends", "posts"],
-        "crm": ["crm", "customer", "sales", "leads", "contacts"],
-        "realtime": ["realtime", "live", "websocket", "chat", "collaborative"],
-        "marketplace": ["marketplace", "vendor", "multi-vendor", "sellers"],
-        "project": ["project", "task", "kanban", "team", "management"],
-        "ai": ["ai", "ml", "gpt", "llm", "generation", "intelligent"]
-    }
-    
     # Check for keyword matches
-    for category, words in keywords.items():
+    for category, words in KEYWORD_CATEGORIES.items():
         for word in words:
             if word in req_lower:
                 score += 2
@@ -108,57 +117,70 @@ def score_template(template_info, requirements, project_type=None):
     
     return score
 
-def select_template(requirements="", template_hint=None):
+def _template_result(name, template, reason):
+    """Build the result dict returned for a selected template"""
+    return {
+        "template": name,
+        "full_path": template["path"],
+        "auth": template["auth"],
+        "database": template["database"],
+        "ui": template["ui"],
+        "reason": reason
+    }
+
+def _match_hint(templates, template_hint):
+    """Return a result for an exact or partial template hint match, if any"""
+    if not template_hint:
+        return None
+    
+    hint_clean = template_hint.lower().replace("_", "-")
+    
+    # Direct match
+    if hint_clean in templates:
+        return _template_result(hint_clean, templates[hint_clean], "exact_hint_match")
+    
+    # Partial match
+    for name, template in templates.items():
+        if hint_clean in name or name in hint_clean:
+            return _template_result(name, template, "partial_hint_match")
+    
+    return None
+
+def _pick_scored(scored_templates, total, rng=random):
+    """Pick from the top of a score-sorted list (within 2 points of best)"""
+    best_score = scored_templates[0][0]
+    top_templates = [t for t in scored_templates if t[0] >= best_score - 2]
+    
+    # Randomly select from top templates for variety
+    selected = rng.choice(top_templates) if top_templates else scored_templates[0]
+    
+    result = _template_result(selected[1], selected[2], f"scored_{selected[0]}")
+    result["total_templates_considered"] = total
+    return result
+
+def select_template(requirements="", template_hint=None, templates=None):
     """
     Select the most appropriate template from ALL available templates
     
     Args:
         requirements (str): Description of project requirements
         template_hint (str): Optional hint about which template to use
+        templates (dict): Optional preloaded catalog from load_all_templates()
     
     Returns:
         dict: Template information with name, path, and tech stack
     """
-    templates = load_all_templates()
+    if templates is None:
+        templates = load_all_templates()
     
     if not templates:
         # Fallback if no templates found
-        return {
-            "template": "modern-saas/nextjs-saas-clerk",
-            "full_path": "/home/wv3/templates/modern-saas/nextjs-saas-clerk",
-            "auth": "Clerk",
-            "database": "Prisma/SQLite",
-            "ui": "shadcn/ui",
-            "reason": "default_fallback"
-        }
+        return dict(DEFAULT_TEMPLATE_RESULT, reason="default_fallback")
     
     # If template hint is provided, try to find exact match
-    if template_hint:
-        hint_clean = template_hint.lower().replace("_", "-")
-        
-        # Direct match
-        if hint_clean in templates:
-            template = templates[hint_clean]
-            return {
-                "template": hint_clean,
-                "full_path": template["path"],
-                "auth": template["auth"],
-                "database": template["database"],
-                "ui": template["ui"],
-                "reason": "exact_hint_match"
-            }
-        
-        # Partial match
-        for name, template in templates.items():
-            if hint_clean in name or name in hint_clean:
-                return {
-                    "template": name,
-                    "full_path": template["path"],
-                    "auth": template["auth"],
-                    "database": template["database"],
-                    "ui": template["ui"],
-                    "reason": "partial_hint_match"
-                }
+    hint_result = _match_hint(templates, template_hint)
+    if hint_result:
+        return hint_result
     
     # Score all templates
     scored_templates = []
@@ -169,36 +191,159 @@ def select_template(requirements="", template_hint=None):
     # Sort by score (highest first)
     scored_templates.sort(key=lambda x: x[0], reverse=True)
     
-    # Get top templates with similar scores (within 2 points of best)
     if scored_templates:
-        best_score = scored_templates[0][0]
-        top_templates = [t for t in scored_templates if t[0] >= best_score - 2]
+        return _pick_scored(scored_templates, len(templates))
+    
+    # Ultimate fallback
+    return dict(DEFAULT_TEMPLATE_RESULT, reason="final_fallback")
+
+def build_template_features(templates):
+    """
+    Precompute the requirement-independent parts of score_template
+    
+    Returns a list of (name, template, base_score, category_flags, description)
+    tuples so each requirement text can be scored against the whole catalog
+    without re-deriving path/auth bonuses per template.
+    """
+    categories = list(KEYWORD_CATEGORIES)
+    features = []
+    for name, template in templates.items():
+        path_lower = template.get("path", "").lower()
+        base_score = 0
+        if "modern-saas" in template.get("path", ""):
+            base_score += 10
+        if template.get("auth") == "Clerk":
+            base_score += 5
+        category_flags = tuple(category in path_lower for category in categories)
+        features.append((name, template, base_score, category_flags,
+                         template.get("description", "").lower()))
+    return features
+
+def score_requirements_batch(requirements_list, features):
+    """
+    Score many requirement texts against precomputed template features
+    
+    Produces, for each requirement text, the same scores score_template would
+    give, sorted highest first. Keyword matches are counted once per text and
+    description matches once per distinct word, instead of once per template.
+    """
+    categories = list(KEYWORD_CATEGORIES)
+    for requirements in requirements_list:
+        req_lower = (requirements or "").lower()
+        
+        # Keyword matches per category (independent of the template)
+        matches = [sum(1 for word in KEYWORD_CATEGORIES[c] if word in req_lower) for c in categories]
+        keyword_score = 2 * sum(matches)
+        
+        # Description words, counted with multiplicity like score_template
+        word_counts = {}
+        for word in req_lower.split():
+            if len(word) > 3:
+                word_counts[word] = word_counts.get(word, 0) + 1
         
-        # Randomly select from top templates for variety
-        selected = random.choice(top_templates) if top_templates else scored_templates[0]
+        scored = []
+        for name, template, base_score, category_flags, description in features:
+            score = base_score + keyword_score
+            score += 5 * sum(m for m, flag in zip(matches, category_flags) if flag)
+            score += sum(count for word, count in word_counts.items() if word in description)
+            scored.append((score, name, template))
         
-        return {
-            "template": selected[1],
-            "full_path": selected[2]["path"],
-            "auth": selected[2]["auth"],
-            "database": selected[2]["database"],
-            "ui": selected[2]["ui"],
-            "reason": f"scored_{selected[0]}",
-            "total_templates_considered": len(templates)
-        }
+        scored.sort(key=lambda x: x[0], reverse=True)
+        yield scored
+
+def select_templates_batch(items, templates=None, rng=None):
+    """
+    Select templates for many requirement texts with a single catalog load
     
-    # Ultimate fallback
-    return {
-        "template": "modern-saas/nextjs-saas-clerk",
-        "full_path": "/home/wv3/templates/modern-saas/nextjs-saas-clerk",
-        "auth": "Clerk",
-        "database": "Prisma/SQLite",
-        "ui": "shadcn/ui",
-        "reason": "final_fallback"
-    }
+    Args:
+        items: Iterable of dicts with "id", "requirements" and optional "template_hint"
+        templates (dict): Optional preloaded catalog from load_all_templates()
+        rng: Optional random.Random for reproducible tie-breaking
+    
+    Yields:
+        dict: select_template result for each item, tagged with the item's id
+    """
+    if templates is None:
+        templates = load_all_templates()
+    rng = rng or random
+    features = build_template_features(templates)
+    
+    pending = []
+    
+    def flush():
+        scored_lists = score_requirements_batch([i.get("requirements", "") for i in pending], features)
+        for item, scored in zip(pending, scored_lists):
+            if scored:
+                result = _pick_scored(scored, len(templates), rng)
+            else:
+                result = dict(DEFAULT_TEMPLATE_RESULT, reason="default_fallback")
+            yield dict(result, id=item.get("id"))
+        pending.clear()
+    
+    for item in items:
+        hint_result = _match_hint(templates, item.get("template_hint")) if templates else None
+        if hint_result:
+            # Keep output in input order
+            yield from flush()
+            yield dict(hint_result, id=item.get("id"))
+            continue
+        pending.append(item)
+        if len(pending) >= 256:
+            yield from flush()
+    
+    yield from flush()
 
-if __name__ == "__main__":
-    # Test the enhanced template selection
+def load_processed_requirements(processed_dir):
+    """
+    Rebuild the requirements summary each processed project was sent with
+    
+    Mirrors the process-docs workflow: the first 100 lines / 500 characters of
+    the first document (alphabetically) in the project's archived docs.
+    """
+    skip = {"PROGRESS_TRACKER.md", "PROCESSING_SUMMARY.md", "PROCESSING_INFO.md"}
+    for project_dir in sorted(Path(processed_dir).iterdir()):
+        if not project_dir.is_dir():
+            continue
+        docs = sorted(p for p in project_dir.glob("*.md") if p.name not in skip)
+        if not docs:
+            continue
+        with open(docs[0], errors="replace") as f:
+            head = "".join(line for _, line in zip(range(100), f))
+        yield {"id": project_dir.name, "requirements": head[:500]}
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Enhanced template selection')
+    parser.add_argument('--processed-dir', type=str,
+                       help='Score every project archived in a processed/ directory')
+    parser.add_argument('--batch-file', type=str,
+                       help='JSON Lines file of {"id", "requirements", "template_hint"} items ("-" for stdin)')
+    parser.add_argument('--seed', type=int,
+                       help='Seed for reproducible tie-breaking between top templates')
+    args = parser.parse_args()
+    
+    if not args.processed_dir and not args.batch_file:
+        run_selection_demo()
+        return 0
+    
+    if args.processed_dir:
+        items = load_processed_requirements(args.processed_dir)
+    elif args.batch_file == "-":
+        items = (json.loads(line) for line in sys.stdin if line.strip())
+    else:
+        items = (json.loads(line) for line in open(args.batch_file) if line.strip())
+    
+    rng = random.Random(args.seed) if args.seed is not None else None
+    
+    # Stream results as JSON Lines
+    for result in select_templates_batch(items, rng=rng):
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+    return 0
+
+def run_selection_demo():
+    """Print selections for a few sample requirements"""
     test_requirements = [
         "Build a project management app with kanban boards",
         "Create a blog with markdown support",
@@ -221,4 +366,7 @@ if __name__ == "__main__":
         print(f"Auth: {result['auth']}")
         print(f"Database: {result['database']}")
         print(f"Reason: {result['reason']}")
-        print("-" * 40)
\ No newline at end of file
+        print("-" * 40)
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Stall Detector for Claude Sessions
+Flags sessions whose pane has produced no output for a configurable window
+and can nudge them through the message dispatcher
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from message_dispatcher import create_message_dispatcher
+
+logger = logging.getLogger(__name__)
+
+IGNORED_SESSIONS = ('tmux-orc', 'server')
+
+NUDGE_MESSAGE = """STATUS CHECK - NO OUTPUT FOR {minutes} MINUTES
+
+This session has been idle for {minutes} minutes.
+- If you are waiting on a prompt, permission or confirmation, resolve it and carry on.
+- If you finished the current phase, update PROGRESS_TRACKER.md and start the next unchecked task.
+- If you are blocked, write the blocker into PROGRESS_TRACKER.md and work around it.
+
+Continue with the current phase now."""
+
+class StallDetector:
+    """
+    Tracks per-session output and flags sessions that go quiet
+
+    Output is detected from tmux's window_activity timestamp for window 0
+    (method="activity", one tmux call for all sessions) or from a hash of
+    the captured pane (method="hash", for terminals whose activity
+    timestamp is updated by redraws that are not real progress). Stall
+    counts and durations are kept in state/stall_stats.json.
+
+    A nudge is itself pane output: the pasted text bumps window activity and
+    changes the pane hash. Output up to nudge_grace_seconds after a nudge
+    does not end the stall, and in hash mode the pane is re-captured right
+    after the nudge so the echoed text becomes the new baseline.
+    """
+
+    def __init__(self, state_dir, stall_minutes=10, nudge=False, nudge_cooldown_minutes=15,
+                 method="activity", dispatcher=None, nudge_grace_seconds=60):
+        self.state_dir = Path(state_dir)
+        self.stats_file = self.state_dir / "stall_stats.json"
+        self.stall_seconds = stall_minutes * 60
+        self.nudge = nudge
+        self.nudge_cooldown_seconds = nudge_cooldown_minutes * 60
+        self.nudge_grace_seconds = nudge_grace_seconds
+        self.method = method
+        self.dispatcher = dispatcher or create_message_dispatcher(self.state_dir)
+        self._hashes = {}
+        self._lock = threading.Lock()
+        self.stats = self._load_stats()
+
+    def _load_stats(self):
+        try:
+            with open(self.stats_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_stats(self):
+        try:
+            tmp = self.stats_file.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self.stats, f, indent=2)
+            os.replace(tmp, self.stats_file)
+        except OSError as e:
+            logger.error(f"Error saving stall stats: {e}")
+
+    def _window_activity(self):
+        """{session: last output epoch} for window 0 of every session"""
+        result = subprocess.run(
+            ["tmux", "list-windows", "-a", "-F", "#{session_name}\t#{window_index}\t#{window_activity}"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=10
+        )
+        activity = {}
+        for line in result.stdout.splitlines():
+            parts = line.split('\t')
+            if len(parts) == 3 and parts[1] == '0' and parts[2].isdigit() and parts[0] not in IGNORED_SESSIONS:
+                activity[parts[0]] = int(parts[2])
+        return activity
+
+    def _pane_digest(self, session):
+        result = subprocess.run(
+            ["tmux", "capture-pane", "-t", f"{session}:0", "-p"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        )
+        return hashlib.sha1(result.stdout).hexdigest()
+
+    def _pane_hash_activity(self, sessions, now):
+        """{session: last time the captured pane changed}, from content hashes"""
+        activity = {}
+        for session in sessions:
+            digest = self._pane_digest(session)
+            previous = self._hashes.get(session)
+            if previous is None or previous[0] != digest:
+                self._hashes[session] = (digest, now)
+            activity[session] = self._hashes[session][1]
+        for session in list(self._hashes):
+            if session not in activity:
+                del self._hashes[session]
+        return activity
+
+    def check(self, now=None):
+        """
+        Examine every session once
+        Returns {session: {idle_seconds, stalled, stalled_for, nudged}}
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            try:
+                activity = self._window_activity()
+                if self.method == "hash":
+                    activity = self._pane_hash_activity(activity, now)
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.warning(f"Stall check failed: {e}")
+                return {}
+
+            report = {}
+            for session, last_output in activity.items():
+                entry = self.stats.setdefault(session, {
+                    'stalls': 0,
+                    'total_stall_seconds': 0,
+                    'longest_stall_seconds': 0,
+                    'nudges': 0,
+                    'stalled_since': None,
+                    'last_nudge': None,
+                    'nudged_at': None
+                })
+                stalled_since = entry['stalled_since']
+                nudged_at = entry.get('nudged_at')
+                if stalled_since is not None and nudged_at is not None \
+                        and stalled_since < last_output <= nudged_at + self.nudge_grace_seconds:
+                    # Only the echo of our own nudge - still stalled
+                    last_output = stalled_since
+                idle = max(0, now - last_output)
+
+                if stalled_since is not None and last_output > stalled_since:
+                    # Output resumed - close the stall
+                    duration = int(last_output - stalled_since)
+                    entry['total_stall_seconds'] += duration
+                    entry['longest_stall_seconds'] = max(entry['longest_stall_seconds'], duration)
+                    entry['stalled_since'] = None
+                    entry['nudged_at'] = None
+                    logger.info(f"Session {session} resumed after {duration // 60}m stalled")
+                elif stalled_since is None and idle >= self.stall_seconds:
+                    entry['stalls'] += 1
+                    entry['stalled_since'] = last_output
+                    logger.warning(f"Session {session} stalled: no output for {int(idle // 60)} minutes")
+
+                nudged = False
+                if entry['stalled_since'] is not None and self.nudge:
+                    last_nudge = entry['last_nudge'] or 0
+                    if now - last_nudge >= self.nudge_cooldown_seconds:
+                        nudged = self.send_nudge(session, int(idle // 60))
+                        if nudged:
+                            entry['nudges'] += 1
+                            entry['last_nudge'] = now
+                            # The paste has landed by the time dispatch returns
+                            entry['nudged_at'] = time.time()
+
+                report[session] = {
+                    'idle_seconds': int(idle),
+                    'stalled': entry['stalled_since'] is not None,
+                    'stalled_for': int(now - entry['stalled_since']) if entry['stalled_since'] is not None else 0,
+                    'nudged': nudged
+                }
+
+            # Sessions that are gone keep their history but are no longer stalled
+            for session, entry in self.stats.items():
+                if session not in activity and entry.get('stalled_since') is not None:
+                    entry['stalled_since'] = None
+                    entry['nudged_at'] = None
+
+            self._save_stats()
+            return report
+
+    def send_nudge(self, session, idle_minutes):
+        """Send the nudge message to pane 0 of the session"""
+        message = NUDGE_MESSAGE.format(minutes=idle_minutes)
+        result = self.dispatcher.dispatch(f"{session}:0", message, source='nudge', jitter=False)
+        if not result['success']:
+            logger.error(f"Failed to nudge {session}: {result['stderr']}")
+            return False
+        if self.method == "hash" and session in self._hashes:
+            try:
+                self._hashes[session] = (self._pane_digest(session), self._hashes[session][1])
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.warning(f"Could not re-capture {session} after nudge: {e}")
+        logger.info(f"Nudged stalled session {session} after {idle_minutes} minutes idle")
+        return True
+
+    def get_report(self):
+        """Stall counts and durations per session, with totals"""
+        now = time.time()
+        sessions = {}
+        with self._lock:
+            for session, entry in self.stats.items():
+                ongoing = int(now - entry['stalled_since']) if entry.get('stalled_since') is not None else 0
+                sessions[session] = dict(entry, current_stall_seconds=ongoing,
+                                         stalled_since=(datetime.fromtimestamp(entry['stalled_since']).isoformat(timespec='seconds')
+                                                        if entry.get('stalled_since') is not None else None),
+                                         last_nudge=(datetime.fromtimestamp(entry['last_nudge']).isoformat(timespec='seconds')
+                                                     if entry.get('last_nudge') else None),
+                                         nudged_at=(datetime.fromtimestamp(entry['nudged_at']).isoformat(timespec='seconds')
+                                                    if entry.get('nudged_at') else None))
+        return {
+            'stall_minutes': self.stall_seconds / 60,
+            'nudge_enabled': self.nudge,
+            'method': self.method,
+            'stalled_now': sorted(s for s, e in sessions.items() if e['stalled_since']),
+            'total_stalls': sum(e['stalls'] for e in sessions.values()),
+            'total_stall_seconds': sum(e['total_stall_seconds'] + e['current_stall_seconds'] for e in sessions.values()),
+            'total_nudges': sum(e['nudges'] for e in sessions.values()),
+            'sessions': sessions
+        }
+
+    def run(self, interval=60, stop_event=None):
+        """Check every interval seconds until stop_event is set"""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            self.check()
+            stop_event.wait(interval)
+
+    def start(self, interval=60):
+        """Run the detector in a daemon thread"""
+        thread = threading.Thread(target=self.run, args=(interval,), daemon=True)
+        thread.start()
+        return thread
+
+def create_stall_detector(state_dir, stall_minutes=None, nudge=None, dispatcher=None):
+    """Factory function - STALL_MINUTES, STALL_NUDGE and STALL_NUDGE_GRACE_SECONDS env vars set the defaults"""
+    if stall_minutes is None:
+        stall_minutes = float(os.environ.get('STALL_MINUTES', 10))
+    if nudge is None:
+        nudge = os.environ.get('STALL_NUDGE', '').lower() in ('1', 'true', 'yes')
+    return StallDetector(state_dir, stall_minutes=stall_minutes, nudge=nudge,
+                         method=os.environ.get('STALL_METHOD', 'activity'), dispatcher=dispatcher,
+                         nudge_grace_seconds=float(os.environ.get('STALL_NUDGE_GRACE_SECONDS', 60)))
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Detect and nudge stalled Claude sessions')
+    parser.add_argument('--state-dir', default=str(Path(__file__).parent / "state"),
+                        help='Directory holding stall_stats.json')
+    parser.add_argument('--stall-minutes', type=float, default=10,
+                        help='Minutes without output before a session counts as stalled (default: 10)')
+    parser.add_argument('--method', choices=['activity', 'hash'], default='activity',
+                        help='Detect output from tmux activity timestamps or pane content hashes')
+    parser.add_argument('--nudge', action='store_true',
+                        help='Send a nudge message to stalled sessions')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep checking instead of running once')
+    parser.add_argument('--interval', type=float, default=60,
+                        help='Seconds between checks in watch mode (default: 60)')
+    parser.add_argument('--report', action='store_true',
+                        help='Print accumulated stall statistics as JSON and exit')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    detector = StallDetector(args.state_dir, stall_minutes=args.stall_minutes,
+                             nudge=args.nudge, method=args.method)
+
+    if args.report:
+        print(json.dumps(detector.get_report(), indent=2))
+        return 0
+
+    try:
+        while True:
+            report = detector.check()
+            for session, info in sorted(report.items()):
+                state = f"STALLED {info['stalled_for'] // 60}m" if info['stalled'] else "ok"
+                nudge = " (nudged)" if info['nudged'] else ""
+                print(f"{session:<45} idle {info['idle_seconds'] // 60:>4}m  {state}{nudge}")
+            if not args.watch:
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+if __name__ == "__main__":
+    exit(main())
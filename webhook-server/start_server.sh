@@ -41,6 +41,9 @@ echo "  - Enhanced error handling"
 echo "  - Admin endpoints"
 echo ""
 
+# Metric history for the dashboards - one writer, a second copy exits on the lock
+python3 "$SCRIPT_DIR/../monitoring/metrics_recorder.py" &
+
 # Start the server
 cd "$SCRIPT_DIR"
 python3 webhook_server.py
\ No newline at end of file
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Live Status Stream for the Webhook Server
+One shared collector polls tmux, scheduled phases and project state and pushes
+deltas to every connected Server-Sent Events client
+"""
+
+import json
+import logging
+import queue
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from phase_scheduler import create_phase_scheduler
+
+logger = logging.getLogger(__name__)
+
+IGNORED_SESSIONS = ('tmux-orc', 'server')
+
+def diff_section(old, new):
+    """Delta between two {key: value} dicts, or None if they are equal"""
+    added = {k: v for k, v in new.items() if k not in old}
+    changed = {k: v for k, v in new.items() if k in old and old[k] != v}
+    removed = [k for k in old if k not in new]
+    if not (added or changed or removed):
+        return None
+    return {'added': added, 'changed': changed, 'removed': removed}
+
+def format_event(event_id, kind, data):
+    """Serialize one event in text/event-stream format"""
+    return f"id: {event_id}\nevent: {kind}\ndata: {json.dumps(data, default=str)}\n\n"
+
+class _Subscriber:
+    """One connected client: a bounded event queue plus a resync flag"""
+
+    def __init__(self, maxsize):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.resync = False
+
+class _ErrorHandler(logging.Handler):
+    """Forwards ERROR log records to the broadcaster as they happen"""
+
+    def __init__(self, broadcaster):
+        super().__init__(level=logging.ERROR)
+        self.broadcaster = broadcaster
+
+    def emit(self, record):
+        try:
+            self.broadcaster.publish_error({
+                'time': datetime.fromtimestamp(record.created).isoformat(timespec='seconds'),
+                'source': record.name,
+                'message': record.getMessage()[:500]
+            })
+        except Exception:
+            self.handleError(record)
+
+class StatusBroadcaster:
+    """
+    Shared status collection for any number of live viewers
+
+    A single collector thread runs only while at least one client is
+    subscribed. Each cycle it takes one snapshot (one tmux call, one ps
+    call, the *_params.json files of live sessions) and publishes only the
+    sections that changed. Errors are pushed immediately from the logging
+    handler. A client that falls behind gets a full snapshot instead of
+    the events it missed.
+    """
+
+    SECTIONS = ('sessions', 'phases', 'queue')
+
+    def __init__(self, state_dir, interval=2.0, queue_size=256, max_errors=20):
+        self.state_dir = Path(state_dir)
+        self.interval = interval
+        self.queue_size = queue_size
+        self.phase_scheduler = create_phase_scheduler()
+
+        self._lock = threading.Lock()
+        self._collect_lock = threading.Lock()
+        self._subscribers = []
+        self._thread = None
+        self._state = None
+        self._errors = deque(maxlen=max_errors)
+        self._event_id = 0
+        self.cycles = 0
+
+    # Collection
+
+    def _collect_sessions(self):
+        result = subprocess.run(
+            ["tmux", "list-sessions", "-F",
+             "#{session_name}\t#{session_activity}\t#{session_windows}\t#{session_attached}"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=5
+        )
+        sessions = {}
+        for line in result.stdout.splitlines():
+            parts = line.split('\t')
+            if len(parts) != 4 or parts[0] in IGNORED_SESSIONS:
+                continue
+            name, activity, windows, attached = parts
+            sessions[name] = {
+                'last_activity': int(activity) if activity.isdigit() else None,
+                'windows': int(windows) if windows.isdigit() else None,
+                'attached': attached not in ('', '0')
+            }
+        return sessions
+
+    def _collect_phases(self, sessions):
+        phases = {}
+        for name in sessions:
+            params_file = self.state_dir / f"{name}_params.json"
+            try:
+                with open(params_file) as f:
+                    started_at = json.load(f).get('timestamp')
+            except (OSError, ValueError):
+                continue
+            if started_at:
+                status = self.phase_scheduler.get_phase_status(name, started_at)
+                if status.get('phase') is not None:
+                    phases[name] = status
+        return phases
+
+    def _collect_queue(self):
+        """Scheduled phase messages still sleeping, keyed by PID"""
+        result = subprocess.run(
+            ["ps", "-ewwo", "pid=,etimes=,args="],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=5
+        )
+        now = datetime.now()
+        scheduled = {}
+        for line in result.stdout.splitlines():
+            if 'sleep' not in line or ('send-claude-message' not in line and 'message_dispatcher' not in line):
+                continue
+            parts = line.split(None, 2)
+            sleep_match = re.search(r'sleep (\d+)', line)
+            if len(parts) < 3 or not sleep_match or not parts[1].isdigit():
+                continue
+            project_match = re.search(r'(\S+):0(?:\.0)?', parts[2])
+            phase_match = re.search(r'(?:PHASE |--source phase-)(\d+)', parts[2])
+            remaining = int(sleep_match.group(1)) - int(parts[1])
+            scheduled[parts[0]] = {
+                'project': project_match.group(1) if project_match else 'unknown',
+                'phase': int(phase_match.group(1)) if phase_match else None,
+                'fires_at': (now + timedelta(seconds=max(0, remaining))).isoformat(timespec='seconds')
+            }
+        return scheduled
+
+    def collect(self):
+        """Take one snapshot of every section"""
+        try:
+            sessions = self._collect_sessions()
+        except (OSError, subprocess.SubprocessError):
+            sessions = {}
+        try:
+            scheduled = self._collect_queue()
+        except (OSError, subprocess.SubprocessError):
+            scheduled = {}
+        return {
+            'sessions': sessions,
+            'phases': self._collect_phases(sessions),
+            'queue': scheduled
+        }
+
+    def snapshot(self):
+        """Current full state, collecting now if the collector has not run yet"""
+        with self._collect_lock:
+            if self._state is None:
+                self._state = self.collect()
+            state = dict(self._state)
+        state['errors'] = list(self._errors)
+        state['generated_at'] = datetime.now().isoformat(timespec='seconds')
+        return state
+
+    def _collector_loop(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._subscribers:
+                    # Last viewer left - stop polling until someone connects
+                    self._thread = None
+                    self._state = None
+                    return
+            try:
+                with self._collect_lock:
+                    new = self.collect()
+                    old = self._state or {}
+                    self._state = new
+                self.cycles += 1
+                for section in self.SECTIONS:
+                    delta = diff_section(old.get(section, {}), new[section])
+                    if delta:
+                        if section == 'phases':
+                            delta['transitions'] = self._phase_transitions(old.get(section, {}), new[section])
+                        self._publish(section, delta)
+            except Exception as e:
+                logger.warning(f"Status collection failed: {e}")
+
+    @staticmethod
+    def _phase_transitions(old, new):
+        transitions = []
+        for project, status in new.items():
+            before = old.get(project)
+            if before and before.get('phase') != status.get('phase'):
+                transitions.append({
+                    'project': project,
+                    'from': before.get('phase'),
+                    'to': status.get('phase'),
+                    'name': status.get('name')
+                })
+        return transitions
+
+    # Fan-out
+
+    def _publish(self, kind, data):
+        with self._lock:
+            self._event_id += 1
+            event = (self._event_id, kind, data)
+            for sub in self._subscribers:
+                try:
+                    sub.queue.put_nowait(event)
+                except queue.Full:
+                    sub.resync = True
+
+    def publish_error(self, error):
+        self._errors.append(error)
+        if self._subscribers:
+            self._publish('error', error)
+
+    def error_handler(self):
+        """Logging handler that streams ERROR records to viewers"""
+        return _ErrorHandler(self)
+
+    def subscribe(self):
+        sub = _Subscriber(self.queue_size)
+        with self._lock:
+            self._subscribers.append(sub)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._collector_loop, daemon=True)
+                self._thread.start()
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def stream(self, heartbeat=15.0):
+        """
+        Generator of text/event-stream chunks for one client
+        Starts with a full snapshot, then deltas; sends a comment line every
+        heartbeat seconds so proxies keep the connection open and dead
+        clients are noticed.
+        """
+        sub = self.subscribe()
+        try:
+            yield "retry: 3000\n\n"
+            yield format_event(self._event_id, 'snapshot', self.snapshot())
+            while True:
+                if sub.resync:
+                    # Fell behind - replace the backlog with a fresh snapshot
+                    while not sub.queue.empty():
+                        sub.queue.get_nowait()
+                    sub.resync = False
+                    yield format_event(self._event_id, 'snapshot', self.snapshot())
+                try:
+                    event_id, kind, data = sub.queue.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_event(event_id, kind, data)
+        finally:
+            self.unsubscribe(sub)
+
+def create_status_broadcaster(state_dir, interval=2.0):
+    """Factory function to create a status broadcaster"""
+    return StatusBroadcaster(state_dir, interval=interval)
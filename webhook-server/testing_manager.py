@@ -1,40 +1,468 @@
 #!/usr/bin/env python3
 """
-Testing Manager Stub
-Placeholder for testing functionality referenced in phase scheduler
+Testing Manager
+Runs each project's dev server from its workspace on an allocated port, supervises
+it with health probes and keeps the total within a memory budget
 """
 
+import json
 import logging
+import os
+import signal
+import socket
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+class PortAllocator:
+    """Hands out ports from a fixed range, skipping reserved ones and ports already bound"""
+
+    def __init__(self, start=3100, end=3199):
+        self.start = start
+        self.end = end
+
+    @staticmethod
+    def is_free(port):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("127.0.0.1", port))
+                return True
+            except OSError:
+                return False
+
+    def allocate(self, reserved):
+        for port in range(self.start, self.end + 1):
+            if port not in reserved and self.is_free(port):
+                return port
+        return None
+
+def process_group_rss():
+    """{process group id: resident bytes} for every process, from /proc"""
+    groups = {}
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return groups
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry.name}/stat', 'rb') as f:
+                stat = f.read().decode(errors='replace')
+        except OSError:
+            continue
+        # Fields after the parenthesised command name: state ppid pgrp ... rss is field 24
+        fields = stat[stat.rfind(')') + 2:].split()
+        if len(fields) < 22:
+            continue
+        pgrp, rss_pages = int(fields[2]), int(fields[21])
+        groups[pgrp] = groups.get(pgrp, 0) + rss_pages * PAGE_SIZE
+    return groups
+
+def detect_start_command(workspace, port):
+    """
+    Shell command that serves the project on port, or None
+    Uses the package.json dev/start/preview script with the lockfile's package
+    manager, installing dependencies first if node_modules is missing.
+    TESTING_SERVER_COMMAND (with a {port} placeholder) overrides detection.
+    """
+    override = os.environ.get('TESTING_SERVER_COMMAND')
+    if override:
+        return override.format(port=port)
+
+    workspace = Path(workspace)
+    try:
+        with open(workspace / "package.json", 'r') as f:
+            scripts = json.load(f).get('scripts', {})
+    except (OSError, ValueError):
+        return None
+    script = next((name for name in ('dev', 'start', 'preview') if name in scripts), None)
+    if script is None:
+        return None
+
+    if (workspace / "pnpm-lock.yaml").exists():
+        manager, run = "pnpm", f"pnpm run {script} --port {port}"
+    elif (workspace / "yarn.lock").exists():
+        manager, run = "yarn", f"yarn {script} --port {port}"
+    elif (workspace / "bun.lockb").exists():
+        manager, run = "bun", f"bun run {script} --port {port}"
+    else:
+        manager, run = "npm", f"npm run {script} -- --port {port}"
+
+    if not (workspace / "node_modules").exists():
+        return f"{manager} install && {run}"
+    return run
+
 class TestingManager:
     """
-    Simple testing manager for webhook server integration
+    Supervised dev servers, one per project
+
+    - Ports come from PortAllocator; servers also get PORT in their environment
+    - Each server runs in its own process group, logging to logs/testing/{project}.log
+    - A supervisor thread probes http://127.0.0.1:{port}/ and restarts servers
+      that exit or stop answering, up to max_restarts in a row (the count
+      resets once the server answers; deliberate restarts do not count)
+    - A server counts as used when its project's tmux session shows activity
+      (checked by the supervisor and before evicting)
+    - Before a start, least recently used servers that have been idle for
+      idle_minutes are stopped until the new one fits memory_budget_mb
+      (measured RSS of each process group); active ones are never evicted
+    - The registry is kept in state/testing_servers.json so a restarted
+      webhook server adopts servers that are still running
     """
-    
-    def __init__(self):
-        logger.info("Testing manager initialized")
-    
-    def start_testing_server(self, project_name):
-        """
-        Start testing server for a project
-        This is a placeholder for future testing integration
-        """
-        logger.info(f"Starting testing server for project: {project_name}")
+
+    def __init__(self, state_dir, log_dir, port_start=3100, port_end=3199, memory_budget_mb=4096,
+                 default_server_mb=600, startup_timeout=300, probe_interval=15, max_restarts=3,
+                 idle_minutes=10):
+        self.state_dir = Path(state_dir)
+        self.registry_file = self.state_dir / "testing_servers.json"
+        self.log_dir = Path(log_dir)
+        self.ports = PortAllocator(port_start, port_end)
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.default_server_bytes = default_server_mb * 1024 * 1024
+        self.startup_timeout = startup_timeout
+        self.probe_interval = probe_interval
+        self.max_restarts = max_restarts
+        self.idle_seconds = idle_minutes * 60
+        self._processes = {}
+        self._lock = threading.RLock()
+        self._supervisor = None
+        self._stop_event = threading.Event()
+        self.servers = self._load_registry()
+        if self.servers:
+            self._ensure_supervisor()
+        logger.info(f"Testing manager initialized ({len(self.servers)} servers in registry)")
+
+    # Registry
+
+    def _load_registry(self):
+        try:
+            with open(self.registry_file, 'r') as f:
+                servers = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Adopt servers that survived a restart, drop the rest
+        return {name: info for name, info in servers.items() if self._alive(info.get('pid'))}
+
+    def _save_registry(self):
+        try:
+            tmp = self.registry_file.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(self.servers, f, indent=2)
+            os.replace(tmp, self.registry_file)
+        except OSError as e:
+            logger.error(f"Error saving testing server registry: {e}")
+
+    def _alive(self, pid):
+        if not pid:
+            return False
+        process = self._processes.get(pid)
+        if process is not None:
+            return process.poll() is None
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
         return True
-    
-    def stop_testing_server(self, project_name):
+
+    # Lifecycle
+
+    def start_testing_server(self, project_name, workspace):
         """
-        Stop testing server for a project
+        Start (or keep) the project's dev server
+        Returns {"success", "port", "url", "pid"} or {"success": False, "error"}.
         """
-        logger.info(f"Stopping testing server for project: {project_name}")
+        with self._lock:
+            info = self.servers.get(project_name)
+            if info and self._alive(info['pid']):
+                info['last_used'] = time.time()
+                self._save_registry()
+                return self._result(info)
+
+            port = info['port'] if info and self.ports.is_free(info['port']) else None
+            if port is None:
+                port = self.ports.allocate({s['port'] for n, s in self.servers.items() if n != project_name})
+            if port is None:
+                return {"success": False, "error": "no free port in testing range"}
+
+            command = detect_start_command(workspace, port)
+            if command is None:
+                return {"success": False, "error": f"no dev server found in {workspace}"}
+
+            if not self._make_room(project_name):
+                return {"success": False, "error": "memory budget exhausted and nothing idle to evict"}
+
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            log_path = self.log_dir / f"{project_name}.log"
+            try:
+                with open(log_path, 'a') as log:
+                    log.write(f"\n=== {datetime.now().isoformat(timespec='seconds')} {command}\n")
+                    log.flush()
+                    process = subprocess.Popen(
+                        ["bash", "-c", command],
+                        cwd=str(workspace),
+                        env=dict(os.environ, PORT=str(port), BROWSER="none"),
+                        stdin=subprocess.DEVNULL,
+                        stdout=log,
+                        stderr=subprocess.STDOUT,
+                        start_new_session=True
+                    )
+            except OSError as e:
+                return {"success": False, "error": str(e)}
+
+            self._processes[process.pid] = process
+            now = time.time()
+            self.servers[project_name] = {
+                'pid': process.pid,
+                'port': port,
+                'workspace': str(workspace),
+                'command': command,
+                'status': 'starting',
+                'started_at': now,
+                'last_used': now,
+                'last_healthy': None,
+                'failed_probes': 0,
+                'restarts': info.get('restarts', 0) if info else 0,
+                'rss_bytes': 0
+            }
+            self._save_registry()
+            self._ensure_supervisor()
+            logger.info(f"Started testing server for {project_name} on port {port} (pid {process.pid})")
+            return self._result(self.servers[project_name])
+
+    def stop_testing_server(self, project_name, reason="stopped"):
+        """Terminate the project's server process group and release its port"""
+        with self._lock:
+            info = self.servers.pop(project_name, None)
+            if info is None:
+                return False
+            self._terminate(info['pid'])
+            self._save_registry()
+            logger.info(f"Stopped testing server for {project_name} ({reason})")
+            return True
+
+    def restart_testing_server(self, project_name, workspace=None):
+        """Stop and start again on the same port when it is still free"""
+        with self._lock:
+            info = self.servers.get(project_name)
+            if info is None:
+                if workspace is None:
+                    return {"success": False, "error": "not running and no workspace given"}
+                return self.start_testing_server(project_name, workspace)
+            self._terminate(info['pid'])
+            info['pid'] = None
+            return self.start_testing_server(project_name, workspace or info['workspace'])
+
+    def stop_all(self):
+        with self._lock:
+            for project_name in list(self.servers):
+                self.stop_testing_server(project_name, reason="shutdown")
+        self._stop_event.set()
+
+    def mark_used(self, project_name, when=None):
+        """Record activity so the server is not the first evicted"""
+        when = time.time() if when is None else when
+        with self._lock:
+            info = self.servers.get(project_name)
+            if info and when > info['last_used']:
+                info['last_used'] = when
+                self._save_registry()
+
+    @staticmethod
+    def _session_activity():
+        """{session: last activity epoch} from tmux"""
+        try:
+            result = subprocess.run(
+                ["tmux", "list-sessions", "-F", "#{session_name}\t#{session_activity}"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=10
+            )
+        except (OSError, subprocess.SubprocessError):
+            return {}
+        activity = {}
+        for line in result.stdout.splitlines():
+            name, _, stamp = line.partition('\t')
+            if stamp.isdigit():
+                activity[name] = int(stamp)
+        return activity
+
+    def refresh_activity(self):
+        """Mark servers used when their project's session has been active"""
+        activity = self._session_activity()
+        for project_name in list(self.servers):
+            if project_name in activity:
+                self.mark_used(project_name, activity[project_name])
+
+    def _terminate(self, pid, timeout=10):
+        if not pid:
+            return
+        try:
+            os.killpg(pid, signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            self._processes.pop(pid, None)
+            return
+        deadline = time.time() + timeout
+        while time.time() < deadline and self._alive(pid):
+            time.sleep(0.2)
+        if self._alive(pid):
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+        process = self._processes.pop(pid, None)
+        if process is not None:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+
+    # Memory budget
+
+    def _measure(self):
+        rss = process_group_rss()
+        for info in self.servers.values():
+            info['rss_bytes'] = rss.get(info['pid'], 0)
+        return sum(info['rss_bytes'] for info in self.servers.values())
+
+    def _make_room(self, project_name):
+        """Evict least recently used idle servers until a new one fits the budget"""
+        self.refresh_activity()
+        used = self._measure()
+        sizes = [info['rss_bytes'] for info in self.servers.values() if info['rss_bytes']]
+        needed = max(sizes) if sizes else self.default_server_bytes
+        idle_before = time.time() - self.idle_seconds
+        candidates = sorted((info['last_used'], name) for name, info in self.servers.items()
+                            if name != project_name and info['last_used'] <= idle_before)
+        while used + needed > self.memory_budget:
+            if not candidates:
+                return False
+            _, victim = candidates.pop(0)
+            used -= self.servers[victim]['rss_bytes']
+            self.stop_testing_server(victim, reason=f"evicted for {project_name}, memory budget")
         return True
 
+    # Health
+
+    def probe(self, port, timeout=3):
+        """True if anything answers HTTP on the port - error pages count as up"""
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=timeout):
+                return True
+        except urllib.error.HTTPError:
+            return True
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def check(self):
+        """Probe every server once; restart ones that died or stopped answering"""
+        self.refresh_activity()
+        with self._lock:
+            items = list(self.servers.items())
+        now = time.time()
+        for project_name, info in items:
+            if not self._alive(info['pid']):
+                self._recover(project_name, info, "process exited")
+                continue
+            healthy = self.probe(info['port'])
+            with self._lock:
+                if healthy:
+                    info.update(status='healthy', last_healthy=now, failed_probes=0, restarts=0)
+                elif info['status'] == 'starting':
+                    if now - info['started_at'] > self.startup_timeout:
+                        info['status'] = 'unhealthy'
+                        logger.warning(f"Testing server for {project_name} did not come up on port {info['port']}")
+                else:
+                    info['failed_probes'] += 1
+                    if info['failed_probes'] >= 3:
+                        self._recover(project_name, info, "stopped answering")
+        with self._lock:
+            self._measure()
+            self._save_registry()
+
+    def _recover(self, project_name, info, reason):
+        if info.get('restarts', 0) >= self.max_restarts:
+            logger.error(f"Testing server for {project_name} {reason}; giving up after {info['restarts']} restarts")
+            self.stop_testing_server(project_name, reason="failed")
+            return
+        logger.warning(f"Testing server for {project_name} {reason}; restarting")
+        with self._lock:
+            info['restarts'] = info.get('restarts', 0) + 1
+        self.restart_testing_server(project_name)
+
+    def _ensure_supervisor(self):
+        if self._supervisor is None or not self._supervisor.is_alive():
+            self._supervisor = threading.Thread(target=self._supervise, daemon=True, name="testing-supervisor")
+            self._supervisor.start()
+
+    def _supervise(self):
+        while not self._stop_event.wait(self.probe_interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Testing server check failed: {e}")
+            with self._lock:
+                if not self.servers:
+                    self._supervisor = None
+                    return
+
+    # Reporting
+
+    @staticmethod
+    def _result(info):
+        return {"success": True, "port": info['port'], "url": f"http://localhost:{info['port']}",
+                "pid": info['pid'], "status": info['status']}
+
+    def get_report(self):
+        with self._lock:
+            used = self._measure()
+            return {
+                'memory_budget_mb': self.memory_budget // (1024 * 1024),
+                'memory_used_mb': round(used / (1024 * 1024), 1),
+                'servers': {
+                    name: dict(info, url=f"http://localhost:{info['port']}",
+                               rss_mb=round(info['rss_bytes'] / (1024 * 1024), 1),
+                               started_at=datetime.fromtimestamp(info['started_at']).isoformat(timespec='seconds'),
+                               last_used=datetime.fromtimestamp(info['last_used']).isoformat(timespec='seconds'))
+                    for name, info in self.servers.items()
+                }
+            }
+
+_manager = None
+_manager_lock = threading.Lock()
+
 def create_testing_manager():
-    """Factory function to create a testing manager instance"""
-    try:
-        return TestingManager()
-    except Exception as e:
-        logger.warning(f"Could not create testing manager: {e}")
-        return None
\ No newline at end of file
+    """
+    Factory function - one shared manager per process
+    TESTING_PORT_START/END, TESTING_MEMORY_BUDGET_MB, TESTING_IDLE_MINUTES and
+    TESTING_SERVER_COMMAND configure it.
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            base = Path(__file__).parent
+            try:
+                _manager = TestingManager(
+                    base / "state",
+                    base / "logs" / "testing",
+                    port_start=int(os.environ.get('TESTING_PORT_START', 3100)),
+                    port_end=int(os.environ.get('TESTING_PORT_END', 3199)),
+                    memory_budget_mb=int(os.environ.get('TESTING_MEMORY_BUDGET_MB', 4096)),
+                    idle_minutes=float(os.environ.get('TESTING_IDLE_MINUTES', 10))
+                )
+            except Exception as e:
+                logger.warning(f"Could not create testing manager: {e}")
+                return None
+        return _manager
@@ -12,17 +12,20 @@ import logging
 import subprocess
 import hashlib
 import uuid
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from pathlib import Path
 from datetime import datetime, timedelta
 import threading
 import time
+import random
 
 # Add scripts directory to path
 sys.path.append(str(Path(__file__).parent.parent / "scripts"))
 try:
-    from select_template_enhanced import select_template
+    from select_template_enhanced import select_template, select_templates_batch, load_processed_requirements
 except ImportError:
+    select_templates_batch = None
+    load_processed_requirements = None
     try:
         from select_template import select_template
     except ImportError:
@@ -39,7 +42,12 @@ except ImportError:
 # Add current directory to path for local modules
 sys.path.append(str(Path(__file__).parent))
 from webhook_adapter import transform_webhook_payload
-from phase_scheduler import create_phase_scheduler
+from phase_scheduler import configured_phase_mode, create_phase_scheduler
+from testing_manager import create_testing_manager
+from adaptive_phases import load_adaptive_reports
+from status_stream import create_status_broadcaster
+from stall_detector import create_stall_detector
+from message_dispatcher import create_message_dispatcher, summarize_dispatch_metrics
 
 # Configure logging
 log_dir = Path(__file__).parent / "logs"
@@ -69,6 +77,16 @@ REQUEST_STATE_FILE = STATE_DIR / "processed_requests.json"
 PROJECT_COOLDOWN_FILE = STATE_DIR / "project_cooldowns.json"
 COOLDOWN_MINUTES = 5  # Reject webhooks for projects created in last 5 minutes
 
+# Live status shared by all /events viewers - collects only while someone is connected
+status_broadcaster = create_status_broadcaster(STATE_DIR)
+logging.getLogger().addHandler(status_broadcaster.error_handler())
+
+# Single rate-limited path for messages to Claude sessions (DISPATCH_RATE_PER_MINUTE, DISPATCH_BURST)
+message_dispatcher = create_message_dispatcher(STATE_DIR)
+
+# Idle session detection (STALL_MINUTES, STALL_NUDGE=1 to send nudges)
+stall_detector = create_stall_detector(STATE_DIR, dispatcher=message_dispatcher)
+
 class WebhookStateManager:
     """Manages webhook request state and deduplication"""
     
@@ -233,17 +251,13 @@ PROJECT DETAILS:
 
 Please start by reading PROGRESS_TRACKER.md and then coordinate the development workflow."""
 
-        # Call the send-claude-message script
-        script_path = "/home/wv3/.claude/orchestrator/send-claude-message.sh"
+        # Send through the dispatcher - no jitter, the session is waiting for it
+        logger.info(f"Sending PM initialization message to Claude via: {message_dispatcher.send_script}")
+        result = message_dispatcher.dispatch(f"{project_name}:0", pm_message, source='pm-init', jitter=False)
         
-        cmd = [script_path, f"{project_name}:0", pm_message]
-        
-        logger.info(f"Sending PM initialization message to Claude via: {script_path}")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
+        if result['success']:
             logger.info(f"Successfully initialized orchestrator for {project_name}")
-            logger.debug(f"Claude response: {result.stdout}")
+            logger.debug(f"Claude response: {result['stdout']}")
             
             # Now send the starter prompt as a separate message
             starter_prompt = session_params.get('starter_prompt')
@@ -254,10 +268,10 @@ Please start by reading PROGRESS_TRACKER.md and then coordinate the development
                 time.sleep(3)
                 
                 # Send starter prompt
-                starter_cmd = [script_path, f"{project_name}:0", starter_prompt]
-                starter_result = subprocess.run(starter_cmd, capture_output=True, text=True, timeout=30)
+                starter_result = message_dispatcher.dispatch(f"{project_name}:0", starter_prompt,
+                                                             source='starter-prompt', jitter=False)
                 
-                if starter_result.returncode == 0:
+                if starter_result['success']:
                     logger.info(f"Successfully sent starter prompt for {project_name}")
                     
                     # Schedule all development phases after successful initialization
@@ -271,12 +285,10 @@ Please start by reading PROGRESS_TRACKER.md and then coordinate the development
                         logger.error(f"Failed to schedule phases for {project_name}")
                         
                 else:
-                    logger.error(f"Failed to send starter prompt for {project_name}: {starter_result.stderr}")
+                    logger.error(f"Failed to send starter prompt for {project_name}: {starter_result['stderr']}")
         else:
-            logger.error(f"Failed to initialize orchestrator for {project_name}: {result.stderr}")
+            logger.error(f"Failed to initialize orchestrator for {project_name}: {result['stderr']}")
             
-    except subprocess.TimeoutExpired:
-        logger.error(f"Timeout while initializing orchestrator for {project_name}")
     except Exception as e:
         logger.error(f"Error initializing orchestrator for {project_name}: {e}")
 
@@ -311,6 +323,7 @@ def create_tmux_session(project_data):
             "github_repo": github_repo,
             "progress_tracker": project_data.get('progress_tracker_content', ''),
             "starter_prompt": project_data.get('starter_prompt', ''),
+            "requirements_chars": len(project_data.get('requirements_summary') or ''),
             "timestamp": datetime.now().isoformat(),
             "request_id": project_data.get('request_id', 'unknown')
         }
@@ -413,6 +426,21 @@ def status(project_name):
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/events', methods=['GET'])
+def events():
+    """
+    Server-Sent Events stream of pipeline status
+    Sends a 'snapshot' event with the full state, then 'sessions', 'phases'
+    and 'queue' deltas ({added, changed, removed}) and 'error' events.
+    All viewers share a single collector.
+    """
+    logger.info(f"Status stream client connected ({status_broadcaster.subscriber_count + 1} watching)")
+    return Response(
+        stream_with_context(status_broadcaster.stream()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/test', methods=['POST'])
 def test_endpoint():
     """Test endpoint for manual testing"""
@@ -461,6 +489,111 @@ def admin_state():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/admin/select-batch', methods=['POST'])
+def admin_select_batch():
+    """
+    Admin endpoint to re-run template selection for many requirement texts
+    Loads the template catalog once and streams one JSON object per line.
+    Expected payload:
+    {
+        "items": [{"id": "proj-1", "requirements": "...", "template_hint": null}],
+        "source": "processed",  # optional - score every archived processed/ project instead
+        "seed": 42               # optional - reproducible tie-breaking
+    }
+    """
+    try:
+        data = request.json or {}
+        
+        if data.get('source') == 'processed':
+            if load_processed_requirements is None:
+                return jsonify({"error": "Batch selection not available"}), 501
+            items = load_processed_requirements(Path(__file__).parent.parent / "processed")
+        else:
+            items = data.get('items')
+            if not isinstance(items, list):
+                return jsonify({"error": "Expected 'items' list or 'source': 'processed'"}), 400
+            # Reject bad items now - once streaming starts the 200 is already sent
+            invalid = [i for i, item in enumerate(items) if not isinstance(item, dict)]
+            if invalid:
+                return jsonify({"error": "Every item must be an object", "invalid_items": invalid[:20]}), 400
+        
+        rng = random.Random(data['seed']) if data.get('seed') is not None else None
+        
+        if select_templates_batch is not None:
+            results = select_templates_batch(items, rng=rng)
+        else:
+            results = (
+                dict(select_template(item.get('requirements', ''), item.get('template_hint')), id=item.get('id'))
+                for item in items
+            )
+        
+        def generate():
+            for result in results:
+                yield json.dumps(result) + "\n"
+        
+        logger.info("Streaming batch template selection")
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/admin/phases', methods=['GET'])
+def admin_phases():
+    """Admin endpoint to view adaptive phase progress and time saved per project"""
+    try:
+        reports = load_adaptive_reports(STATE_DIR)
+        return jsonify({
+            "mode": configured_phase_mode(),
+            "projects": reports,
+            "total_time_saved_minutes": round(sum(r.get('time_saved_minutes', 0) for r in reports.values()), 1)
+        })
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/admin/stalls', methods=['GET'])
+def admin_stalls():
+    """Admin endpoint to view stalled sessions and stall statistics"""
+    try:
+        return jsonify(stall_detector.get_report())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/admin/dispatch', methods=['GET'])
+def admin_dispatch():
+    """Admin endpoint to view message dispatch delays and failures"""
+    try:
+        stats = summarize_dispatch_metrics(message_dispatcher.metrics_file)
+        stats['rate_per_minute'] = message_dispatcher.rate_per_second * 60
+        stats['burst'] = message_dispatcher.burst
+        return jsonify(stats)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/admin/testing', methods=['GET'])
+def admin_testing():
+    """Admin endpoint to view testing servers, ports and memory use"""
+    try:
+        manager = create_testing_manager()
+        if manager is None:
+            return jsonify({"error": "testing manager unavailable"}), 503
+        return jsonify(manager.get_report())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/admin/testing/<project_name>/<action>', methods=['POST'])
+def admin_testing_action(project_name, action):
+    """Admin endpoint to start, restart or stop a project's testing server"""
+    if action not in ('start', 'restart', 'stop'):
+        return jsonify({"error": f"unknown action: {action}"}), 400
+    try:
+        result = create_phase_scheduler().run_server_action(project_name, action)
+        if result is None:
+            return jsonify({"error": "testing manager unavailable"}), 503
+        if isinstance(result, bool):
+            result = {"success": result}
+        return jsonify(result), 200 if result.get('success') else 409
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 def handle_webhook_request(data):
     """Handle webhook request with enhanced deduplication and state management"""
     try:
@@ -543,11 +676,30 @@ if __name__ == '__main__':
     logger.info(f"Webhook URL: http://{HOST}:{PORT}/webhook")
     logger.info(f"Health check: http://{HOST}:{PORT}/health")
     logger.info(f"Test endpoint: http://{HOST}:{PORT}/test")
-    logger.info(f"Admin endpoints: /admin/cleanup, /admin/state")
+    logger.info(f"Live status stream: http://{HOST}:{PORT}/events")
+    logger.info(f"Admin endpoints: /admin/cleanup, /admin/state, /admin/select-batch, /admin/phases, /admin/stalls, /admin/dispatch, /admin/testing")
     logger.info(f"Request deduplication: ENABLED")
     logger.info(f"Project cooldown: {COOLDOWN_MINUTES} minutes")
+    logger.info(f"Stall detection: {stall_detector.stall_seconds // 60:.0f} minutes, nudges {'ENABLED' if stall_detector.nudge else 'disabled'}")
+    logger.info(f"Message dispatch: {message_dispatcher.rate_per_second * 60:g}/min, burst {message_dispatcher.burst}")
     
     # Cleanup old entries on startup
     state_manager.cleanup_old_entries()
     
-    app.run(host=HOST, port=PORT, debug=False)
\ No newline at end of file
+    # Pick up adaptive phase tracking for projects that were mid-flight
+    phase_scheduler = create_phase_scheduler()
+    logger.info(f"Phase mode: {phase_scheduler.mode}")
+    if phase_scheduler.mode == 'adaptive':
+        resumed = phase_scheduler.resume_adaptive()
+        if resumed:
+            logger.info(f"Resumed adaptive phases for: {', '.join(resumed)}")
+
+    # Adopt testing servers that are still running and supervise them, then
+    # run testing server actions that fell due while the server was down
+    create_testing_manager()
+    phase_scheduler.start_server_actions()
+
+    # Check for idle sessions once a minute
+    stall_detector.start(interval=60)
+    
+    app.run(host=HOST, port=PORT, debug=False, threaded=True)
\ No newline at end of file